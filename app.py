@@ -1,8 +1,10 @@
 import logging
 import asyncio
 import copy
+import functools
 import sys
 from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, fields
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
@@ -10,7 +12,8 @@ from pydantic import BaseModel
 from langchain_openai import ChatOpenAI
 from langchain_core.prompts import PromptTemplate
 from langchain_core.output_parsers import JsonOutputParser
-from typing import Dict, List, Any, Optional, Set, Tuple
+from typing import Dict, List, Any, Optional, Set, Tuple, Final
+from types import MappingProxyType
 import os
 import json
 import re
@@ -19,6 +22,7 @@ import datetime
 from dotenv import load_dotenv
 import aiohttp
 import math
+import orjson
 from openai import OpenAI
 
 # 스케줄러 모듈 임포트
@@ -78,6 +82,19 @@ GOOGLE_MAPS_API_KEY = os.getenv("GOOGLE_MAPS_API_KEY")
 KAKAO_REST_API_KEY = os.getenv("KAKAO_REST_API_KEY", "357d3401893dc5c9cbefc83bb65df4ee")
 FOURSQUARE_API_KEY = os.getenv("FOURSQUARE_API_KEY", "fsq3VpVQLn5hZptfpIHLogZHRb7vAbteiSkiUlZT4QvpC8U=")
 
+# Kakao/Google/Foursquare를 동시에 호출할지 여부 (지연은 줄지만 API 호출량은 늘어남)
+CONCURRENT_PROVIDER_SEARCH = os.getenv("CONCURRENT_PROVIDER_SEARCH", "false").lower() in ("1", "true", "yes")
+
+# 후보별 채점 로그 출력 여부 (끄면 검색 루프에서 로그 문자열을 만들지 않음)
+DEBUG_SEARCH = os.getenv("DEBUG_SEARCH") == "1"
+
+# smart_location_search 조기 종료 점수 (이 점수 이상인 결과가 나오면 남은 검색어는 취소)
+SMART_SEARCH_SHORT_CIRCUIT_SCORE = float(os.getenv("SMART_SEARCH_SHORT_CIRCUIT_SCORE", "16"))
+
+# 외부 API 요청 헤더 (키는 프로세스 동안 바뀌지 않으므로 한 번만 생성)
+_KAKAO_HEADERS: Final = {"Authorization": f"KakaoAK {KAKAO_REST_API_KEY}"}
+_FSQ_HEADERS: Final = {"Authorization": FOURSQUARE_API_KEY, "Accept": "application/json"}
+
 if not OPENAI_API_KEY:
     logger.error("❌ OPENAI_API_KEY가 설정되지 않았습니다!")
     raise ValueError("OPENAI_API_KEY를 환경변수에 설정해주세요.")
@@ -85,8 +102,41 @@ if not OPENAI_API_KEY:
 # OpenAI 클라이언트
 openai_client = OpenAI(api_key=OPENAI_API_KEY)
 
-# FastAPI 앱 초기화
-app = FastAPI(title="3중 API 정확한 주소 검색 일정 추출 API", version="3.0.0")
+# 일정 추출 체인용 LangChain LLM (HTTP 클라이언트를 요청·프롬프트 재생성 간에 공유)
+_LLM: Final = ChatOpenAI(
+    openai_api_key=OPENAI_API_KEY,
+    model_name="gpt-4o",
+    temperature=0,
+    max_tokens=1500
+)
+
+# 외부 API(Foursquare/Kakao/Google) 호출용 공유 HTTP 세션
+_http_session: Optional[aiohttp.ClientSession] = None
+
+def get_http_session() -> aiohttp.ClientSession:
+    """공유 aiohttp 세션 반환 (keep-alive로 TCP/TLS 연결을 요청 간에 재사용)"""
+    global _http_session
+    if _http_session is None or _http_session.closed:
+        _http_session = aiohttp.ClientSession(
+            # 호스트당 동시 연결 수를 제한해 병렬 검색어 요청이 keep-alive 연결을 나눠 쓰도록 함
+            connector=aiohttp.TCPConnector(limit=100, limit_per_host=20, ttl_dns_cache=300, keepalive_timeout=75),
+            timeout=aiohttp.ClientTimeout(total=10)
+        )
+    return _http_session
+
+class UnicodeJSONResponse(JSONResponse):
+    media_type = "application/json"
+
+    def render(self, content) -> bytes:
+        # 👈 orjson은 한글을 UTF-8 그대로, 공백 없이 직렬화 (json.dumps 대비 수 배 빠름)
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+
+# FastAPI 앱 초기화 (모든 엔드포인트 기본 응답을 orjson 기반으로)
+app = FastAPI(
+    title="3중 API 정확한 주소 검색 일정 추출 API",
+    version="3.0.0",
+    default_response_class=UnicodeJSONResponse
+)
 
 # CORS 미들웨어 설정
 app.add_middleware(
@@ -97,6 +147,45 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# 외부 API 동시 요청 수 제한 (프로세스 전체 공유 - 제공자별 rate limit 보호)
+_KAKAO_SEMAPHORE = asyncio.Semaphore(10)
+_GOOGLE_SEMAPHORE = asyncio.Semaphore(10)
+# smart_location_search에서 동시에 처리할 검색어 수
+_SMART_SEARCH_SEMAPHORE = asyncio.Semaphore(8)
+
+async def first_in_priority(coros, semaphore: Optional[asyncio.Semaphore] = None):
+    """코루틴들을 동시에 실행하고, 주어진 순서상 가장 앞선 결과(참인 값)를 반환
+
+    앞 순위 결과가 확정되면 남은 작업은 취소한다. 모두 실패하면 None.
+    """
+    async def run(coro):
+        if semaphore is None:
+            return await coro
+        async with semaphore:
+            return await coro
+
+    tasks = [asyncio.create_task(run(coro)) for coro in coros]
+    try:
+        for task in tasks:
+            result = await task
+            if result:
+                return result
+        return None
+    finally:
+        for task in tasks:
+            task.cancel()
+
+@app.on_event("startup")
+async def open_http_session():
+    """앱 시작 시 공유 HTTP 세션을 미리 생성 (첫 요청에서 생성 비용이 들지 않도록)"""
+    get_http_session()
+
+@app.on_event("shutdown")
+async def close_http_session():
+    """앱 종료 시 공유 HTTP 세션 정리"""
+    if _http_session is not None and not _http_session.closed:
+        await _http_session.close()
+
 # 한국 지역 정보
 KOREA_REGIONS = {
     "서울특별시": {"강남구", "강동구", "강북구", "강서구", "관악구", "광진구", "구로구", "금천구",
@@ -131,10 +220,41 @@ KOREA_REGIONS = {
              "의령군", "진주시", "창녕군", "창원시", "통영시", "하동군", "함안군", "함양군", "합천군"},
     "제주특별자치도": {"서귀포시", "제주시"}
 }
+
+# 전국 구/시/군 (모듈 로드 시 한 번만 평탄화)
+_ALL_DISTRICTS = frozenset().union(*KOREA_REGIONS.values())
+
+# GPT 프롬프트에 넣을 지역 정보 JSON (정렬해서 프로세스마다 같은 문자열 유지)
+KOREA_REGIONS_JSON: Final[str] = json.dumps(
+    {region: sorted(districts) for region, districts in KOREA_REGIONS.items()},
+    ensure_ascii=False, indent=2
+)
+
+# 시/도 접미사 (예: 부산광역시 → 부산, 경상남도 → 경상남)
+_REGION_SUFFIXES = ('특별시', '광역시', '특별자치시', '특별자치도', '도')
+
+@functools.lru_cache(maxsize=512)
+def shorten_region(region_name: str, suffixes: Tuple[str, ...] = _REGION_SUFFIXES) -> str:
+    """시/도 이름에서 접미사를 순서대로 제거 (같은 입력은 캐시)"""
+    for suffix in suffixes:
+        region_name = region_name.replace(suffix, '')
+    return region_name
+
+# 시/도 → 축약명 (모듈 로드 시 한 번만 계산)
+REGION_SHORT_MAP: Final = MappingProxyType({region: shorten_region(region) for region in KOREA_REGIONS})
+# 부분 축약용 접미사 묶음 (기존 .replace 체인과 같은 순서)
+_METRO_SUFFIXES = ('특별시', '광역시')           # 예: 부산광역시 → 부산, 경상남도는 그대로
+_PROVINCE_SUFFIXES = ('특별시', '광역시', '도')  # 예: 경기도 → 경기
+
+# "A에서 B까지" 경로 표현
+_ROUTE_RE: Final = re.compile(r'(.+?)에서\s*(.+?)까지')
+# 주소 속 동 이름 (예: 중앙동)
+_DONG_RE: Final = re.compile(r'(\w+동)')
+
+_CLEAN_KR_RE = re.compile(r'[^\w\s가-힣ㄱ-ㅎㅏ-ㅣ.,()-]')
+
 def clean_korean_text(text: str) -> str:
-    import re
-    cleaned = re.sub(r'[^\w\s가-힣ㄱ-ㅎㅏ-ㅣ.,()-]', '', text)
-    return cleaned.strip()
+    return _CLEAN_KR_RE.sub('', text).strip()
 # ----- 모델 정의 -----
 class ScheduleRequest(BaseModel):
     voice_input: str
@@ -155,12 +275,12 @@ async def new_extract_schedule(request: ScheduleRequest):
     
     try:
         print("🔥 Step 1: LLM 체인 생성 시작")
-        chain = create_schedule_chain()
+        chain = create_schedule_chain(request.voice_input)
         print("🔥 Step 1: LLM 체인 생성 완료")
         
         print("🔥 Step 2: LLM 호출 시작")
         result = await asyncio.wait_for(
-            run_in_executor(lambda: chain.invoke({"input": request.voice_input})),
+            chain.ainvoke({"input": request.voice_input}),
             timeout=20
         )
         print(f"🔥 Step 2: LLM 응답 수신, 타입: {type(result)}")
@@ -211,6 +331,438 @@ async def new_extract_schedule(request: ScheduleRequest):
         
         print("🔥 오류 응답 반환")
         return UnicodeJSONResponse(content=error_result, status_code=200)
+
+
+class KeywordMatcher:
+    """여러 키워드를 하나의 정규식으로 묶어 한 번의 스캔으로 찾는 매처
+
+    그룹(라벨) → 키워드 목록을 받으며, 등록 순서가 곧 우선순위다.
+    같은 키워드가 여러 그룹에 있으면 먼저 등록된 그룹으로 매칭된다.
+    """
+
+    def __init__(self, groups: Dict[str, Any]):
+        self._rank: Dict[str, int] = {}
+        self._label: Dict[str, str] = {}
+        for label, keywords in groups.items():
+            for keyword in keywords:
+                if keyword and keyword not in self._rank:
+                    self._rank[keyword] = len(self._rank)
+                    self._label[keyword] = label
+
+        alternation = "|".join(map(re.escape, self._rank))
+        # 전방탐색으로 모든 시작 위치를 검사 → 위치마다 가장 우선순위 높은 키워드가 잡힘
+        self._scan_re = re.compile(f"(?=({alternation}))")
+        self._search_re = re.compile(alternation)
+
+    @classmethod
+    def from_keywords(cls, keywords) -> "KeywordMatcher":
+        """라벨 없이 키워드 목록만으로 매처 생성 (라벨 = 키워드)"""
+        return cls({keyword: (keyword,) for keyword in keywords})
+
+    def contains_any(self, text: str) -> bool:
+        """키워드가 하나라도 포함되어 있는지"""
+        return self._search_re.search(text) is not None
+
+    def first_keyword(self, text: str) -> Optional[str]:
+        """포함된 키워드 중 우선순위가 가장 높은 키워드"""
+        found = {m.group(1) for m in self._scan_re.finditer(text)}
+        if not found:
+            return None
+        return min(found, key=self._rank.__getitem__)
+
+    def first_label(self, text: str) -> Optional[str]:
+        """포함된 키워드 중 우선순위가 가장 높은 키워드의 라벨"""
+        keyword = self.first_keyword(text)
+        return self._label[keyword] if keyword else None
+
+    def matched_labels(self, text: str) -> Set[str]:
+        """포함된 키워드들의 라벨 전체 (같은 위치에서 시작하는 키워드는 우선순위 높은 것만 잡힘)"""
+        return {self._label[m.group(1)] for m in self._scan_re.finditer(text)}
+
+    def first_labels(self, texts: List[str]) -> List[Optional[str]]:
+        """문장별 first_label을 한 번의 스캔으로 계산 (줄바꿈으로 이어 붙임 - 키워드에 줄바꿈이 없으므로 문장 경계를 넘는 매칭 없음)"""
+        best: List[Optional[str]] = [None] * len(texts)
+        if not texts:
+            return best
+        
+        index, end = 0, len(texts[0])  # 현재 문장 번호와 그 문장의 끝 위치
+        for m in self._scan_re.finditer("\n".join(texts)):
+            while m.start() > end:
+                index += 1
+                end += len(texts[index]) + 1
+            keyword = m.group(1)
+            if best[index] is None or self._rank[keyword] < self._rank[best[index]]:
+                best[index] = keyword
+        return [self._label[keyword] if keyword else None for keyword in best]
+
+# 브랜드 키워드 (모듈 로드 시 한 번만 생성, 공유 상수이므로 튜플로 고정)
+_BRAND_KEYWORDS = {
+    # ☕ 커피 전문점 (경쟁 브랜드들)
+    "스타벅스": ("스타벅스", "starbucks"),
+    "커피빈": ("커피빈", "coffee bean", "coffeebean"),
+    "할리스": ("할리스", "hollys", "할리스커피"),
+    "투썸플레이스": ("투썸플레이스", "twosome", "투썸"),
+    "이디야": ("이디야", "ediya", "이디야커피"),
+    "폴바셋": ("폴바셋", "paul bassett"),
+    "탐앤탐스": ("탐앤탐스", "tom n toms"),
+    "엔젤리너스": ("엔젤리너스", "angelinus"),
+    "메가커피": ("메가커피", "mega coffee", "메가mgc커피"),
+    "컴포즈커피": ("컴포즈", "compose coffee"),
+    "식사": ("식사", "저녁", "점심", "아침", "밥", "맛집", "식당"),
+    # 🍰 카페 & 디저트
+    "카페": ("카페", "cafe", "커피", "coffee"),
+    "베이커리": ("베이커리", "bakery", "빵집", "파리바게뜨", "뚜레쥬르"),
+    "디저트": ("디저트", "dessert", "케이크", "마카롱", "아이스크림"),
+
+    # 🍔 패스트푸드
+    "맥도날드": ("맥도날드", "mcdonald", "맥딜"),
+    "버거킹": ("버거킹", "burger king"),
+    "롯데리아": ("롯데리아", "lotteria"),
+    "kfc": ("kfc", "치킨"),
+    "서브웨이": ("서브웨이", "subway"),
+
+    # 🍕 피자
+    "도미노피자": ("도미노", "domino", "도미노피자"),
+    "피자헛": ("피자헛", "pizza hut"),
+    "미스터피자": ("미스터피자", "mr pizza"),
+    "파파존스": ("파파존스", "papa johns"),
+
+    # 🍗 치킨
+    "bbq": ("bbq", "비비큐"),
+    "굽네치킨": ("굽네", "굽네치킨"),
+    "네네치킨": ("네네", "네네치킨"),
+    "교촌치킨": ("교촌", "교촌치킨"),
+    "bhc": ("bhc", "비에이치씨"),
+    "처갓집": ("처갓집", "처갓집양념치킨"),
+
+    # 🏪 편의점
+    "편의점": ("편의점", "세븐일레븐", "cu", "gs25", "이마트24", "미니스톱"),
+    "세븐일레븐": ("세븐일레븐", "7eleven", "711"),
+    "cu": ("cu", "씨유"),
+    "gs25": ("gs25", "지에스25"),
+    "이마트24": ("이마트24", "emart24"),
+
+    # 🍜 한식
+    "한식": ("한식", "한정식", "백반", "찌개", "국밥", "korean food"),
+    "김밥": ("김밥천국", "김밥", "분식"),
+    "곱창": ("곱창", "막창", "대창", "양"),
+    "삼겹살": ("삼겹살", "고기집", "구이"),
+    "치킨갈비": ("닭갈비", "치킨갈비", "춘천닭갈비"),
+
+    # 🍝 양식
+    "파스타": ("파스타", "이탈리안", "스파게티"),
+    "스테이크": ("스테이크", "아웃백", "outback"),
+    "양식": ("양식", "이탈리안", "western food"),
+
+    # 🍜 일식
+    "초밥": ("초밥", "스시", "sushi"),
+    "라멘": ("라멘", "ramen", "돈코츠"),
+    "돈카츠": ("돈카츠", "카츠", "tonkatsu"),
+    "일식": ("일식", "japanese food"),
+
+    # 🥟 중식
+    "중식": ("중식", "중국집", "짜장면", "짬뽕", "탕수육"),
+    "딤섬": ("딤섬", "만두"),
+
+    # 🌮 기타 세계음식
+    "멕시칸": ("멕시칸", "타코", "부리또"),
+    "태국음식": ("태국", "쌀국수", "팟타이"),
+    "인도음식": ("인도", "커리", "난"),
+
+    # 🥘 분식/간식
+    "분식": ("분식", "떡볶이", "순대", "튀김", "어묵"),
+    "아이스크림": ("배스킨라빈스", "브라운", "하겐다즈"),
+
+    # 🏨 숙박
+    "호텔": ("호텔", "hotel", "리조트", "펜션"),
+    "모텔": ("모텔", "motel"),
+
+    # 🏥 생활시설
+    "병원": ("병원", "의원", "clinic", "hospital"),
+    "약국": ("약국", "pharmacy"),
+    "은행": ("은행", "bank", "atm"),
+    "마트": ("마트", "이마트", "홈플러스", "롯데마트"),
+
+    # 🎮 오락시설
+    "노래방": ("노래방", "karaoke", "코인노래방"),
+    "pc방": ("pc방", "피씨방", "게임방"),
+    "찜질방": ("찜질방", "사우나", "목욕탕"),
+    "볼링장": ("볼링", "볼링장"),
+    "당구장": ("당구", "당구장", "포켓볼"),
+
+    # 🚗 교통/서비스
+    "주유소": ("주유소", "gas station", "sk", "gs칼텍스", "현대오일뱅크"),
+    "세차장": ("세차", "세차장"),
+    "미용실": ("미용실", "헤어샵", "미용원"),
+    "네일샵": ("네일", "네일샵", "nail"),
+
+    # 🏃 운동/건강
+    "헬스장": ("헬스", "헬스장", "피트니스", "gym"),
+    "요가": ("요가", "필라테스", "yoga"),
+    "골프": ("골프", "골프장", "골프연습장"),
+
+    # 🎯 대형 브랜드 (구체적으로)
+    "이마트": ("이마트", "emart"),
+    "홈플러스": ("홈플러스", "homeplus"),
+    "코스트코": ("코스트코", "costco"),
+    "현대백화점": ("현대백화점", "현대"),
+    "롯데백화점": ("롯데백화점", "롯데"),
+    "신세계": ("신세계백화점", "신세계"),
+}
+
+# 모든 브랜드 키워드를 한 번의 스캔으로 찾는 매처 (딕셔너리 순서 = 매칭 우선순위)
+_BRAND_MATCHER = KeywordMatcher(_BRAND_KEYWORDS)
+
+# 지점 이름과 무관하게 위치만으로 옵션을 구분할 브랜드
+_BRAND_MARKERS = ("스타벅스",)
+
+# 브랜드 → Kakao 카테고리 그룹 코드 (검색 결과를 해당 업종으로 한정해 응답 크기 축소)
+_BRAND_CATEGORY_CODES = {
+    **dict.fromkeys(["스타벅스", "커피빈", "할리스", "투썸플레이스", "이디야", "폴바셋", "탐앤탐스",
+                     "엔젤리너스", "메가커피", "컴포즈커피", "카페"], "CE7"),
+    **dict.fromkeys(["식사", "맥도날드", "버거킹", "롯데리아", "kfc", "서브웨이",
+                     "도미노피자", "피자헛", "미스터피자", "파파존스",
+                     "bbq", "굽네치킨", "네네치킨", "교촌치킨", "bhc", "처갓집",
+                     "한식", "김밥", "곱창", "삼겹살", "치킨갈비", "파스타", "스테이크", "양식",
+                     "초밥", "라멘", "돈카츠", "일식", "중식", "딤섬",
+                     "멕시칸", "태국음식", "인도음식", "분식"], "FD6"),
+    **dict.fromkeys(["편의점", "세븐일레븐", "cu", "gs25", "이마트24"], "CS2"),
+    **dict.fromkeys(["마트", "이마트", "홈플러스", "코스트코"], "MT1"),
+    **dict.fromkeys(["호텔", "모텔"], "AD5"),
+    "병원": "HP8",
+    "약국": "PM9",
+    "은행": "BK9",
+    "주유소": "OL7",
+}
+
+_EARTH_DIAMETER_KM = 2 * 6371.0
+_DEG_TO_RAD = math.pi / 180
+_HALF_DEG_TO_RAD = math.pi / 360  # 도 → 라디안 변환과 반각(/2)을 한 번의 곱셈으로
+
+def haversine_km(lat1: float, lng1: float, lat2: float, lng2: float) -> float:
+    """두 좌표 사이의 대원 거리 (km)"""
+    sin_dlat = math.sin((lat2 - lat1) * _HALF_DEG_TO_RAD)
+    sin_dlng = math.sin((lng2 - lng1) * _HALF_DEG_TO_RAD)
+    a = sin_dlat * sin_dlat + math.cos(lat1 * _DEG_TO_RAD) * math.cos(lat2 * _DEG_TO_RAD) * sin_dlng * sin_dlng
+    return _EARTH_DIAMETER_KM * math.asin(math.sqrt(a))
+
+def calculate_route_efficiency_batch(start: Tuple, middles: List[Tuple], end: Tuple) -> List[float]:
+    """여러 경유 후보의 경로 효율성(직선 거리 / 경유 거리)을 한 번에 계산 (출발-도착 거리는 한 번만)
+
+    위경도 평면 거리는 위도에 따라 경도 1°의 길이가 달라 왜곡되므로 대원 거리(km)로 계산
+    """
+    (start_lat, start_lng), (end_lat, end_lng) = start, end
+    direct_distance = haversine_km(start_lat, start_lng, end_lat, end_lng)
+    
+    efficiencies = []
+    for mid_lat, mid_lng in middles:
+        route_distance = (haversine_km(start_lat, start_lng, mid_lat, mid_lng)
+                          + haversine_km(mid_lat, mid_lng, end_lat, end_lng))
+        efficiencies.append(direct_distance / route_distance if route_distance != 0 else 0)
+    return efficiencies
+
+class BrandBranchCache:
+    """브랜드별 지점 좌표 캐시
+
+    Kakao 키워드 검색(거리순)의 응답을 "조회 중심 + 빠짐없이 확인된 반경"과 함께 저장한다.
+    새 검색 원이 이미 확인된 원 안에 완전히 들어가면 HTTP 호출 없이 메모리에서 답한다.
+    """
+
+    def __init__(self, ttl: float = 6 * 3600, max_brands: int = 256, max_areas: int = 64):
+        self.ttl = ttl
+        self.max_brands = max_brands
+        self.max_areas = max_areas
+        self._entries: Dict[str, Dict[str, Any]] = {}
+
+    def _get_entry(self, brand_name: str) -> Optional[Dict[str, Any]]:
+        entry = self._entries.get(brand_name)
+        if entry and time.monotonic() - entry["created_at"] > self.ttl:
+            del self._entries[brand_name]
+            return None
+        return entry
+
+    def lookup(self, brand_name: str, coord: Tuple, radius: int, size: int) -> Optional[List[Dict]]:
+        """확인된 영역으로 완전히 답할 수 있으면 거리순 후보 목록, 아니면 None"""
+        entry = self._get_entry(brand_name)
+        if not entry:
+            return None
+
+        lat, lng = coord
+        radius_km = radius / 1000
+        nearby = []
+        for branch in entry["branches"].values():
+            distance_km = haversine_km(lat, lng, branch["latitude"], branch["longitude"])
+            if distance_km <= radius_km:
+                nearby.append((distance_km, branch))
+        nearby.sort(key=lambda item: item[0])
+        nearby = nearby[:size]
+
+        # 결과가 꽉 찼다면 마지막 후보까지만, 아니면 반경 전체가 확인되어 있어야 함
+        needed_km = nearby[-1][0] if len(nearby) == size else radius_km
+        if not any(haversine_km(lat, lng, a_lat, a_lng) + needed_km <= covered_km
+                   for a_lat, a_lng, covered_km in entry["areas"]):
+            return None
+
+        return [{**branch, "distance": str(round(distance_km * 1000))} for distance_km, branch in nearby]
+
+    def store(self, brand_name: str, coord: Tuple, radius: int, size: int, candidates: List[Dict]):
+        """Kakao 응답 저장 (size개를 꽉 채웠으면 마지막 후보 거리까지만 확인된 것으로 봄)"""
+        entry = self._get_entry(brand_name)
+        if entry is None:
+            if len(self._entries) >= self.max_brands:
+                self._entries.pop(next(iter(self._entries)))
+            entry = {"created_at": time.monotonic(), "branches": {}, "areas": []}
+            self._entries[brand_name] = entry
+
+        lat, lng = coord
+        covered_km = radius / 1000
+        if len(candidates) >= size:
+            covered_km = max(
+                haversine_km(lat, lng, c["latitude"], c["longitude"]) for c in candidates
+            )
+
+        for candidate in candidates:
+            key = (candidate["name"], candidate["address"])
+            entry["branches"][key] = {k: v for k, v in candidate.items() if k != "distance"}
+
+        entry["areas"].append((lat, lng, covered_km))
+        if len(entry["areas"]) > self.max_areas:
+            entry["areas"].pop(0)
+
+# 프로세스 전역 브랜드 지점 캐시 (요청 간 공유)
+_BRAND_BRANCH_CACHE = BrandBranchCache()
+
+_MISSING = object()
+
+class AsyncTTLCache:
+    """비동기 조회 결과용 TTL + LRU 캐시
+
+    같은 키로 동시에 들어온 조회는 키별 asyncio.Lock으로 묶어 factory를 한 번만 실행한다.
+    None 결과도 저장하여 실패한 조회를 반복하지 않는다 (none_ttl로 더 짧게 둘 수 있음).
+    """
+
+    def __init__(self, ttl: float, maxsize: int = 1024, none_ttl: Optional[float] = None):
+        self.ttl = ttl
+        self.none_ttl = ttl if none_ttl is None else none_ttl
+        self.maxsize = maxsize
+        self._entries: Dict[Any, Tuple[float, Any]] = {}  # 키 → (만료 시각, 값)
+        self._locks: Dict[Any, asyncio.Lock] = {}
+        self._lock_users: Dict[Any, int] = {}  # 키 → 락을 잡았거나 기다리는 요청 수
+
+    def get(self, key, default=None):
+        entry = self._entries.get(key)
+        if entry is None:
+            return default
+        if time.monotonic() > entry[0]:
+            del self._entries[key]
+            return default
+        self._entries[key] = self._entries.pop(key)  # 최근 사용으로 이동
+        return entry[1]
+
+    def set(self, key, value):
+        if key not in self._entries and len(self._entries) >= self.maxsize:
+            self._entries.pop(next(iter(self._entries)))  # 가장 오래 안 쓴 항목 제거
+        ttl = self.none_ttl if value is None else self.ttl
+        self._entries[key] = (time.monotonic() + ttl, value)
+
+    def items(self) -> List[Tuple[Any, Any]]:
+        """만료되지 않은 (키, 값) 목록 (영속화용)"""
+        now = time.monotonic()
+        return [(key, value) for key, (expires_at, value) in self._entries.items() if expires_at >= now]
+
+    async def get_or_set(self, key, factory, cache_if=None):
+        """캐시에 있으면 바로 반환, 없으면 await factory() 결과를 저장 후 반환
+
+        cache_if가 주어지면 cache_if(결과)가 참일 때만 저장한다.
+        """
+        value = self.get(key, _MISSING)
+        if value is not _MISSING:
+            return value
+
+        # 락은 기다리는 요청이 모두 끝날 때까지 유지 (도중에 지우면 새 요청이 다른 락으로 factory를 또 실행)
+        lock = self._locks.setdefault(key, asyncio.Lock())
+        self._lock_users[key] = self._lock_users.get(key, 0) + 1
+        try:
+            async with lock:
+                # 먼저 들어간 요청이 채웠으면 그대로 사용
+                value = self.get(key, _MISSING)
+                if value is _MISSING:
+                    value = await factory()
+                    if cache_if is None or cache_if(value):
+                        self.set(key, value)
+                return value
+        finally:
+            self._lock_users[key] -= 1
+            if not self._lock_users[key]:
+                del self._lock_users[key]
+                del self._locks[key]
+
+def load_cache_file(cache: AsyncTTLCache, path: str, decode=lambda value: value) -> None:
+    """JSON 파일(문자열 키 → 값)에 저장된 캐시 항목 불러오기 (파일이 없으면 무시)"""
+    try:
+        with open(path, "rb") as f:
+            saved = orjson.loads(f.read())
+    except FileNotFoundError:
+        return
+    except (OSError, orjson.JSONDecodeError) as e:
+        logger.warning(f"⚠️ 캐시 파일 로드 실패 ({path}): {e}")
+        return
+    for key, value in saved.items():
+        cache.set(key, decode(value))
+    logger.info(f"📂 캐시 파일 로드 ({path}): {len(saved)}개")
+
+def save_cache_file(cache: AsyncTTLCache, path: str) -> None:
+    """캐시 항목을 JSON 파일로 저장 (임시 파일에 쓴 뒤 교체)"""
+    entries = dict(cache.items())
+    if not entries:
+        return
+    try:
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(orjson.dumps(entries))
+        os.replace(tmp_path, path)
+        logger.info(f"💾 캐시 파일 저장 ({path}): {len(entries)}개")
+    except (OSError, TypeError) as e:
+        logger.warning(f"⚠️ 캐시 파일 저장 실패 ({path}): {e}")
+
+def normalize_place_text(place_text: str) -> str:
+    """캐시 키용 장소 텍스트 정규화 (소문자 + 공백 제거)"""
+    return "".join(place_text.lower().split())
+
+# GPT 분석 실패 시 기본값에 붙이는 지리적 맥락 (이 값이면 캐시하지 않음)
+_FALLBACK_GEO_CONTEXT = "기본값 적용"
+
+# GPT 지역 분석 캐시 (6시간) / API별 검색 결과 캐시 (성공 24시간, 실패 10분)
+_ANALYSIS_CACHE = AsyncTTLCache(ttl=6 * 3600, maxsize=2048)
+_PROVIDER_SEARCH_CACHE = AsyncTTLCache(ttl=24 * 3600, maxsize=4096, none_ttl=600)
+# (API, 요청 파라미터) → 응답 JSON 캐시 (1시간) - 같은 검색어를 쓰는 전략·일정·사용자 간 공유
+_API_RESPONSE_CACHE = AsyncTTLCache(ttl=3600, maxsize=10_000)
+# 캐시해도 되는 응답 상태 (Google의 OVER_QUERY_LIMIT 등 일시 오류는 캐시하지 않음, Kakao 응답에는 status 없음)
+_CACHEABLE_API_STATUSES = ("OK", "ZERO_RESULTS")
+
+async def fetch_api_json(api_name: str, url: str, params: Dict[str, Any], headers: Optional[Dict[str, str]] = None,
+                         timeout: Optional[float] = None) -> Optional[Dict]:
+    """외부 검색 API GET 응답(JSON) 반환 - 같은 요청은 캐시 재사용, 200이 아니면 None
+
+    반환된 dict는 캐시와 공유되므로 수정하지 말 것. timeout 미지정 시 세션 기본값 사용.
+    """
+    request_kwargs = {"timeout": timeout} if timeout is not None else {}
+
+    async def fetch() -> Optional[Dict]:
+        session = get_http_session()
+        async with session.get(url, headers=headers, params=params, **request_kwargs) as response:
+            if response.status != 200:
+                logger.warning(f"⚠️ {api_name} API 오류: {response.status}")
+                return None
+            return await response.json(loads=orjson.loads)
+
+    return await _API_RESPONSE_CACHE.get_or_set(
+        (api_name, url, tuple(sorted(params.items()))),
+        fetch,
+        cache_if=lambda data: data is not None and data.get("status", "OK") in _CACHEABLE_API_STATUSES
+    )
+
 class DynamicRouteOptimizer:
     """동적 경로 최적화 및 다중 옵션 생성기"""
     
@@ -219,22 +771,20 @@ class DynamicRouteOptimizer:
     
     async def create_multiple_options(self, enhanced_data: Dict, voice_input: str) -> Dict:
         """완전 동적 다중 옵션 생성 - used_locations 스코프 문제 수정"""
+        debug_enabled = logger.isEnabledFor(logging.DEBUG)  # 로그 전용 루프는 DEBUG일 때만 실행
         
-        def force_log(msg):
-            print(f"🎯 {msg}")
-            logger.info(msg)
-        
-        force_log("🆕 동적 다중 옵션 생성 시작 (used_locations 스코프 수정)")
-        force_log(f"입력 데이터: voice_input='{voice_input}'")
+        logger.debug("🆕 동적 다중 옵션 생성 시작 (used_locations 스코프 수정)")
+        logger.debug("입력 데이터: voice_input='%s'", voice_input)
         
         # 입력 데이터 상세 로깅
         fixed_schedules = enhanced_data.get("fixedSchedules", [])
-        force_log(f"고정 일정 수: {len(fixed_schedules)}개")
-        for i, schedule in enumerate(fixed_schedules):
-            force_log(f"  고정 일정 {i+1}: '{schedule.get('name', 'N/A')}' (ID: {schedule.get('id', 'N/A')})")
+        logger.debug("고정 일정 수: %s개", len(fixed_schedules))
+        if debug_enabled:
+            for i, schedule in enumerate(fixed_schedules):
+                logger.debug("  고정 일정 %s: '%s' (ID: %s)", i+1, schedule.get('name', 'N/A'), schedule.get('id', 'N/A'))
         
         if len(fixed_schedules) < 2:
-            force_log("⚠️ 경로 분석에 필요한 최소 일정 부족 (2개 미만)")
+            logger.debug("⚠️ 경로 분석에 필요한 최소 일정 부족 (2개 미만)")
             return {"options": [enhanced_data]}  # 단일 옵션 반환
         
         # 1. 경로 정보 자동 추출
@@ -244,301 +794,207 @@ class DynamicRouteOptimizer:
         start_coord = (start_schedule.get("latitude"), start_schedule.get("longitude"))
         end_coord = (end_schedule.get("latitude"), end_schedule.get("longitude"))
         
-        force_log(f"📍 경로 분석:")
-        force_log(f"  시작: {start_schedule.get('name')} ({start_coord})")
-        force_log(f"  종료: {end_schedule.get('name')} ({end_coord})")
+        logger.debug("📍 경로 분석:")
+        logger.debug("  시작: %s (%s)", start_schedule.get('name'), start_coord)
+        logger.debug("  종료: %s (%s)", end_schedule.get('name'), end_coord)
         
         # 2. 변경 가능한 일정 자동 식별
         variable_schedules = self.identify_variable_schedules(fixed_schedules, voice_input)
         
-        force_log(f"🔍 변경 가능한 일정 식별 결과: {len(variable_schedules)}개")
-        for i, var_info in enumerate(variable_schedules):
-            force_log(f"  변경 가능 {i+1}: 인덱스={var_info['index']}, 브랜드='{var_info['brand']}', 원본명='{var_info['original_name']}'")
+        logger.debug("🔍 변경 가능한 일정 식별 결과: %s개", len(variable_schedules))
+        if debug_enabled:
+            for i, var_info in enumerate(variable_schedules):
+                logger.debug("  변경 가능 %s: 인덱스=%s, 브랜드='%s', 원본명='%s'", i+1, var_info['index'], var_info['brand'], var_info['original_name'])
         
         if not variable_schedules:
-            force_log("⚠️ 변경 가능한 일정이 없음 → 단일 옵션 반환")
+            logger.debug("⚠️ 변경 가능한 일정이 없음 → 단일 옵션 반환")
             return {"options": [enhanced_data]}
         
         # 🔥 전역 위치 추적 - 클래스 레벨로 이동하여 확실한 공유 보장
         global_used_locations = set()
         
-        force_log(f"🔄 전역 used_locations 초기화: {len(global_used_locations)}개")
+        logger.debug("🔄 전역 used_locations 초기화: %s개", len(global_used_locations))
+        
+        # 🔥 옵션별 중간 지역과 브랜드 검색은 서로 독립적이므로 미리 동시에 실행
+        # (제외 목록 적용과 선택은 아래에서 옵션 순서대로 → 결과는 순차 실행과 동일)
+        intermediate_areas_by_option = await self.prefetch_brand_branches(
+            [var_info["brand"] for var_info in variable_schedules], start_coord, end_coord, total_options=5
+        )
         
         # 3. 각 변경 가능한 일정에 대해 동적 옵션 생성
         options = []
+        seen_signatures = set()  # 이미 만든 옵션의 위치 시그니처
+        id_base = int(time.time() * 1000)  # 옵션 ID 공통 접두사 (호출당 한 번)
         successful_options = 0  # 성공한 옵션 수 추적
         
         for option_num in range(5):
-            force_log(f"🔄 옵션 {option_num + 1} 동적 생성 시작")
-            force_log(f"  현재 전역 used_locations: {len(global_used_locations)}개 - {list(global_used_locations)}")
+            logger.debug("🔄 옵션 %s 동적 생성 시작", option_num + 1)
+            logger.debug("  현재 전역 used_locations: %s개 - %s", len(global_used_locations), global_used_locations)
             
-            option_data = copy.deepcopy(enhanced_data)
+            # 🔥 원본은 읽기만 하고 변경 내용은 따로 모아둠 (복사는 옵션이 채택될 때만)
+            schedule_changes = {}
             option_modified = False
             current_option_locations = set()  # 현재 옵션에서 사용할 위치들
+            # 🔥 검색에 넘길 제외 목록 스냅샷 (읽기 전용, 전역이 바뀔 때만 다시 생성)
+            used_snapshot = frozenset(global_used_locations)
             
             for var_info in variable_schedules:
                 schedule_idx = var_info["index"]
-                schedule = option_data["fixedSchedules"][schedule_idx]
+                schedule = fixed_schedules[schedule_idx]
                 brand_name = var_info["brand"]
                 
-                force_log(f"  📝 일정 수정: 인덱스={schedule_idx}, 브랜드='{brand_name}'")
-                force_log(f"    현재 이름: '{schedule.get('name')}'")
-                force_log(f"    현재 위치: '{schedule.get('location')}'")
+                logger.debug("  📝 일정 수정: 인덱스=%s, 브랜드='%s'", schedule_idx, brand_name)
+                logger.debug("    현재 이름: '%s'", schedule.get('name'))
+                logger.debug("    현재 위치: '%s'", schedule.get('location'))
                 
                 # 🔥 현재 위치를 첫 번째 옵션에서는 사용된 위치에 추가
                 current_location = schedule.get("location", "")
                 if option_num == 0 and current_location and current_location.strip():
                     global_used_locations.add(current_location)
-                    force_log(f"    📝 원본 위치를 전역에 추가: {current_location}")
-                    force_log(f"    📊 전역 used_locations 업데이트: {len(global_used_locations)}개")
+                    used_snapshot = frozenset(global_used_locations)
+                    logger.debug("    📝 원본 위치를 전역에 추가: %s", current_location)
+                    logger.debug("    📊 전역 used_locations 업데이트: %s개", len(global_used_locations))
                 
-                # 4. 동적 중간 지역 계산
-                force_log(f"  🗺️ 중간 지역 계산 (옵션 {option_num + 1})")
-                intermediate_areas = await self.calculate_intermediate_areas(
-                    start_coord, end_coord, option_num, total_options=5
-                )
-                force_log(f"    계산된 중간 지역: {intermediate_areas}")
+                # 4. 동적 중간 지역 (미리 계산됨)
+                intermediate_areas = intermediate_areas_by_option[option_num]
+                logger.debug("    계산된 중간 지역: %s", intermediate_areas)
                 
                 # 5. 해당 지역에서 브랜드 검색 (🔥 전역 used_locations 사본 전달)
-                force_log(f"  🔍 브랜드 검색: '{brand_name}' (전역 제외: {len(global_used_locations)}개)")
-                force_log(f"    제외할 위치 목록: {list(global_used_locations)}")
-                
-                # 🔥 used_locations 사본을 전달하여 find_optimal_branch에서 실제로 수정되지 않도록 함
-                used_locations_copy = global_used_locations.copy()
+                logger.debug("  🔍 브랜드 검색: '%s' (전역 제외: %s개)", brand_name, len(global_used_locations))
+                logger.debug("    제외할 위치 목록: %s", global_used_locations)
                 
                 best_location = await self.find_optimal_branch(
-                    brand_name, intermediate_areas, start_coord, end_coord, used_locations_copy
+                    brand_name, intermediate_areas, start_coord, end_coord, used_snapshot
                 )
                 
                 if best_location:
                     new_location = best_location.get("address", "")
-                    force_log(f"    ✅ 검색 성공: {best_location.get('name')}")
-                    force_log(f"      주소: {new_location}")
+                    logger.debug("    ✅ 검색 성공: %s", best_location.get('name'))
+                    logger.debug("      주소: %s", new_location)
                     
-                    # 🔥 중복 체크 (find_optimal_branch가 사본을 수정했으므로 원본은 그대로)
+                    # 🔥 중복 체크 (find_optimal_branch는 제외 목록을 읽기만 함)
                     if new_location in global_used_locations:
-                        force_log(f"    ⚠️ 이미 전역에서 사용된 위치: {new_location}")
+                        logger.debug("    ⚠️ 이미 전역에서 사용된 위치: %s", new_location)
                         continue  # 이 일정은 수정하지 않고 넘어감
                     elif new_location != current_location:
-                        # 위치 업데이트
+                        # 위치 업데이트 예약
                         old_location = schedule.get("location")
-                        schedule["location"] = new_location
-                        schedule["latitude"] = best_location["latitude"]
-                        schedule["longitude"] = best_location["longitude"]
-                        schedule["name"] = best_location["name"]
+                        schedule_changes[schedule_idx] = {
+                            "location": new_location,
+                            "latitude": best_location["latitude"],
+                            "longitude": best_location["longitude"],
+                            "name": best_location["name"]
+                        }
                         
                         # 🔥 현재 옵션에서 사용할 위치로 임시 저장
                         current_option_locations.add(new_location)
                         
                         option_modified = True
-                        force_log(f"    🔄 위치 변경:")
-                        force_log(f"      이전: {old_location}")
-                        force_log(f"      이후: {new_location}")
-                        force_log(f"    📝 현재 옵션 위치 목록에 추가: {new_location}")
+                        logger.debug("    🔄 위치 변경:")
+                        logger.debug("      이전: %s", old_location)
+                        logger.debug("      이후: %s", new_location)
+                        logger.debug("    📝 현재 옵션 위치 목록에 추가: %s", new_location)
                     else:
-                        force_log(f"    ⚠️ 동일한 위치라서 변경 없음: {new_location}")
+                        logger.debug("    ⚠️ 동일한 위치라서 변경 없음: %s", new_location)
                 else:
-                    force_log(f"    ❌ 검색 실패: 새로운 위치 없음 (모든 후보가 이미 사용됨)")
+                    logger.info("    ❌ 검색 실패: 새로운 위치 없음 (모든 후보가 이미 사용됨)")
                     
                     # 🔥 더 이상 새로운 위치가 없으면 옵션 생성 중단
                     if option_num > 0:  # 첫 번째 옵션이 아닌 경우에만
-                        force_log(f"    ⏭️ 새로운 위치가 없어서 옵션 생성 중단")
+                        logger.debug("    ⏭️ 새로운 위치가 없어서 옵션 생성 중단")
                         break
             
             # 6. 수정된 옵션만 추가 (중복 방지)
-            if option_modified or option_num == 0:  # 첫 번째는 원본 유지
+            signature = None
+            if option_modified or option_num == 0:
+                # 🔥 복사 전에 예상 시그니처로 중복 여부 먼저 확인
+                prospective_schedules = [
+                    {**schedule, **schedule_changes[idx]} if idx in schedule_changes else schedule
+                    for idx, schedule in enumerate(fixed_schedules)
+                ]
+                signature = self.create_location_signature({"fixedSchedules": prospective_schedules})
+            
+            if signature is not None and signature in seen_signatures:
+                logger.debug("  ❌ 옵션 %s 건너뛰기 (이미 생성된 옵션과 동일)", option_num + 1)
+            elif option_modified or option_num == 0:  # 첫 번째는 원본 유지
+                seen_signatures.add(signature)
+                option_data = _clone_enhanced(enhanced_data)
+                for idx, changes in schedule_changes.items():
+                    option_data["fixedSchedules"][idx].update(changes)
+                
                 # 🔥 현재 옵션의 위치들을 전역에 추가 (성공적으로 옵션이 생성된 경우에만)
                 for location in current_option_locations:
                     global_used_locations.add(location)
-                    force_log(f"    ✅ 전역 used_locations에 추가: {location}")
+                    logger.debug("    ✅ 전역 used_locations에 추가: %s", location)
                 
-                force_log(f"    📊 전역 used_locations 최종 상태: {len(global_used_locations)}개")
-                force_log(f"      목록: {list(global_used_locations)}")
+                logger.debug("    📊 전역 used_locations 최종 상태: %s개", len(global_used_locations))
+                logger.debug("      목록: %s", global_used_locations)
                 
                 # 고유 ID 부여
-                current_time = int(time.time() * 1000)
+                id_prefix = f"{id_base}_{option_num + 1}_"
                 for j, schedule in enumerate(option_data["fixedSchedules"]):
                     old_id = schedule.get("id")
-                    new_id = f"{current_time}_{option_num + 1}_{j + 1}"
+                    new_id = id_prefix + str(j + 1)
                     schedule["id"] = new_id
-                    force_log(f"    🆔 ID 업데이트: {old_id} → {new_id}")
+                    logger.debug("    🆔 ID 업데이트: %s → %s", old_id, new_id)
                 
                 options.append({
                     "optionId": option_num + 1,
                     "fixedSchedules": option_data["fixedSchedules"],
-                    "flexibleSchedules": option_data.get("flexibleSchedules", [])
+                    "flexibleSchedules": option_data.get("flexibleSchedules", []),
+                    "_signature": signature  # 중복 제거 단계에서 재사용 (응답 전에 제거됨)
                 })
                 
                 successful_options += 1
-                force_log(f"  ✅ 옵션 {option_num + 1} 생성 완료 (수정됨: {option_modified})")
-                force_log(f"    성공한 옵션 수: {successful_options}")
+                logger.debug("  ✅ 옵션 %s 생성 완료 (수정됨: %s)", option_num + 1, option_modified)
+                logger.debug("    성공한 옵션 수: %s", successful_options)
                 
             else:
-                force_log(f"  ❌ 옵션 {option_num + 1} 건너뛰기 (변경사항 없음)")
+                logger.debug("  ❌ 옵션 %s 건너뛰기 (변경사항 없음)", option_num + 1)
             
             # 🔥 조기 종료 조건: 더 이상 새로운 위치를 찾을 수 없는 경우
             if not option_modified and option_num > 0:
-                force_log(f"⏹️ 더 이상 새로운 위치를 찾을 수 없어서 조기 종료 (옵션 {option_num + 1})")
+                logger.debug("⏹️ 더 이상 새로운 위치를 찾을 수 없어서 조기 종료 (옵션 %s)", option_num + 1)
                 break
         
         # 7. 중복 제거 (추가 안전장치)
         unique_options = self.remove_duplicate_options(options)
-        force_log(f"🔄 중복 제거 결과: {len(options)}개 → {len(unique_options)}개")
+        logger.debug("🔄 중복 제거 결과: %s개 → %s개", len(options), len(unique_options))
         
         # 8. 최종 결과
-        force_log(f"🎉 동적 옵션 생성 완료: {len(unique_options)}개")
-        force_log(f"📊 최종 전역 used_locations: {len(global_used_locations)}개")
-        for i, location in enumerate(global_used_locations):
-            force_log(f"  위치 {i+1}: {location}")
+        logger.debug("🎉 동적 옵션 생성 완료: %s개", len(unique_options))
+        logger.debug("📊 최종 전역 used_locations: %s개", len(global_used_locations))
+        if debug_enabled:
+            for i, location in enumerate(global_used_locations):
+                logger.debug("  위치 %s: %s", i+1, location)
         
         # 생성된 옵션들 상세 로깅
-        for i, option in enumerate(unique_options):
-            force_log(f"📋 최종 옵션 {i+1}:")
-            for j, schedule in enumerate(option.get("fixedSchedules", [])):
-                force_log(f"  일정 {j+1}: '{schedule.get('name')}' @ {schedule.get('location')}")
+        if debug_enabled:
+            for i, option in enumerate(unique_options):
+                logger.debug("📋 최종 옵션 %s:", i+1)
+                for j, schedule in enumerate(option.get("fixedSchedules", [])):
+                    logger.debug("  일정 %s: '%s' @ %s", j+1, schedule.get('name'), schedule.get('location'))
         
         return {"options": unique_options}
     
     def identify_variable_schedules(self, schedules: List[Dict], voice_input: str) -> List[Dict]:
         """변경 가능한 일정 자동 식별"""
-        def force_log(msg):
-            print(f"🔍 {msg}")
-            logger.info(msg)
-        
-        force_log("변경 가능한 일정 식별 시작")
-        force_log(f"입력: 일정 수={len(schedules)}, 음성='{voice_input}'")        
+        logger.debug("변경 가능한 일정 식별 시작")
+        logger.debug("입력: 일정 수=%s, 음성='%s'", len(schedules), voice_input)        
         variable_schedules = []
         
-        # 브랜드 키워드 동적 감지
-        brand_keywords = {
-            # ☕ 커피 전문점 (경쟁 브랜드들)
-            "스타벅스": ["스타벅스", "starbucks"],
-            "커피빈": ["커피빈", "coffee bean", "coffeebean"],
-            "할리스": ["할리스", "hollys", "할리스커피"],
-            "투썸플레이스": ["투썸플레이스", "twosome", "투썸"],
-            "이디야": ["이디야", "ediya", "이디야커피"],
-            "폴바셋": ["폴바셋", "paul bassett"],
-            "탐앤탐스": ["탐앤탐스", "tom n toms"],
-            "엔젤리너스": ["엔젤리너스", "angelinus"],
-            "메가커피": ["메가커피", "mega coffee", "메가mgc커피"],
-            "컴포즈커피": ["컴포즈", "compose coffee"],
-            "식사": ["식사", "저녁", "점심", "아침", "밥", "맛집", "식당"],          
-            # 🍰 카페 & 디저트
-            "카페": ["카페", "cafe", "커피", "coffee"],
-            "베이커리": ["베이커리", "bakery", "빵집", "파리바게뜨", "뚜레쥬르"],
-            "디저트": ["디저트", "dessert", "케이크", "마카롱", "아이스크림"],
-            
-            # 🍔 패스트푸드
-            "맥도날드": ["맥도날드", "mcdonald", "맥딜"],
-            "버거킹": ["버거킹", "burger king"],
-            "롯데리아": ["롯데리아", "lotteria"],
-            "kfc": ["kfc", "치킨"],
-            "서브웨이": ["서브웨이", "subway"],
-            
-            # 🍕 피자
-            "도미노피자": ["도미노", "domino", "도미노피자"],
-            "피자헛": ["피자헛", "pizza hut"],
-            "미스터피자": ["미스터피자", "mr pizza"],
-            "파파존스": ["파파존스", "papa johns"],
-            
-            # 🍗 치킨
-            "bbq": ["bbq", "비비큐"],
-            "굽네치킨": ["굽네", "굽네치킨"],
-            "네네치킨": ["네네", "네네치킨"],
-            "교촌치킨": ["교촌", "교촌치킨"],
-            "bhc": ["bhc", "비에이치씨"],
-            "처갓집": ["처갓집", "처갓집양념치킨"],
-            
-            # 🏪 편의점
-            "편의점": ["편의점", "세븐일레븐", "cu", "gs25", "이마트24", "미니스톱"],
-            "세븐일레븐": ["세븐일레븐", "7eleven", "711"],
-            "cu": ["cu", "씨유"],
-            "gs25": ["gs25", "지에스25"],
-            "이마트24": ["이마트24", "emart24"],
-            
-            # 🍜 한식
-            "한식": ["한식", "한정식", "백반", "찌개", "국밥", "korean food"],
-            "김밥": ["김밥천국", "김밥", "분식"],
-            "곱창": ["곱창", "막창", "대창", "양"],
-            "삼겹살": ["삼겹살", "고기집", "구이"],
-            "치킨갈비": ["닭갈비", "치킨갈비", "춘천닭갈비"],
-            
-            # 🍝 양식
-            "파스타": ["파스타", "이탈리안", "스파게티"],
-            "스테이크": ["스테이크", "아웃백", "outback"],
-            "양식": ["양식", "이탈리안", "western food"],
-            
-            # 🍜 일식
-            "초밥": ["초밥", "스시", "sushi"],
-            "라멘": ["라멘", "ramen", "돈코츠"],
-            "돈카츠": ["돈카츠", "카츠", "tonkatsu"],
-            "일식": ["일식", "japanese food"],
-            
-            # 🥟 중식
-            "중식": ["중식", "중국집", "짜장면", "짬뽕", "탕수육"],
-            "딤섬": ["딤섬", "만두"],
-            
-            # 🌮 기타 세계음식
-            "멕시칸": ["멕시칸", "타코", "부리또"],
-            "태국음식": ["태국", "쌀국수", "팟타이"],
-            "인도음식": ["인도", "커리", "난"],
-            
-            # 🥘 분식/간식
-            "분식": ["분식", "떡볶이", "순대", "튀김", "어묵"],
-            "아이스크림": ["배스킨라빈스", "브라운", "하겐다즈"],
-            
-            # 🏨 숙박
-            "호텔": ["호텔", "hotel", "리조트", "펜션"],
-            "모텔": ["모텔", "motel"],
-            
-            # 🏥 생활시설
-            "병원": ["병원", "의원", "clinic", "hospital"],
-            "약국": ["약국", "pharmacy"],
-            "은행": ["은행", "bank", "atm"],
-            "마트": ["마트", "이마트", "홈플러스", "롯데마트"],
-            
-            # 🎮 오락시설
-            "노래방": ["노래방", "karaoke", "코인노래방"],
-            "pc방": ["pc방", "피씨방", "게임방"],
-            "찜질방": ["찜질방", "사우나", "목욕탕"],
-            "볼링장": ["볼링", "볼링장"],
-            "당구장": ["당구", "당구장", "포켓볼"],
-            
-            # 🚗 교통/서비스
-            "주유소": ["주유소", "gas station", "sk", "gs칼텍스", "현대오일뱅크"],
-            "세차장": ["세차", "세차장"],
-            "미용실": ["미용실", "헤어샵", "미용원"],
-            "네일샵": ["네일", "네일샵", "nail"],
-            
-            # 🏃 운동/건강
-            "헬스장": ["헬스", "헬스장", "피트니스", "gym"],
-            "요가": ["요가", "필라테스", "yoga"],
-            "골프": ["골프", "골프장", "골프연습장"],
-            
-            # 🎯 대형 브랜드 (구체적으로)
-            "이마트": ["이마트", "emart"],
-            "홈플러스": ["홈플러스", "homeplus"],
-            "코스트코": ["코스트코", "costco"],
-            "현대백화점": ["현대백화점", "현대"],
-            "롯데백화점": ["롯데백화점", "롯데"],
-            "신세계": ["신세계백화점", "신세계"],
-        }
-        force_log(f"브랜드 키워드 설정: {len(brand_keywords)}개 브랜드")       
-        for idx, schedule in enumerate(schedules):
-            schedule_name = schedule.get("name", "").lower()
-            
-            # 브랜드 매칭 확인
-            for brand, keywords in brand_keywords.items():
-                force_log(f"  {brand}: {keywords}")
-                if any(keyword in schedule_name for keyword in keywords):
-                    variable_schedules.append({
-                        "index": idx,
-                        "brand": brand,
-                        "original_name": schedule.get("name"),
-                        "keywords": keywords
-                    })
-                    logger.info(f"🔍 변경 가능한 일정 발견: {schedule.get('name')} → {brand}")
-                    break
+        logger.debug("브랜드 키워드 설정: %s개 브랜드", len(_BRAND_KEYWORDS))
+        # 브랜드 매칭 확인 (일정 이름 전체를 한 번에 스캔, 일정마다 가장 앞선 순서의 브랜드 하나만 선택)
+        brands = _BRAND_MATCHER.first_labels([schedule.get("name", "").lower() for schedule in schedules])
+        for idx, (schedule, brand) in enumerate(zip(schedules, brands)):
+            if brand:
+                variable_schedules.append({
+                    "index": idx,
+                    "brand": brand,
+                    "original_name": schedule.get("name"),
+                    "keywords": _BRAND_KEYWORDS[brand]
+                })
+                logger.info(f"🔍 변경 가능한 일정 발견: {schedule.get('name')} → {brand}")
         
         return variable_schedules
     
@@ -546,37 +1002,33 @@ class DynamicRouteOptimizer:
                                          option_num: int, total_options: int = 5) -> List[Tuple]:
         """동적 중간 지역 좌표 계산 - 로깅 추가"""
         
-        def force_log(msg):
-            print(f"🗺️ {msg}")
-            logger.info(msg)
-        
         start_lat, start_lng = start_coord
         end_lat, end_lng = end_coord
         
-        force_log(f"중간 지역 계산: 옵션 {option_num + 1}")
-        force_log(f"  시작점: ({start_lat:.4f}, {start_lng:.4f})")
-        force_log(f"  종료점: ({end_lat:.4f}, {end_lng:.4f})")
+        logger.debug("중간 지역 계산: 옵션 %s", option_num + 1)
+        logger.debug("  시작점: (%.4f, %.4f)", start_lat, start_lng)
+        logger.debug("  종료점: (%.4f, %.4f)", end_lat, end_lng)
         
         # 옵션별로 다른 중간점들 계산
         intermediate_coords = []
         
         if option_num == 0:
             ratio = 0.2
-            force_log(f"  전략: 출발지 근처 (20% 지점)")
+            logger.debug("  전략: 출발지 근처 (20% 지점)")
         elif option_num == 1:
             ratio = 0.5
-            force_log(f"  전략: 중간 지점 (50% 지점)")
+            logger.debug("  전략: 중간 지점 (50% 지점)")
         elif option_num == 2:
             ratio = 0.8
-            force_log(f"  전략: 목적지 근처 (80% 지점)")
+            logger.debug("  전략: 목적지 근처 (80% 지점)")
         elif option_num == 3:
             ratio = 0.5
             perpendicular_offset = 0.01
-            force_log(f"  전략: 우회 경로 1 (중간점 + 수직 오프셋)")
+            logger.debug("  전략: 우회 경로 1 (중간점 + 수직 오프셋)")
         else:
             ratio = 0.3
             perpendicular_offset = -0.01
-            force_log(f"  전략: 우회 경로 2 (30% 지점 + 수직 오프셋)")
+            logger.debug("  전략: 우회 경로 2 (30% 지점 + 수직 오프셋)")
         
         # 기본 중간점 계산
         mid_lat = start_lat + (end_lat - start_lat) * ratio
@@ -586,81 +1038,89 @@ class DynamicRouteOptimizer:
         if option_num >= 3:
             if 'perpendicular_offset' in locals():
                 mid_lat += perpendicular_offset
-                force_log(f"  수직 오프셋 적용: +{perpendicular_offset}")
+                logger.debug("  수직 오프셋 적용: +%s", perpendicular_offset)
         
         intermediate_coords.append((mid_lat, mid_lng))
-        force_log(f"  계산된 중간점: ({mid_lat:.4f}, {mid_lng:.4f})")
+        logger.debug("  계산된 중간점: (%.4f, %.4f)", mid_lat, mid_lng)
         
         return intermediate_coords
     
     async def find_optimal_branch(self, brand_name: str, intermediate_areas: List[Tuple], 
-                                start_coord: Tuple, end_coord: Tuple, used_locations: Set[str] = None) -> Optional[Dict]:
-        """최적의 브랜드 지점 찾기 - 사용된 위치 제외"""
-        
-        if used_locations is None:
-            used_locations = set()
+                                start_coord: Tuple, end_coord: Tuple,
+                                used_locations: frozenset = frozenset()) -> Optional[Dict]:
+        """최적의 브랜드 지점 찾기 - 사용된 위치 제외 (used_locations는 읽기만 함)"""
         
-        def force_log(msg):
-            print(f"🔍 {msg}")
-            logger.info(msg)
-        
-        force_log(f"최적 브랜드 지점 검색: '{brand_name}'")
-        force_log(f"검색 지역: {len(intermediate_areas)}개")
-        force_log(f"제외할 위치: {len(used_locations)}개 - {list(used_locations)}")
-        
-        best_location = None
-        best_efficiency = 0
+        logger.debug("최적 브랜드 지점 검색: '%s'", brand_name)
+        logger.debug("검색 지역: %s개", len(intermediate_areas))
+        logger.debug("제외할 위치: %s개 - %s", len(used_locations), used_locations)
         
+        candidates = []
         for i, coord in enumerate(intermediate_areas):
-            force_log(f"지역 {i+1} 검색: 좌표 ({coord[0]:.4f}, {coord[1]:.4f})")
+            logger.debug("지역 %s 검색: 좌표 (%.4f, %.4f)", i+1, coord[0], coord[1])
             
             # 해당 좌표 근처에서 브랜드 검색
-            candidates = await self.search_brand_near_coordinate(brand_name, coord)
-            force_log(f"  검색 결과: {len(candidates)}개 후보")
-            
-            for j, candidate in enumerate(candidates):
-                location = candidate.get('address', '')
-                force_log(f"    후보 {j+1}: {candidate.get('name')} @ {location}")
-                
-                # 🔥 이미 사용된 위치인지 확인
-                if location in used_locations:
-                    force_log(f"      ❌ 이미 사용된 위치라서 제외")
-                    continue
-                    
-                # 경로 효율성 계산
-                efficiency = self.calculate_route_efficiency(
-                    start_coord, 
-                    (candidate["latitude"], candidate["longitude"]), 
-                    end_coord
-                )
-                force_log(f"      효율성: {efficiency:.3f}")
-                
-                if efficiency > best_efficiency:
-                    best_efficiency = efficiency
-                    best_location = candidate
-                    force_log(f"      🔥 새로운 최적 후보: {candidate.get('name')} (효율성: {efficiency:.3f})")
+            area_candidates = await self.search_brand_near_coordinate(brand_name, coord)
+            logger.debug("  검색 결과: %s개 후보", len(area_candidates))
+            candidates.extend(area_candidates)
+        
+        # 🔥 이미 사용된 위치를 제외하고 남은 후보 전체의 경로 효율성을 한 번에 계산
+        available = [candidate for candidate in candidates if candidate.get('address', '') not in used_locations]
+        efficiencies = calculate_route_efficiency_batch(
+            start_coord,
+            [(candidate["latitude"], candidate["longitude"]) for candidate in available],
+            end_coord
+        )
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("  제외 후 후보: %s개 / %s개", len(available), len(candidates))
+            for j, (candidate, efficiency) in enumerate(zip(available, efficiencies)):
+                logger.debug("    후보 %s: %s @ %s (효율성: %.3f)", j+1, candidate.get('name'), candidate.get('address'), efficiency)
+        
+        # 효율성이 가장 높은 후보 (동점이면 먼저 검색된 후보, 효율성 0은 선택하지 않음)
+        best_location = None
+        best_efficiency = 0
+        if efficiencies:
+            best_idx = max(range(len(efficiencies)), key=efficiencies.__getitem__)
+            if efficiencies[best_idx] > best_efficiency:
+                best_efficiency = efficiencies[best_idx]
+                best_location = available[best_idx]
         
         if best_location:
-            force_log(f"✅ 최종 선택: {best_location['name']} (효율성: {best_efficiency:.3f})")
-            # 🔥 사용된 위치 추가
-            used_locations.add(best_location['address'])
-            force_log(f"📝 사용된 위치에 추가: {best_location['address']}")
+            logger.debug("✅ 최종 선택: %s (효율성: %.3f)", best_location['name'], best_efficiency)
         else:
-            force_log(f"❌ 적절한 지점을 찾지 못함 (모두 사용된 위치이거나 검색 실패)")
+            logger.info("❌ 적절한 지점을 찾지 못함 (모두 사용된 위치이거나 검색 실패)")
         
         return best_location
+    
+    async def prefetch_brand_branches(self, brand_names: List[str], start_coord: Tuple,
+                                      end_coord: Tuple, total_options: int = 5) -> List[List[Tuple]]:
+        """옵션별 중간 지역을 계산하고 브랜드 검색을 동시에 실행해 캐시를 미리 채움"""
+        intermediate_areas_by_option = await asyncio.gather(*(
+            self.calculate_intermediate_areas(start_coord, end_coord, option_num, total_options)
+            for option_num in range(total_options)
+        ))
+        
+        coords = dict.fromkeys(coord for areas in intermediate_areas_by_option for coord in areas)
+        await asyncio.gather(*(
+            self.search_brand_near_coordinate(brand_name, coord)
+            for brand_name in dict.fromkeys(brand_names)
+            for coord in coords
+        ), return_exceptions=True)
+        
+        return intermediate_areas_by_option
 
     
     async def search_brand_near_coordinate(self, brand_name: str, coord: Tuple, 
                                          radius: int = 3000) -> List[Dict]:
         """특정 좌표 근처에서 브랜드 검색 - 로깅 추가"""
         
-        def force_log(msg):
-            print(f"🔍 {msg}")
-            logger.info(msg)
-        
         lat, lng = coord
-        force_log(f"브랜드 검색: '{brand_name}' @ ({lat:.4f}, {lng:.4f}), 반경: {radius}m")
+        logger.debug("브랜드 검색: '%s' @ (%.4f, %.4f), 반경: %sm", brand_name, lat, lng, radius)
+        
+        # 🔥 이미 확인된 영역이면 Kakao 호출 없이 캐시에서 반환
+        cached = _BRAND_BRANCH_CACHE.lookup(brand_name, coord, radius, size=10)
+        if cached is not None:
+            logger.debug("✅ 캐시 적중: %s개 후보 반환", len(cached))
+            return cached
         
         try:
             url = "https://dapi.kakao.com/v2/local/search/keyword.json"
@@ -674,115 +1134,88 @@ class DynamicRouteOptimizer:
                 "size": 10,
                 "sort": "distance"
             }
+            category_code = _BRAND_CATEGORY_CODES.get(brand_name)
+            if category_code:
+                params["category_group_code"] = category_code
             
-            force_log(f"Kakao API 호출: query='{brand_name}'")
+            logger.debug("Kakao API 호출: query='%s', 카테고리=%s", brand_name, category_code or '전체')
             
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url, headers=headers, params=params) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        
-                        candidates = []
-                        places = data.get("documents", [])
-                        force_log(f"API 응답: {len(places)}개 장소")
-                        
-                        for i, place in enumerate(places):
-                            place_name = place.get("place_name", "")
-                            address = place.get("road_address_name") or place.get("address_name", "")
-                            distance = place.get("distance", "")
-                            
-                            force_log(f"  장소 {i+1}: {place_name} ({distance}m)")
-                            force_log(f"    주소: {address}")
-                            
-                            candidates.append({
-                                "name": place_name,
-                                "address": address,
-                                "latitude": float(place.get("y", 0)),
-                                "longitude": float(place.get("x", 0)),
-                                "distance": distance
-                            })
+            session = get_http_session()
+            async with session.get(url, headers=headers, params=params) as response:
+                if response.status == 200:
+                    data = await response.json(loads=orjson.loads)
+                    
+                    candidates = []
+                    places = data.get("documents", [])
+                    logger.debug("API 응답: %s개 장소", len(places))
+                    
+                    for i, place in enumerate(places):
+                        place_name = place.get("place_name", "")
+                        address = place.get("road_address_name") or place.get("address_name", "")
+                        distance = place.get("distance", "")
                         
-                        force_log(f"✅ 검색 완료: {len(candidates)}개 후보 반환")
-                        return candidates
-                    else:
-                        force_log(f"❌ API 오류: HTTP {response.status}")
+                        logger.debug("  장소 %s: %s (%sm)", i+1, place_name, distance)
+                        logger.debug("    주소: %s", address)
                         
+                        candidates.append({
+                            "name": place_name,
+                            "address": address,
+                            "latitude": float(place.get("y", 0)),
+                            "longitude": float(place.get("x", 0)),
+                            "distance": distance
+                        })
+                    
+                    _BRAND_BRANCH_CACHE.store(brand_name, coord, radius, 10, candidates)
+                    logger.debug("✅ 검색 완료: %s개 후보 반환", len(candidates))
+                    return candidates
+                else:
+                    logger.info("❌ API 오류: HTTP %s", response.status)
+                    
         except Exception as e:
-            force_log(f"❌ 검색 예외: {e}")
+            logger.info("❌ 검색 예외: %s", e)
         
         return []
     
     def calculate_route_efficiency(self, start: Tuple, middle: Tuple, end: Tuple) -> float:
-        """경로 효율성 계산 - 로깅 추가"""
-        
-        def distance(p1, p2):
-            lat1, lng1 = p1
-            lat2, lng2 = p2
-            return math.sqrt((lat2 - lat1)**2 + (lng2 - lng1)**2)
-        
-        # 직선 거리 vs 실제 경로 거리
-        direct_distance = distance(start, end)
-        route_distance = distance(start, middle) + distance(middle, end)
-        
-        if route_distance == 0:
-            return 0
-        
-        efficiency = direct_distance / route_distance
-        
-        # 상세 로깅은 너무 많아서 생략
-        return efficiency
+        """경로 효율성 계산"""
+        return calculate_route_efficiency_batch(start, (middle,), end)[0]
     
     def remove_duplicate_options(self, options: List[Dict]) -> List[Dict]:
-        """중복 옵션 제거 - 로깅 추가"""
-        
-        def force_log(msg):
-            print(f"🔄 {msg}")
-            logger.info(msg)
-        
-        force_log(f"중복 제거 시작: {len(options)}개 옵션")
+        """중복 옵션 제거 (요약 로그만 남김)"""
         
         unique_options = []
         seen_signatures = set()
+        debug_enabled = logger.isEnabledFor(logging.DEBUG)
         
         for i, option in enumerate(options):
-            # 각 옵션의 위치 시그니처 생성
-            signature = self.create_location_signature(option)
-            force_log(f"옵션 {i+1} 시그니처: '{signature}'")
+            # 각 옵션의 위치 시그니처 (생성 단계에서 계산해 둔 값이 있으면 재사용)
+            signature = option.pop("_signature", None) or self.create_location_signature(option)
+            is_unique = signature not in seen_signatures
+            if debug_enabled:
+                logger.debug(f"옵션 {i+1} 시그니처: '{signature}' → {'고유' if is_unique else '중복'}")
             
-            if signature not in seen_signatures:
+            if is_unique:
                 unique_options.append(option)
                 seen_signatures.add(signature)
-                force_log(f"  ✅ 고유 옵션으로 추가")
-            else:
-                force_log(f"  ❌ 중복 옵션 제외")
         
-        force_log(f"중복 제거 완료: {len(unique_options)}개 남음")
+        logger.info(f"🔄 중복 제거: {len(options)}개 → {len(unique_options)}개 "
+                    f"(중복 {len(options) - len(unique_options)}개)")
         return unique_options
     
-    def create_location_signature(self, option: Dict) -> str:
+    def create_location_signature(self, option: Dict) -> Tuple:
+        """옵션의 (이름, 위치) 튜플 시그니처 - 문자열 결합 없이 바로 해시 가능"""
         locations = []
-        for schedule in option.get("fixedSchedules", []):
+        for schedule in option.get("fixedSchedules", ()):
+            name = schedule.get("name") or ""
             location = schedule.get("location", "")
             # 🔥 스타벅스같은 브랜드는 위치만으로 구분
-            if "스타벅스" in schedule.get("name", ""):
-                locations.append(f"starbucks@{location}")
-            else:
-                name = schedule.get("name", "")
-                locations.append(f"{name}@{location}")
-        return " | ".join(locations)
+            marker = next((m for m in _BRAND_MARKERS if m in name), None)
+            locations.append((marker or name, location))
+        return tuple(locations)
         
         
 
 
-class UnicodeJSONResponse(JSONResponse):
-    def render(self, content) -> bytes:
-        return json.dumps(
-            content,
-            ensure_ascii=False,  # 👈 핵심! 한글을 유니코드 그대로 출력
-            separators=(',', ':'),
-            indent=None
-        ).encode('utf-8')  # 👈 UTF-8로 인코딩
-    
 class FixedSchedule(BaseModel):
     id: str
     name: str
@@ -809,14 +1242,23 @@ class ExtractScheduleResponse(BaseModel):
     fixedSchedules: List[FixedSchedule] = []
     flexibleSchedules: List[FlexibleSchedule] = []
 
-class LocationAnalysis(BaseModel):
+# 내부 전용 DTO (API 입력을 직접 검증하지 않으므로 슬롯 데이터클래스 사용)
+@dataclass(slots=True)
+class LocationAnalysis:
     place_name: str
     region: str
     district: str
     category: str
     search_keywords: List[str]
+    geographical_context: str = ""
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "LocationAnalysis":
+        """GPT 응답 dict에서 알려진 필드만 골라 생성 (나머지 키는 무시)"""
+        return cls(**{f.name: data[f.name] for f in fields(cls) if f.name in data})
 
-class PlaceResult(BaseModel):
+@dataclass(slots=True)
+class PlaceResult:
     name: str
     address: str
     latitude: float
@@ -827,48 +1269,34 @@ class PlaceResult(BaseModel):
 
 def safe_parse_json(json_str):
     """안전한 JSON 파싱 - 한글 지원"""
+    # 이미 파싱된 객체는 그대로 반환
+    if not isinstance(json_str, (str, bytes, bytearray)):
+        return json_str
+    
     try:
-        if isinstance(json_str, str):
-            # 한글 인코딩 문제 해결
+        try:
+            # orjson은 UTF-8 바이트도 디코딩 없이 바로 파싱
+            return orjson.loads(json_str)
+        except orjson.JSONDecodeError:
+            # 문자열 안의 제어 문자 등은 표준 json의 strict=False로 재시도
             return json.loads(json_str, strict=False)
-        else:
-            return json_str
-    except (json.JSONDecodeError, UnicodeDecodeError) as e:
+    except (json.JSONDecodeError, orjson.JSONDecodeError, UnicodeDecodeError) as e:
         logger.error(f"JSON 파싱 오류 (한글 포함): {str(e)}")
         return {
             "fixedSchedules": [],
             "flexibleSchedules": []
         }
 
-def normalize_priorities(schedules_data: Dict[str, Any]) -> Dict[str, Any]:
-    """우선순위를 정수로 정규화"""
-    logger.info("🔢 우선순위 정수 변환 시작")
-    
-    all_schedules = []
-    all_schedules.extend(schedules_data.get("fixedSchedules", []))
-    all_schedules.extend(schedules_data.get("flexibleSchedules", []))
-    
-    # 우선순위로 정렬
-    all_schedules.sort(key=lambda s: s.get("priority", 999))
-    
-    # 1부터 시작하는 정수로 재할당
-    for i, schedule in enumerate(all_schedules):
-        old_priority = schedule.get("priority", "없음")
-        new_priority = i + 1
-        schedule["priority"] = new_priority
-        logger.info(f"우선순위 정규화: '{schedule.get('name', '')}' {old_priority} → {new_priority}")
-    
-    # 다시 분류
-    fixed_schedules = [s for s in all_schedules if s.get("type") == "FIXED" and "startTime" in s]
-    flexible_schedules = [s for s in all_schedules if s.get("type") != "FIXED" or "startTime" not in s]
-    
-    logger.info(f"✅ 우선순위 정규화 완료: 고정 {len(fixed_schedules)}개, 유연 {len(flexible_schedules)}개")
-    
-    return {
-        "fixedSchedules": fixed_schedules,
-        "flexibleSchedules": flexible_schedules
-    }
 # ----- 주소 완전성 검증 및 재검색 시스템 -----
+# 주소 완전성 검증용 패턴 (모듈 로드 시 한 번만 컴파일)
+_DIGIT_RE = re.compile(r'\d+')
+_VAGUE_RE = re.compile("|".join(map(re.escape, ["근처", "인근", "주변", "근방", "부근", "일대", "동네"])))
+_ADDRESS_REGION_RE = re.compile("|".join(map(re.escape, [
+    "서울", "부산", "대구", "인천", "광주", "대전", "울산", "세종", "경기",
+    "강원", "충북", "충남", "전북", "전남", "경북", "경남", "제주"
+])))
+_DETAIL_RE = re.compile(r'[구시군동읍면로길가]')
+
 class AddressQualityChecker:
     """주소 완전성 검증 및 재검색 시스템"""
     
@@ -878,39 +1306,32 @@ class AddressQualityChecker:
         if not address or address.strip() == "":
             return False
         
-        # 기본 검증
-        address_lower = address.lower()
-        
         # 1. 너무 짧은 주소 (단어 2개 이하)
         words = [word for word in address.split() if len(word) > 1]
         if len(words) <= 2:
-            logger.info(f"❌ 주소 너무 짧음: {address} ({len(words)}개 단어)")
+            logger.debug("❌ 주소 너무 짧음: %s (%d개 단어)", address, len(words))
             return False
         
         # 2. 모호한 표현 체크
-        vague_terms = ["근처", "인근", "주변", "근방", "부근", "일대", "동네"]
-        if any(term in address for term in vague_terms):
-            logger.info(f"❌ 모호한 주소 표현: {address}")
+        if _VAGUE_RE.search(address):
+            logger.debug("❌ 모호한 주소 표현: %s", address)
             return False
         
         # 3. 한국 주소 필수 요소 체크
-        korean_regions = ["서울", "부산", "대구", "인천", "광주", "대전", "울산", "세종", "경기", "강원", "충북", "충남", "전북", "전남", "경북", "경남", "제주"]
-        has_region = any(region in address for region in korean_regions)
+        has_region = _ADDRESS_REGION_RE.search(address) is not None
         
         # 4. 상세 주소 요소 체크 (구/시/군 + 동/읍/면)
-        detail_keywords = ["구", "시", "군", "동", "읍", "면", "로", "길", "가"]
-        has_detail = any(keyword in address for keyword in detail_keywords)
+        has_detail = _DETAIL_RE.search(address) is not None
         
         # 5. 건물명이나 번지수 체크
-        import re
-        has_number = bool(re.search(r'\d+', address))
+        has_number = _DIGIT_RE.search(address) is not None
         
         quality_score = has_region + has_detail + has_number
         is_complete = quality_score >= 2  # 3점 만점에 2점 이상
         
-        logger.info(f"📊 주소 품질 점수: {quality_score}/3 - {address}")
-        logger.info(f"   지역포함: {has_region}, 상세요소: {has_detail}, 번지포함: {has_number}")
-        logger.info(f"   완전성: {'✅ 완전' if is_complete else '❌ 불완전'}")
+        if not is_complete:
+            logger.debug("📊 주소 품질 점수: %d/3 - %s (지역포함: %s, 상세요소: %s, 번지포함: %s)",
+                         quality_score, address, has_region, has_detail, has_number)
         
         return is_complete
     
@@ -933,7 +1354,7 @@ class AddressQualityChecker:
         for category, words in category_map.items():
             if any(word in name_lower for word in words):
                 keywords.extend(words)
-                logger.info(f"🏷️ 카테고리 '{category}' 감지: {words}")
+                logger.info("🏷️ 카테고리 '%s' 감지: %s", category, words)
                 break
         
         # 기본 키워드가 없으면 장소명 그대로 사용
@@ -942,6 +1363,15 @@ class AddressQualityChecker:
         
         return list(set(keywords))  # 중복 제거
     
+# 표준 지역명 → 축약 지역명 (예: 경상남 → 경남)
+_SHORT_NAME_MAP: Final = MappingProxyType({
+    '경상남': '경남', '경상북': '경북',
+    '전라남': '전남', '전라북': '전북',
+    '충청남': '충남', '충청북': '충북',
+    '강원특별자치': '강원', '제주특별자치': '제주'
+})
+_SHORT_NAME_RE: Final = re.compile("|".join(map(re.escape, _SHORT_NAME_MAP)))
+
 class RegionNormalizer:
     """지역명 정규화 및 매칭 엔진"""
     
@@ -953,6 +1383,7 @@ class RegionNormalizer:
         """정규화 맵을 동적으로 구축"""
         self.region_aliases = {}
         self.reverse_lookup = {}  # 🔥 추가된 부분
+        self._variants = {}  # 표준 지역명 → 중복 제거된 변형 튜플 (조회 시 재사용)
         
         for full_region, districts in self.regions_data.items():
             # 표준 지역명과 축약형 생성
@@ -964,6 +1395,7 @@ class RegionNormalizer:
             
             # 🔥 역방향 매핑도 저장
             self.reverse_lookup[full_region] = aliases
+            self._variants[full_region] = tuple(dict.fromkeys(aliases))
             
             for alias in aliases:
                 if alias and alias.strip():
@@ -979,112 +1411,466 @@ class RegionNormalizer:
     
     def _extract_short_name(self, full_name: str) -> str:
         """축약 지역명 추출 (예: 경상남도 → 경남)"""
-        short_map = {
-            '경상남': '경남', '경상북': '경북',
-            '전라남': '전남', '전라북': '전북', 
-            '충청남': '충남', '충청북': '충북',
-            '강원특별자치': '강원', '제주특별자치': '제주'
-        }
-        
         canonical = self._extract_canonical_name(full_name)
-        for long_form, short_form in short_map.items():
-            if long_form in canonical:
-                return short_form
-        return canonical
+        short_name = _SHORT_NAME_MAP.get(canonical)
+        if short_name is not None:
+            return short_name
+        
+        # 부분 문자열로 포함된 경우 한 번의 정규식 검색으로 처리
+        match = _SHORT_NAME_RE.search(canonical)
+        return _SHORT_NAME_MAP[match.group()] if match else canonical
     
-    def get_region_variants(self, region_name: str) -> List[str]:  # 🔥 이 메서드가 누락되어 있었음
-        """지역명의 모든 변형들을 반환"""
+    def get_region_variants(self, region_name: str) -> Tuple[str, ...]:  # 🔥 이 메서드가 누락되어 있었음
+        """지역명의 모든 변형들을 반환 (미리 만든 튜플을 그대로 공유)"""
         if not region_name:
-            return []
+            return ()
         
-        # 직접 매핑된 변형들 찾기
-        if region_name in self.reverse_lookup:
-            return self.reverse_lookup[region_name]
-        
-        # 정규화해서 찾기
-        variants = set([region_name])
-        for alias, standard in self.region_aliases.items():
-            if standard == region_name or alias == region_name:
-                variants.add(alias)
-                variants.add(standard)
-                if standard in self.reverse_lookup:
-                    variants.update(self.reverse_lookup[standard])
-        
-        return list(variants)
+        # 표준 지역명이면 바로, 변형이면 표준명으로 바꿔서 조회
+        variants = self._variants.get(region_name) or self._variants.get(self.region_aliases.get(region_name))
+        return variants if variants is not None else (region_name,)
+    
+    def normalize_region(self, region_name: str) -> str:
+        """지역명 변형을 표준 지역명으로 변환 (모르는 이름은 그대로)"""
+        return self.region_aliases.get(region_name, region_name)
 
 # 전역 인스턴스
 region_normalizer = RegionNormalizer()
 
-def check_region_match(address: str, reference_region: str) -> Tuple[bool, float]:
-    """
-    보편적 지역 매칭 함수
-    Returns: (is_match, confidence_score)
-    """
-    if not address or not reference_region:
-        return False, 0.0
-    
-    # 참조 지역 정규화
-    normalized_ref = region_normalizer.normalize_region(reference_region)
-    ref_aliases = region_normalizer.get_all_aliases(normalized_ref)
-    
-    # 주소에서 지역 추출 및 정규화
-    detected_regions = extract_regions_from_text(address)
-    
-    max_confidence = 0.0
-    is_match = False
-    
-    for detected in detected_regions:
-        normalized_detected = region_normalizer.normalize_region(detected)
-        
-        if normalized_detected == normalized_ref:
-            is_match = True
-            max_confidence = max(max_confidence, 1.0)  # 완전 일치
-        else:
-            # 부분 일치 점수 계산
-            similarity = calculate_region_similarity(normalized_ref, normalized_detected)
-            if similarity > 0.7:  # 70% 이상 유사하면 같은 지역으로 간주
-                is_match = True
-                max_confidence = max(max_confidence, similarity)
-    
-    return is_match, max_confidence
+@functools.lru_cache(maxsize=4096)
+def get_region_variants(region_name: str) -> Tuple[str, ...]:
+    """region_normalizer.get_region_variants 캐시 버전 (같은 지역명은 한 번만 계산)"""
+    return region_normalizer.get_region_variants(region_name)
 
-def extract_regions_from_text(text: str) -> List[str]:
-    """텍스트에서 지역명들을 추출"""
-    import re
-    
-    # 지역명 패턴들
-    patterns = [
-        r'([가-힣]+(?:특별시|광역시|특별자치시|특별자치도|도))',  # 시/도
-        r'([가-힣]+(?:시|군|구))',  # 시/군/구
-        r'([가-힣]+(?:동|읍|면))',  # 동/읍/면
-    ]
-    
-    regions = []
-    for pattern in patterns:
-        matches = re.findall(pattern, text)
-        regions.extend(matches)
-    
-    return list(set(regions))  # 중복 제거
+@functools.lru_cache(maxsize=256)
+def region_variant_matcher(region_name: str, region_short: str) -> KeywordMatcher:
+    """시/도의 모든 표기(정식명·축약명·별칭)를 한 번에 찾는 매처 (지역별로 캐시)"""
+    variants = (*get_region_variants(region_name), region_short, region_name)
+    return KeywordMatcher.from_keywords(dict.fromkeys(v for v in variants if v))
 
-def calculate_region_similarity(region1: str, region2: str) -> float:
-    """두 지역명의 유사도 계산 (0.0 ~ 1.0)"""
-    if region1 == region2:
-        return 1.0
+# 🔥 KOREA_REGIONS를 활용한 전국 주요 장소 → 구/시/군 매핑
+NATIONWIDE_AREAS: Final = MappingProxyType({
+    # 서울특별시
+    "서울특별시": {
+        "신길역": "영등포구", "서울역": "중구", "강남역": "강남구", 
+        "홍대": "마포구", "이태원": "용산구", "명동": "중구",
+        "잠실": "송파구", "강동": "강동구", "종로": "종로구",
+        "여의도": "영등포구", "성수": "성동구", "건대": "광진구",
+        "신촌": "서대문구", "압구정": "강남구", "청담": "강남구"
+    },
+    
+    # 부산광역시
+    "부산광역시": {
+        "부산역": "동구", "서면": "부산진구", "해운대": "해운대구",
+        "광안리": "수영구", "남포동": "중구", "센텀시티": "해운대구",
+        "부산대": "금정구", "장전역": "금정구", "온천장": "동래구",
+        "부산터미널": "동구", "사상": "사상구", "기장": "기장군"
+    },
+    
+    # 대구광역시
+    "대구광역시": {
+        "동성로": "중구", "수성구청": "수성구", "달서구청": "달서구",
+        "반월당": "중구", "두류": "달서구", "대구역": "북구",
+        "동대구역": "동구", "성서": "달서구", "칠곡": "북구"
+    },
+    
+    # 인천광역시
+    "인천광역시": {
+        "송도": "연수구", "부평": "부평구", "인천공항": "중구",
+        "구월동": "남동구", "인천역": "중구", "간석": "남동구",
+        "계양": "계양구", "서구청": "서구", "강화": "강화군"
+    },
+    
+    # 광주광역시
+    "광주광역시": {
+        "상무지구": "서구", "충장로": "동구", "광천터미널": "서구",
+        "첨단": "광산구", "북구청": "북구", "남구청": "남구"
+    },
+    
+    # 대전광역시
+    "대전광역시": {
+        "둔산": "서구", "유성온천": "유성구", "대전역": "동구",
+        "서대전": "서구", "중구청": "중구", "대덕": "대덕구"
+    },
+    
+    # 울산광역시
+    "울산광역시": {
+        "태화강": "중구", "울산대학교": "울주군", "현대중공업": "동구",
+        "남구청": "남구", "북구청": "북구", "언양": "울주군"
+    },
+    
+    # 세종특별자치시
+    "세종특별자치시": {
+        "세종시청": "세종시", "세종터미널": "세종시", "조치원": "세종시"
+    },
+    
+    # 경기도 주요 지역
+    "경기도": {
+        "수원역": "수원시", "성남시청": "성남시", "안양": "안양시",
+        "부천": "부천시", "고양": "고양시", "용인": "용인시",
+        "김포공항": "김포시", "일산": "고양시", "분당": "성남시",
+        "광명": "광명시", "시흥": "시흥시", "안산": "안산시",
+        "평택": "평택시", "화성": "화성시", "파주": "파주시"
+    },
+    
+    # 경상남도 주요 지역 🔥 양산 추가!
+    "경상남도": {
+        "양산시청": "양산시", "양산터미널": "양산시", "양산": "양산시",
+        "창원": "창원시", "진주": "진주시", "통영": "통영시",
+        "사천": "사천시", "김해": "김해시", "밀양": "밀양시",
+        "거제": "거제시", "의령": "의령군", "함안": "함안군",
+        "창녕": "창녕군", "고성": "고성군", "남해": "남해군",
+        "하동": "하동군", "산청": "산청군", "함양": "함양군",
+        "거창": "거창군", "합천": "합천군"
+    }
     
-    # 편집 거리 기반 유사도
-    from difflib import SequenceMatcher
-    return SequenceMatcher(None, region1, region2).ratio()
+    # 다른 지역들도 필요시 추가...
+})
+
+# 지역 좌표 (lat, lng) - Foursquare 검색 중심점, 읽기 전용
+REGION_COORDS: Final = MappingProxyType({
+    # 특별시·광역시
+    "서울특별시": (37.5665, 126.9780),
+    "부산광역시": (35.1796, 129.0756),
+    "대구광역시": (35.8714, 128.6014),
+    "인천광역시": (37.4563, 126.7052),
+    "광주광역시": (35.1595, 126.8526),
+    "대전광역시": (36.3504, 127.3845),
+    "울산광역시": (35.5384, 129.3114),
+    
+    # 특별자치시·특별자치도
+    "세종특별자치시": (36.4800, 127.2890),
+    "제주특별자치도": (33.4996, 126.5312),
+    
+    # 경기도 및 하위 시·군
+    "경기도": (37.4138, 127.5183),
+    "가평군": (37.8313, 127.5109),
+    "고양시": (37.6584, 126.8320),
+    "과천시": (37.4292, 126.9876),
+    "광명시": (37.4784, 126.8664),
+    "광주시": (37.4297, 127.2550),
+    "구리시": (37.5943, 127.1296),
+    "군포시": (37.3614, 126.9350),
+    "김포시": (37.6150, 126.7158),
+    "남양주시": (37.6369, 127.2165),
+    "동두천시": (37.9036, 127.0606),
+    "부천시": (37.5036, 126.7660),
+    "성남시": (37.4201, 127.1262),
+    "수원시": (37.2636, 127.0286),
+    "시흥시": (37.3803, 126.8030),
+    "안산시": (37.3236, 126.8219),
+    "안성시": (37.0078, 127.2797),
+    "안양시": (37.3943, 126.9568),
+    "양주시": (37.7853, 127.0456),
+    "양평군": (37.4916, 127.4874),
+    "여주시": (37.2982, 127.6376),
+    "연천군": (38.0960, 127.0751),
+    "오산시": (37.1499, 127.0776),
+    "용인시": (37.2411, 127.1776),
+    "의왕시": (37.3448, 126.9687),
+    "의정부시": (37.7381, 127.0339),
+    "이천시": (37.2724, 127.4349),
+    "파주시": (37.7598, 126.7800),
+    "평택시": (36.9921, 127.1127),
+    "포천시": (37.8950, 127.2003),
+    "하남시": (37.5394, 127.2147),
+    "화성시": (37.1996, 126.8310),
+    
+    # 강원특별자치도 및 하위 시·군  
+    "강원특별자치도": (37.8228, 128.1555),
+    "강릉시": (37.7519, 128.8761),
+    "고성군": (38.3806, 128.4678),
+    "동해시": (37.5244, 129.1144),
+    "삼척시": (37.4501, 129.1649),
+    "속초시": (38.2070, 128.5918),
+    "양구군": (38.1065, 127.9897),
+    "양양군": (38.0759, 128.6190),
+    "영월군": (37.1839, 128.4617),
+    "원주시": (37.3422, 127.9202),
+    "인제군": (38.0695, 128.1707),
+    "정선군": (37.3801, 128.6607),
+    "철원군": (38.1465, 127.3134),
+    "춘천시": (37.8813, 127.7298),
+    "태백시": (37.1641, 128.9856),
+    "평창군": (37.3708, 128.3897),
+    "홍천군": (37.6971, 127.8888),
+    "화천군": (38.1063, 127.7082),
+    "횡성군": (37.4916, 127.9856),
+    
+    # 충청북도 및 하위 시·군
+    "충청북도": (36.4919, 127.7417),
+    "괴산군": (36.8154, 127.7874),
+    "단양군": (36.9845, 128.3659),
+    "보은군": (36.4894, 127.7293),
+    "영동군": (36.1750, 127.7764),
+    "옥천군": (36.3061, 127.5721),
+    "음성군": (36.9433, 127.6864),
+    "제천시": (37.1326, 128.1909),
+    "증평군": (36.7848, 127.5814),
+    "진천군": (36.8565, 127.4335),
+    "청주시": (36.4919, 127.7417),
+    "충주시": (36.9910, 127.9259),
+    
+    # 충청남도 및 하위 시·군
+    "충청남도": (36.5184, 126.8000),
+    "계룡시": (36.2742, 127.2489),
+    "공주시": (36.4464, 127.1248),
+    "금산군": (36.1088, 127.4881),
+    "논산시": (36.1872, 127.0985),
+    "당진시": (36.8934, 126.6292),
+    "보령시": (36.3334, 126.6127),
+    "부여군": (36.2756, 126.9098),
+    "서산시": (36.7848, 126.4503),
+    "서천군": (36.0805, 126.6919),
+    "아산시": (36.7898, 127.0019),
+    "예산군": (36.6826, 126.8503),
+    "천안시": (36.8151, 127.1139),
+    "청양군": (36.4590, 126.8025),
+    "태안군": (36.7456, 126.2983),
+    "홍성군": (36.6012, 126.6608),
+    
+    # 전북특별자치도 및 하위 시·군
+    "전북특별자치도": (35.7175, 127.1530),
+    "고창군": (35.4346, 126.7017),
+    "군산시": (35.9678, 126.7368),
+    "김제시": (35.8033, 126.8805),
+    "남원시": (35.4163, 127.3906),
+    "무주군": (36.0073, 127.6610),
+    "부안군": (35.7318, 126.7332),
+    "순창군": (35.3748, 127.1374),
+    "완주군": (35.9058, 127.1649),
+    "익산시": (35.9483, 126.9575),
+    "임실군": (35.6176, 127.2896),
+    "장수군": (35.6477, 127.5217),
+    "전주시": (35.8242, 127.1480),
+    "정읍시": (35.5700, 126.8557),
+    "진안군": (35.7917, 127.4244),
+    
+    # 전라남도 및 하위 시·군
+    "전라남도": (34.8679, 126.9910),
+    "강진군": (34.6417, 126.7669),
+    "고흥군": (34.6111, 127.2855),
+    "곡성군": (35.2818, 127.2914),
+    "광양시": (34.9406, 127.5956),
+    "구례군": (35.2020, 127.4632),
+    "나주시": (35.0160, 126.7107),
+    "담양군": (35.3214, 126.9882),
+    "목포시": (34.8118, 126.3922),
+    "무안군": (34.9900, 126.4816),
+    "보성군": (34.7712, 127.0800),
+    "순천시": (34.9507, 127.4872),
+    "신안군": (34.8267, 126.1063),
+    "여수시": (34.7604, 127.6622),
+    "영광군": (35.2773, 126.5120),
+    "영암군": (34.8000, 126.6968),
+    "완도군": (34.3105, 126.7551),
+    "장성군": (35.3017, 126.7886),
+    "장흥군": (34.6816, 126.9066),
+    "진도군": (34.4867, 126.2636),
+    "함평군": (35.0666, 126.5168),
+    "해남군": (34.5736, 126.5986),
+    "화순군": (35.0648, 126.9855),
+    
+    # 경상북도 및 하위 시·군
+    "경상북도": (36.4919, 128.8889),
+    "경산시": (35.8251, 128.7411),
+    "경주시": (35.8562, 129.2247),
+    "고령군": (35.7284, 128.2634),
+    "구미시": (36.1196, 128.3441),
+    "군위군": (36.2393, 128.5717),
+    "김천시": (36.1395, 128.1137),
+    "문경시": (36.5866, 128.1866),
+    "봉화군": (36.8932, 128.7327),
+    "상주시": (36.4107, 128.1590),
+    "성주군": (35.9186, 128.2829),
+    "안동시": (36.5684, 128.7294),
+    "영덕군": (36.4153, 129.3655),
+    "영양군": (36.6666, 129.1124),
+    "영주시": (36.8056, 128.6239),
+    "영천시": (35.9733, 128.9386),
+    "예천군": (36.6580, 128.4517),
+    "울릉군": (37.4845, 130.9058),
+    "울진군": (36.9930, 129.4004),
+    "의성군": (36.3526, 128.6974),
+    "청도군": (35.6477, 128.7363),
+    "청송군": (36.4359, 129.0572),
+    "칠곡군": (35.9951, 128.4019),
+    "포항시": (36.0190, 129.3435),
+    
+    # 경상남도 및 하위 시·군
+    "경상남도": (35.4606, 128.2132),
+    "거제시": (34.8804, 128.6212),
+    "거창군": (35.6869, 127.9095),
+    "고성군": (34.9735, 128.3229),
+    "김해시": (35.2342, 128.8899),
+    "남해군": (34.8375, 127.8926),
+    "밀양시": (35.5040, 128.7469),
+    "사천시": (35.0036, 128.0645),
+    "산청군": (35.4150, 127.8736),
+    "양산시": (35.3350, 129.0371),
+    "의령군": (35.3219, 128.2618),
+    "진주시": (35.1800, 128.1076),
+    "창녕군": (35.5444, 128.4924),
+    "창원시": (35.2281, 128.6811),
+    "통영시": (34.8544, 128.4331),
+    "하동군": (35.0675, 127.7514),
+    "함안군": (35.2730, 128.4069),
+    "함양군": (35.5203, 127.7252),
+    "합천군": (35.5666, 128.1655),
+})
+_DEFAULT_COORDS: Final = (37.5665, 126.9780)  # 서울 시청
+# Foursquare ll 파라미터 문자열도 미리 만들어 둠
+REGION_LL: Final = MappingProxyType({region: f"{lat},{lng}" for region, (lat, lng) in REGION_COORDS.items()})
+_DEFAULT_LL: Final = "{},{}".format(*_DEFAULT_COORDS)
+
+# 장소명 → (시/도, 구/시/군) 역색인
+# 여러 시/도에 같은 장소명이 있으면 KOREA_REGIONS 순서상 뒤쪽 시/도가 우선 (기존 순회 결과와 동일)
+_LANDMARK_ORDER = [
+    (place_name, region_name, district)
+    for region_name in reversed(list(KOREA_REGIONS))
+    if region_name in NATIONWIDE_AREAS
+    for place_name, district in NATIONWIDE_AREAS[region_name].items()
+]
+PLACE_TO_REGION: Dict[str, Tuple[str, str]] = {}
+for _place, _region, _district in _LANDMARK_ORDER:
+    PLACE_TO_REGION.setdefault(_place, (_region, _district))
+_LANDMARK_MATCHER = KeywordMatcher.from_keywords(place for place, _, _ in _LANDMARK_ORDER)
+
+# 시/도 이름(전체명·축약명)과 시/도별 구/시/군 매처 - 문장 한 번 스캔으로 지역 판별
+_REGION_NAME_MATCHER = KeywordMatcher(
+    {region_name: (region_short, region_name) for region_name, region_short in REGION_SHORT_MAP.items()}
+)
+_ROUTE_REGION_MATCHER = KeywordMatcher(
+    {region_name: (shorten_region(region_name, _PROVINCE_SUFFIXES),) for region_name in KOREA_REGIONS}
+)
+_DISTRICT_MATCHERS: Final = MappingProxyType(
+    {region_name: KeywordMatcher.from_keywords(districts) for region_name, districts in KOREA_REGIONS.items()}
+)
+
+# Foursquare 검색어 분류용 키워드 매처 (검색어/장소명 한 번 스캔으로 분류)
+_FSQ_SPECIFIC_PLACE_MATCHER = KeywordMatcher.from_keywords(('대학교', '경기장', '월드컵', '공항', '역'))
+_FSQ_FOOD_PLACE_MATCHER = KeywordMatcher.from_keywords(("식당", "restaurant", "식사", "밥", "저녁", "점심"))
+_FSQ_CAFE_PLACE_MATCHER = KeywordMatcher.from_keywords(("카페", "cafe", "커피"))
+_FSQ_FOOD_FILTER_MATCHER = KeywordMatcher.from_keywords(('restaurant', '식당', 'food'))
+_FSQ_FOOD_SCORING_MATCHER = KeywordMatcher.from_keywords(('restaurant', '식당', 'food', '식사', '밥'))
+_FSQ_CAFE_QUERY_MATCHER = KeywordMatcher.from_keywords(('cafe', 'coffee', '커피'))
+_FSQ_STRICT_MATCHER = KeywordMatcher.from_keywords(('restaurant', '식당', 'cafe'))
+
+@functools.lru_cache(maxsize=1024)
+def classify_fsq_strategy(strategy_lower: str) -> Tuple[str, str, int]:
+    """Foursquare 검색어 분류 → (categories 파라미터, 채점 종류 food/cafe/"", 최소 점수)"""
+    if _FSQ_FOOD_FILTER_MATCHER.contains_any(strategy_lower):
+        category_filter = "13000"  # Food & Dining
+    elif _FSQ_CAFE_QUERY_MATCHER.contains_any(strategy_lower):
+        category_filter = "13032,13040"  # Cafe, Coffee Shop
+    else:
+        category_filter = ""
+
+    if _FSQ_FOOD_SCORING_MATCHER.contains_any(strategy_lower):
+        scoring_kind = "food"
+    elif _FSQ_CAFE_QUERY_MATCHER.contains_any(strategy_lower):
+        scoring_kind = "cafe"
+    else:
+        scoring_kind = ""
+
+    # 🔥 엄격한 기준 적용 (식사/카페는 카테고리 필수)
+    min_score = 5 if _FSQ_STRICT_MATCHER.contains_any(strategy_lower) else 3
+    return category_filter, scoring_kind, min_score
+
+# 검색 중심 기준 후보 허용 범위 (위경도 ±0.3° ≈ 30km, 검색 반경 15km의 두 배 여유)
+_FSQ_BBOX_DEGREES = 0.3
+
+# 이 점수 이상이면 더 볼 필요 없이 바로 채택 (카테고리 5 + 시/도·구 일치 6 수준)
+_FSQ_HIGH_CONFIDENCE_SCORE = 10
+
+# Foursquare 후보 필터/채점용 키워드 (모듈 로드 시 한 번만 생성)
+# (각 목록을 하나의 정규식으로 묶어 후보마다 한 번만 스캔)
+_FSQ_NEGATIVE_MATCHER = KeywordMatcher.from_keywords((
+    "학원", "병원", "의원", "약국", "은행", "부동산",
+    "유학", "학회", "컨설팅", "사무실", "office",
+    "academy", "hospital", "clinic", "bank",
+    "real estate", "study abroad", "immigration",
+    "consulting", "law firm", "immigration office",
+    "어학원", "컨설턴트", "이민", "법무법인"
+))
+_FSQ_FOOD_CATEGORY_MATCHER = KeywordMatcher.from_keywords((
+    "restaurant", "food", "dining", "korean", "chinese",
+    "japanese", "italian", "american", "thai", "indian",
+    "식당", "음식점", "레스토랑", "eatery", "bistro",
+    "steakhouse", "pizzeria", "noodle", "barbecue"
+))
+_FSQ_CAFE_CATEGORY_MATCHER = KeywordMatcher.from_keywords(("cafe", "coffee", "bakery", "dessert", "카페", "tea"))
+
+def score_fsq_candidate(place_name_lower: str, address: str, category_names: List[str], scoring_kind: str,
+                        region_keywords: Tuple[str, ...], search_terms: Tuple[str, ...]) -> Tuple[bool, int, int, int]:
+    """Foursquare 후보 한 개 채점 → (카테고리 일치 여부, 카테고리 점수, 지역 점수, 이름 점수)
+
+    place_name_lower/category_names는 소문자로 변환된 값, region_keywords/search_terms는 검색 단위로 미리 계산한 값.
+    """
+    # 1) 카테고리 적합성 (식사/카페 검색은 카테고리 필수)
+    #    키워드에 줄바꿈이 없으므로 줄바꿈으로 이어 붙여도 카테고리 경계를 넘는 매칭은 생기지 않음
+    if scoring_kind == "food":
+        category_match = _FSQ_FOOD_CATEGORY_MATCHER.contains_any("\n".join(category_names))
+        category_score = 5 if category_match else 0
+    elif scoring_kind == "cafe":
+        category_match = _FSQ_CAFE_CATEGORY_MATCHER.contains_any("\n".join(category_names))
+        category_score = 5 if category_match else 0
+    else:
+        category_match, category_score = True, 2  # 기타 검색은 카테고리 제한 없음
+
+    # 2) 지역 일치
+    region_score = 3 * sum(1 for keyword in region_keywords if keyword in address)
+
+    # 3) 이름 유사도 - 검색어 토큰에는 공백이 없으므로 "어느 단어에 포함"은 "이름 전체에 포함"과 같음
+    name_score = 2 * sum(1 for term in search_terms if term in place_name_lower)
+
+    return category_match, category_score, region_score, name_score
+
+# Kakao 후보 채점용 키워드 매처 (검색어 분류는 전략당 한 번, 후보마다 정규식 한 번 스캔)
+_KAKAO_MEAL_QUERY_MATCHER = KeywordMatcher.from_keywords(("맛집", "식당", "밥"))
+_KAKAO_RESTAURANT_CATEGORY_MATCHER = KeywordMatcher.from_keywords(("음식점", "식당", "레스토랑", "한식", "중식", "일식", "양식"))
+_KAKAO_CAFE_CATEGORY_MATCHER = KeywordMatcher.from_keywords(("카페", "커피", "디저트"))
+_KAKAO_NEGATIVE_MATCHER = KeywordMatcher.from_keywords(("학원", "병원", "의원", "약국", "은행", "부동산", "유학", "학회", "컨설팅"))
+# 한국에서 동명이인 가능성 높은 구명들 (여러 광역시에 같은 이름이 있음)
+_COMMON_DISTRICT_NAMES: Final = frozenset(("중구", "동구", "서구", "남구", "북구"))
+
+# Kakao 검색 전략 분류용 장소명 키워드 (구체적 장소 → 식사/카페 순으로 판별)
+_KAKAO_SPECIFIC_PLACE_MATCHER = KeywordMatcher.from_keywords(('역', '대학교', '경기장', '공항', '병원', '마트', '터미널'))
+_KAKAO_MEAL_PLACE_MATCHER = KeywordMatcher.from_keywords(('식사', '식당', '밥', '카페', '커피', '맛집'))
+
+# Google 검색 전략 표: (분류, 장소명 키워드, 검색어 템플릿) - 장소명 한 번 스캔으로 해당 분류를 모두 찾아 순서대로 전개
+_GOOGLE_STRATEGY_TABLE: Final = (
+    ("specific", ('대학교', '경기장', '월드컵'), ("{region} {place}", "{place}")),
+    ("food", ('식당', 'restaurant'), ("{region} {district} restaurant", "{region} 맛집")),
+    ("cafe", ('카페', 'cafe'), ("{region} {district} cafe", "{region} 카페")),
+)
+_GOOGLE_STRATEGY_MATCHER = KeywordMatcher({label: keywords for label, keywords, _ in _GOOGLE_STRATEGY_TABLE})
+
+# Google 장소명 키워드 → 적합한 장소 타입 (앞쪽 키워드 우선, 해당 없으면 타입 제한 없음)
+_GOOGLE_EXPECTED_TYPES: Final = (
+    ("식당", frozenset(("restaurant", "food", "meal_takeaway"))),
+    ("카페", frozenset(("cafe", "bakery"))),
+    ("대학교", frozenset(("university", "school"))),
+    ("경기장", frozenset(("stadium", "gym"))),
+)
+
 class TripleLocationSearchService:
     """Foursquare + Kakao + Google 3중 위치 검색 서비스"""
     
     # app.py의 TripleLocationSearchService 클래스 내부
     @staticmethod
     async def analyze_location_with_gpt(text: str, reference_location: Optional[str] = None, route_context: Optional[str] = None) -> LocationAnalysis:
+        """GPT로 정확한 지역과 장소 분석 (같은 입력은 캐시 재사용, GPT 실패 시 기본값은 캐시하지 않음)"""
+        return await _ANALYSIS_CACHE.get_or_set(
+            (text, reference_location, route_context),
+            lambda: TripleLocationSearchService._analyze_location_with_gpt(text, reference_location, route_context),
+            cache_if=lambda analysis: analysis.geographical_context != _FALLBACK_GEO_CONTEXT
+        )
+
+    @staticmethod
+    async def _analyze_location_with_gpt(text: str, reference_location: Optional[str] = None, route_context: Optional[str] = None) -> LocationAnalysis:
         """GPT로 정확한 지역과 장소 분석 - 경로 맥락과 참조 위치 추가"""
         
-        # set을 list로 변환하여 JSON 직렬화 가능하게 만들기
-        korea_regions_list = {region: list(districts) for region, districts in KOREA_REGIONS.items()}
-        regions_text = json.dumps(korea_regions_list, ensure_ascii=False, indent=2)
+        regions_text = KOREA_REGIONS_JSON
         
         # 참조 위치 정보 추가
         reference_context = ""
@@ -1099,116 +1885,19 @@ class TripleLocationSearchService:
             route_context_text += "\n'중간에' 같은 표현이 있으면 경로상의 중간 지점에서 검색하세요."
             
             # 경로에서 지역 추출하여 중간 지점 지역 결정
-            import re
-            route_pattern = r'(.+?)에서\s*(.+?)까지'
-            match = re.search(route_pattern, route_context)
+            match = _ROUTE_RE.search(route_context)
             if match:
                 start_place = match.group(1).strip()
                 end_place = match.group(2).strip()
                 
-                # 🔥 KOREA_REGIONS를 활용한 전국 지역 매핑
-                nationwide_areas = {
-                    # 서울특별시
-                    "서울특별시": {
-                        "신길역": "영등포구", "서울역": "중구", "강남역": "강남구", 
-                        "홍대": "마포구", "이태원": "용산구", "명동": "중구",
-                        "잠실": "송파구", "강동": "강동구", "종로": "종로구",
-                        "여의도": "영등포구", "성수": "성동구", "건대": "광진구",
-                        "신촌": "서대문구", "압구정": "강남구", "청담": "강남구"
-                    },
-                    
-                    # 부산광역시
-                    "부산광역시": {
-                        "부산역": "동구", "서면": "부산진구", "해운대": "해운대구",
-                        "광안리": "수영구", "남포동": "중구", "센텀시티": "해운대구",
-                        "부산대": "금정구", "장전역": "금정구", "온천장": "동래구",
-                        "부산터미널": "동구", "사상": "사상구", "기장": "기장군"
-                    },
-                    
-                    # 대구광역시
-                    "대구광역시": {
-                        "동성로": "중구", "수성구청": "수성구", "달서구청": "달서구",
-                        "반월당": "중구", "두류": "달서구", "대구역": "북구",
-                        "동대구역": "동구", "성서": "달서구", "칠곡": "북구"
-                    },
-                    
-                    # 인천광역시
-                    "인천광역시": {
-                        "송도": "연수구", "부평": "부평구", "인천공항": "중구",
-                        "구월동": "남동구", "인천역": "중구", "간석": "남동구",
-                        "계양": "계양구", "서구청": "서구", "강화": "강화군"
-                    },
-                    
-                    # 광주광역시
-                    "광주광역시": {
-                        "상무지구": "서구", "충장로": "동구", "광천터미널": "서구",
-                        "첨단": "광산구", "북구청": "북구", "남구청": "남구"
-                    },
-                    
-                    # 대전광역시
-                    "대전광역시": {
-                        "둔산": "서구", "유성온천": "유성구", "대전역": "동구",
-                        "서대전": "서구", "중구청": "중구", "대덕": "대덕구"
-                    },
-                    
-                    # 울산광역시
-                    "울산광역시": {
-                        "태화강": "중구", "울산대학교": "울주군", "현대중공업": "동구",
-                        "남구청": "남구", "북구청": "북구", "언양": "울주군"
-                    },
-                    
-                    # 세종특별자치시
-                    "세종특별자치시": {
-                        "세종시청": "세종시", "세종터미널": "세종시", "조치원": "세종시"
-                    },
-                    
-                    # 경기도 주요 지역
-                    "경기도": {
-                        "수원역": "수원시", "성남시청": "성남시", "안양": "안양시",
-                        "부천": "부천시", "고양": "고양시", "용인": "용인시",
-                        "김포공항": "김포시", "일산": "고양시", "분당": "성남시",
-                        "광명": "광명시", "시흥": "시흥시", "안산": "안산시",
-                        "평택": "평택시", "화성": "화성시", "파주": "파주시"
-                    },
-                    
-                    # 경상남도 주요 지역 🔥 양산 추가!
-                    "경상남도": {
-                        "양산시청": "양산시", "양산터미널": "양산시", "양산": "양산시",
-                        "창원": "창원시", "진주": "진주시", "통영": "통영시",
-                        "사천": "사천시", "김해": "김해시", "밀양": "밀양시",
-                        "거제": "거제시", "의령": "의령군", "함안": "함안군",
-                        "창녕": "창녕군", "고성": "고성군", "남해": "남해군",
-                        "하동": "하동군", "산청": "산청군", "함양": "함양군",
-                        "거창": "거창군", "합천": "합천군"
-                    }
-                    
-                    # 다른 지역들도 필요시 추가...
-                }
-                
-                # 출발지와 도착지 지역 찾기
-                start_region = None
-                start_district = None
-                end_region = None
-                end_district = None
                 
-                # 🔥 KOREA_REGIONS에서 전국 검색
-                for region_name, districts in KOREA_REGIONS.items():
-                    if region_name in nationwide_areas:
-                        area_mapping = nationwide_areas[region_name]
-                        
-                        # 출발지 검색
-                        for place_name, district in area_mapping.items():
-                            if place_name in start_place:
-                                start_region = region_name
-                                start_district = district
-                                break
-                        
-                        # 도착지 검색
-                        for place_name, district in area_mapping.items():
-                            if place_name in end_place:
-                                end_region = region_name
-                                end_district = district
-                                break
+                # 출발지와 도착지 지역 찾기 (역색인 + 한 번의 스캔)
+                start_region, start_district = PLACE_TO_REGION.get(
+                    _LANDMARK_MATCHER.first_keyword(start_place), (None, None)
+                )
+                end_region, end_district = PLACE_TO_REGION.get(
+                    _LANDMARK_MATCHER.first_keyword(end_place), (None, None)
+                )
                 
                 # 중간 지역 결정 로직
                 if start_region and end_region:
@@ -1254,7 +1943,9 @@ class TripleLocationSearchService:
     """
 
         try:
-            response = openai_client.chat.completions.create(
+            # 동기 OpenAI 클라이언트라 스레드 풀에서 실행 (여러 일정 분석이 이벤트 루프를 막지 않고 동시에 진행)
+            response = await run_in_executor(
+                openai_client.chat.completions.create,
                 model="gpt-4o",
                 messages=[
                     {
@@ -1265,25 +1956,23 @@ class TripleLocationSearchService:
                 ],
                 temperature=0.1,
                 max_tokens=500,
+                response_format={"type": "json_object"},
             )
 
-            content = response.choices[0].message.content.strip()
-            if content.startswith("```json"):
-                content = content.replace("```json", "").replace("```", "").strip()
-            
-            data = json.loads(content)
+            # JSON 모드라 코드 블록 없이 순수 JSON 객체만 옴
+            data = orjson.loads(response.choices[0].message.content)
             
             # 응답에 geographical_context가 없으면 기본값 추가
             if "geographical_context" not in data:
                 data["geographical_context"] = "기본 분석"
             
-            logger.info(f"🧠 GPT 지역 분석 완료: {data.get('region')} {data.get('district')} - {data.get('place_name')}")
-            logger.info(f"🗺️ 지리적 맥락: {data.get('geographical_context')}")
+            logger.info("🧠 GPT 지역 분석 완료: %s %s - %s", data.get('region'), data.get('district'), data.get('place_name'))
+            logger.info("🗺️ 지리적 맥락: %s", data.get('geographical_context'))
             
-            return LocationAnalysis(**data)
+            return LocationAnalysis.from_dict(data)
             
         except Exception as e:
-            logger.error(f"❌ GPT 지역 분석 실패: {e}")
+            logger.error("❌ GPT 지역 분석 실패: %s", e)
             
             # 🔥 전국 기본값 설정 (KOREA_REGIONS 활용)
             default_region = "서울특별시"
@@ -1291,28 +1980,20 @@ class TripleLocationSearchService:
             
             if reference_location:
                 # 🔥 KOREA_REGIONS에서 지역 추출
-                for region_name in KOREA_REGIONS.keys():
-                    region_short = region_name.replace('특별시', '').replace('광역시', '').replace('특별자치시', '').replace('특별자치도', '').replace('도', '')
-                    if region_short in reference_location or region_name in reference_location:
-                        default_region = region_name
-                        
-                        # 해당 지역의 구/시/군 찾기
-                        districts = KOREA_REGIONS[region_name]
-                        for district in districts:
-                            if district in reference_location:
-                                default_district = district
-                                break
-                        break
+                region_name = _REGION_NAME_MATCHER.first_label(reference_location)
+                if region_name:
+                    default_region = region_name
+                    
+                    # 해당 지역의 구/시/군 찾기
+                    district = _DISTRICT_MATCHERS[region_name].first_keyword(reference_location)
+                    if district:
+                        default_district = district
             
             elif route_context:
                 # 경로 맥락에서 지역 추출 (KOREA_REGIONS 활용)
-                for region_name in KOREA_REGIONS.keys():
-                    region_short = region_name.replace('특별시', '').replace('광역시', '').replace('도', '')
-                    if region_short in route_context:
-                        default_region = region_name
-                        break
+                default_region = _ROUTE_REGION_MATCHER.first_label(route_context) or default_region
             
-            logger.info(f"🔄 기본값 사용: {default_region} {default_district}")
+            logger.info("🔄 기본값 사용: %s %s", default_region, default_district)
             
             # 기본값 반환
             return LocationAnalysis(
@@ -1321,11 +2002,19 @@ class TripleLocationSearchService:
                 district=default_district,
                 category="장소",
                 search_keywords=[f"{default_district} {text}", text],
-                geographical_context="기본값 적용"
+                geographical_context=_FALLBACK_GEO_CONTEXT
             )
 
     @staticmethod
     async def search_foursquare(analysis: LocationAnalysis) -> Optional[PlaceResult]:
+        """Foursquare 검색 (같은 장소명/지역은 캐시 재사용)"""
+        return await _PROVIDER_SEARCH_CACHE.get_or_set(
+            ("foursquare", analysis.place_name, analysis.region, analysis.district),
+            lambda: TripleLocationSearchService._search_foursquare(analysis)
+        )
+
+    @staticmethod
+    async def _search_foursquare(analysis: LocationAnalysis) -> Optional[PlaceResult]:
         """3순위: Foursquare API 검색 - 카테고리 필터링 강화"""
         if not FOURSQUARE_API_KEY:
             logger.warning("❌ Foursquare API 키가 없습니다")
@@ -1334,220 +2023,26 @@ class TripleLocationSearchService:
         logger.info(f"🔍 3순위 Foursquare 검색: {analysis.place_name}")
         
         try:
-            # 지역 좌표 (기존과 동일)
-            region_coords = {
-                # 특별시·광역시
-                "서울특별시": {"lat": 37.5665, "lng": 126.9780},
-                "부산광역시": {"lat": 35.1796, "lng": 129.0756},
-                "대구광역시": {"lat": 35.8714, "lng": 128.6014},
-                "인천광역시": {"lat": 37.4563, "lng": 126.7052},
-                "광주광역시": {"lat": 35.1595, "lng": 126.8526},
-                "대전광역시": {"lat": 36.3504, "lng": 127.3845},
-                "울산광역시": {"lat": 35.5384, "lng": 129.3114},
-                
-                # 특별자치시·특별자치도
-                "세종특별자치시": {"lat": 36.4800, "lng": 127.2890},
-                "제주특별자치도": {"lat": 33.4996, "lng": 126.5312},
-                
-                # 경기도 및 하위 시·군
-                "경기도": {"lat": 37.4138, "lng": 127.5183},
-                "가평군": {"lat": 37.8313, "lng": 127.5109},
-                "고양시": {"lat": 37.6584, "lng": 126.8320},
-                "과천시": {"lat": 37.4292, "lng": 126.9876},
-                "광명시": {"lat": 37.4784, "lng": 126.8664},
-                "광주시": {"lat": 37.4297, "lng": 127.2550},
-                "구리시": {"lat": 37.5943, "lng": 127.1296},
-                "군포시": {"lat": 37.3614, "lng": 126.9350},
-                "김포시": {"lat": 37.6150, "lng": 126.7158},
-                "남양주시": {"lat": 37.6369, "lng": 127.2165},
-                "동두천시": {"lat": 37.9036, "lng": 127.0606},
-                "부천시": {"lat": 37.5036, "lng": 126.7660},
-                "성남시": {"lat": 37.4201, "lng": 127.1262},
-                "수원시": {"lat": 37.2636, "lng": 127.0286},
-                "시흥시": {"lat": 37.3803, "lng": 126.8030},
-                "안산시": {"lat": 37.3236, "lng": 126.8219},
-                "안성시": {"lat": 37.0078, "lng": 127.2797},
-                "안양시": {"lat": 37.3943, "lng": 126.9568},
-                "양주시": {"lat": 37.7853, "lng": 127.0456},
-                "양평군": {"lat": 37.4916, "lng": 127.4874},
-                "여주시": {"lat": 37.2982, "lng": 127.6376},
-                "연천군": {"lat": 38.0960, "lng": 127.0751},
-                "오산시": {"lat": 37.1499, "lng": 127.0776},
-                "용인시": {"lat": 37.2411, "lng": 127.1776},
-                "의왕시": {"lat": 37.3448, "lng": 126.9687},
-                "의정부시": {"lat": 37.7381, "lng": 127.0339},
-                "이천시": {"lat": 37.2724, "lng": 127.4349},
-                "파주시": {"lat": 37.7598, "lng": 126.7800},
-                "평택시": {"lat": 36.9921, "lng": 127.1127},
-                "포천시": {"lat": 37.8950, "lng": 127.2003},
-                "하남시": {"lat": 37.5394, "lng": 127.2147},
-                "화성시": {"lat": 37.1996, "lng": 126.8310},
-                
-                # 강원특별자치도 및 하위 시·군  
-                "강원특별자치도": {"lat": 37.8228, "lng": 128.1555},
-                "강릉시": {"lat": 37.7519, "lng": 128.8761},
-                "고성군": {"lat": 38.3806, "lng": 128.4678},
-                "동해시": {"lat": 37.5244, "lng": 129.1144},
-                "삼척시": {"lat": 37.4501, "lng": 129.1649},
-                "속초시": {"lat": 38.2070, "lng": 128.5918},
-                "양구군": {"lat": 38.1065, "lng": 127.9897},
-                "양양군": {"lat": 38.0759, "lng": 128.6190},
-                "영월군": {"lat": 37.1839, "lng": 128.4617},
-                "원주시": {"lat": 37.3422, "lng": 127.9202},
-                "인제군": {"lat": 38.0695, "lng": 128.1707},
-                "정선군": {"lat": 37.3801, "lng": 128.6607},
-                "철원군": {"lat": 38.1465, "lng": 127.3134},
-                "춘천시": {"lat": 37.8813, "lng": 127.7298},
-                "태백시": {"lat": 37.1641, "lng": 128.9856},
-                "평창군": {"lat": 37.3708, "lng": 128.3897},
-                "홍천군": {"lat": 37.6971, "lng": 127.8888},
-                "화천군": {"lat": 38.1063, "lng": 127.7082},
-                "횡성군": {"lat": 37.4916, "lng": 127.9856},
-                
-                # 충청북도 및 하위 시·군
-                "충청북도": {"lat": 36.4919, "lng": 127.7417},
-                "괴산군": {"lat": 36.8154, "lng": 127.7874},
-                "단양군": {"lat": 36.9845, "lng": 128.3659},
-                "보은군": {"lat": 36.4894, "lng": 127.7293},
-                "영동군": {"lat": 36.1750, "lng": 127.7764},
-                "옥천군": {"lat": 36.3061, "lng": 127.5721},
-                "음성군": {"lat": 36.9433, "lng": 127.6864},
-                "제천시": {"lat": 37.1326, "lng": 128.1909},
-                "증평군": {"lat": 36.7848, "lng": 127.5814},
-                "진천군": {"lat": 36.8565, "lng": 127.4335},
-                "청주시": {"lat": 36.4919, "lng": 127.7417},
-                "충주시": {"lat": 36.9910, "lng": 127.9259},
-                
-                # 충청남도 및 하위 시·군
-                "충청남도": {"lat": 36.5184, "lng": 126.8000},
-                "계룡시": {"lat": 36.2742, "lng": 127.2489},
-                "공주시": {"lat": 36.4464, "lng": 127.1248},
-                "금산군": {"lat": 36.1088, "lng": 127.4881},
-                "논산시": {"lat": 36.1872, "lng": 127.0985},
-                "당진시": {"lat": 36.8934, "lng": 126.6292},
-                "보령시": {"lat": 36.3334, "lng": 126.6127},
-                "부여군": {"lat": 36.2756, "lng": 126.9098},
-                "서산시": {"lat": 36.7848, "lng": 126.4503},
-                "서천군": {"lat": 36.0805, "lng": 126.6919},
-                "아산시": {"lat": 36.7898, "lng": 127.0019},
-                "예산군": {"lat": 36.6826, "lng": 126.8503},
-                "천안시": {"lat": 36.8151, "lng": 127.1139},
-                "청양군": {"lat": 36.4590, "lng": 126.8025},
-                "태안군": {"lat": 36.7456, "lng": 126.2983},
-                "홍성군": {"lat": 36.6012, "lng": 126.6608},
-                
-                # 전북특별자치도 및 하위 시·군
-                "전북특별자치도": {"lat": 35.7175, "lng": 127.1530},
-                "고창군": {"lat": 35.4346, "lng": 126.7017},
-                "군산시": {"lat": 35.9678, "lng": 126.7368},
-                "김제시": {"lat": 35.8033, "lng": 126.8805},
-                "남원시": {"lat": 35.4163, "lng": 127.3906},
-                "무주군": {"lat": 36.0073, "lng": 127.6610},
-                "부안군": {"lat": 35.7318, "lng": 126.7332},
-                "순창군": {"lat": 35.3748, "lng": 127.1374},
-                "완주군": {"lat": 35.9058, "lng": 127.1649},
-                "익산시": {"lat": 35.9483, "lng": 126.9575},
-                "임실군": {"lat": 35.6176, "lng": 127.2896},
-                "장수군": {"lat": 35.6477, "lng": 127.5217},
-                "전주시": {"lat": 35.8242, "lng": 127.1480},
-                "정읍시": {"lat": 35.5700, "lng": 126.8557},
-                "진안군": {"lat": 35.7917, "lng": 127.4244},
-                
-                # 전라남도 및 하위 시·군
-                "전라남도": {"lat": 34.8679, "lng": 126.9910},
-                "강진군": {"lat": 34.6417, "lng": 126.7669},
-                "고흥군": {"lat": 34.6111, "lng": 127.2855},
-                "곡성군": {"lat": 35.2818, "lng": 127.2914},
-                "광양시": {"lat": 34.9406, "lng": 127.5956},
-                "구례군": {"lat": 35.2020, "lng": 127.4632},
-                "나주시": {"lat": 35.0160, "lng": 126.7107},
-                "담양군": {"lat": 35.3214, "lng": 126.9882},
-                "목포시": {"lat": 34.8118, "lng": 126.3922},
-                "무안군": {"lat": 34.9900, "lng": 126.4816},
-                "보성군": {"lat": 34.7712, "lng": 127.0800},
-                "순천시": {"lat": 34.9507, "lng": 127.4872},
-                "신안군": {"lat": 34.8267, "lng": 126.1063},
-                "여수시": {"lat": 34.7604, "lng": 127.6622},
-                "영광군": {"lat": 35.2773, "lng": 126.5120},
-                "영암군": {"lat": 34.8000, "lng": 126.6968},
-                "완도군": {"lat": 34.3105, "lng": 126.7551},
-                "장성군": {"lat": 35.3017, "lng": 126.7886},
-                "장흥군": {"lat": 34.6816, "lng": 126.9066},
-                "진도군": {"lat": 34.4867, "lng": 126.2636},
-                "함평군": {"lat": 35.0666, "lng": 126.5168},
-                "해남군": {"lat": 34.5736, "lng": 126.5986},
-                "화순군": {"lat": 35.0648, "lng": 126.9855},
-                
-                # 경상북도 및 하위 시·군
-                "경상북도": {"lat": 36.4919, "lng": 128.8889},
-                "경산시": {"lat": 35.8251, "lng": 128.7411},
-                "경주시": {"lat": 35.8562, "lng": 129.2247},
-                "고령군": {"lat": 35.7284, "lng": 128.2634},
-                "구미시": {"lat": 36.1196, "lng": 128.3441},
-                "군위군": {"lat": 36.2393, "lng": 128.5717},
-                "김천시": {"lat": 36.1395, "lng": 128.1137},
-                "문경시": {"lat": 36.5866, "lng": 128.1866},
-                "봉화군": {"lat": 36.8932, "lng": 128.7327},
-                "상주시": {"lat": 36.4107, "lng": 128.1590},
-                "성주군": {"lat": 35.9186, "lng": 128.2829},
-                "안동시": {"lat": 36.5684, "lng": 128.7294},
-                "영덕군": {"lat": 36.4153, "lng": 129.3655},
-                "영양군": {"lat": 36.6666, "lng": 129.1124},
-                "영주시": {"lat": 36.8056, "lng": 128.6239},
-                "영천시": {"lat": 35.9733, "lng": 128.9386},
-                "예천군": {"lat": 36.6580, "lng": 128.4517},
-                "울릉군": {"lat": 37.4845, "lng": 130.9058},
-                "울진군": {"lat": 36.9930, "lng": 129.4004},
-                "의성군": {"lat": 36.3526, "lng": 128.6974},
-                "청도군": {"lat": 35.6477, "lng": 128.7363},
-                "청송군": {"lat": 36.4359, "lng": 129.0572},
-                "칠곡군": {"lat": 35.9951, "lng": 128.4019},
-                "포항시": {"lat": 36.0190, "lng": 129.3435},
-                
-                # 경상남도 및 하위 시·군
-                "경상남도": {"lat": 35.4606, "lng": 128.2132},
-                "거제시": {"lat": 34.8804, "lng": 128.6212},
-                "거창군": {"lat": 35.6869, "lng": 127.9095},
-                "고성군": {"lat": 34.9735, "lng": 128.3229},
-                "김해시": {"lat": 35.2342, "lng": 128.8899},
-                "남해군": {"lat": 34.8375, "lng": 127.8926},
-                "밀양시": {"lat": 35.5040, "lng": 128.7469},
-                "사천시": {"lat": 35.0036, "lng": 128.0645},
-                "산청군": {"lat": 35.4150, "lng": 127.8736},
-                "양산시": {"lat": 35.3350, "lng": 129.0371},
-                "의령군": {"lat": 35.3219, "lng": 128.2618},
-                "진주시": {"lat": 35.1800, "lng": 128.1076},
-                "창녕군": {"lat": 35.5444, "lng": 128.4924},
-                "창원시": {"lat": 35.2281, "lng": 128.6811},
-                "통영시": {"lat": 34.8544, "lng": 128.4331},
-                "하동군": {"lat": 35.0675, "lng": 127.7514},
-                "함안군": {"lat": 35.2730, "lng": 128.4069},
-                "함양군": {"lat": 35.5203, "lng": 127.7252},
-                "합천군": {"lat": 35.5666, "lng": 128.1655},
-            }
-                        
-            coords = region_coords.get(analysis.region, {"lat": 37.5665, "lng": 126.9780})
+            ll = REGION_LL.get(analysis.region, _DEFAULT_LL)
+            center_lat, center_lng = REGION_COORDS.get(analysis.region, _DEFAULT_COORDS)
             
             url = "https://api.foursquare.com/v3/places/search"
-            headers = {
-                "Authorization": FOURSQUARE_API_KEY,
-                "Accept": "application/json"
-            }
+            headers = _FSQ_HEADERS
             
             # 🔥 카테고리별 강화된 검색 전략
             search_strategies = []
             
             # 1) 구체적인 장소명 (대학교, 경기장 등)
-            if any(keyword in analysis.place_name.lower() for keyword in ['대학교', '경기장', '월드컵', '공항', '역']):
+            place_lower = analysis.place_name.lower()
+            if _FSQ_SPECIFIC_PLACE_MATCHER.contains_any(place_lower):
                 search_strategies.append(analysis.place_name)
                 
             # 2) 지역명 + 장소명
-            region_name = analysis.region.replace('특별시', '').replace('광역시', '')
+            region_name = shorten_region(analysis.region, _METRO_SUFFIXES)
             search_strategies.append(f"{region_name} {analysis.place_name}")
             
             # 3) 🔥 카테고리별 특화 검색 (강화됨)
-            place_lower = analysis.place_name.lower()
-            if any(word in place_lower for word in ["식당", "restaurant", "식사", "밥", "저녁", "점심"]):
+            if _FSQ_FOOD_PLACE_MATCHER.contains_any(place_lower):
                 search_strategies.extend([
                     f"{region_name} restaurant",
                     f"{region_name} 식당",
@@ -1555,7 +2050,7 @@ class TripleLocationSearchService:
                     f"{analysis.district} restaurant"
                 ])
                 logger.info(f"🍽️ 식사 카테고리 검색 추가")
-            elif any(word in place_lower for word in ["카페", "cafe", "커피"]):
+            elif _FSQ_CAFE_PLACE_MATCHER.contains_any(place_lower):
                 search_strategies.extend([
                     f"{region_name} cafe",
                     f"{region_name} 커피",
@@ -1563,159 +2058,129 @@ class TripleLocationSearchService:
                 ])
                 logger.info(f"☕ 카페 카테고리 검색 추가")
             
+            # 후보 채점에 쓰는 값은 검색 단위로 한 번만 계산
+            region_keywords = tuple(keyword for keyword in (region_name, analysis.district) if keyword)
+            search_terms = tuple(term for term in place_lower.split() if len(term) > 1)
+            
+            # 공백 정규화 후 중복 제거 (순서 유지) - 같은 검색어로 API를 두 번 부르지 않도록
+            search_strategies = list(dict.fromkeys(" ".join(strategy.split()) for strategy in search_strategies))
             logger.info(f"🔍 Foursquare 검색 전략: {search_strategies}")
             
-            for strategy in search_strategies:
+            def build_fsq_result(place: Dict, place_name: str, address: str, location: Dict) -> PlaceResult:
+                """선택된 Foursquare 후보로 결과 생성"""
+                result = PlaceResult(
+                    name=place_name,
+                    address=address,
+                    latitude=location["latitude"],
+                    longitude=location["longitude"],
+                    source="foursquare",
+                    rating=place.get("rating")
+                )
+                logger.info("🎉 Foursquare 필터링 검색 성공! 🏪 %s 📍 %s", result.name, result.address)
+                return result
+            
+            async def try_strategy(strategy: str) -> Optional[PlaceResult]:
+                """검색어 하나로 Foursquare 검색 (기준을 넘는 결과가 없으면 None)"""
                 try:
                     params = {
                         "query": strategy,
-                        "ll": f"{coords['lat']},{coords['lng']}",
+                        "ll": ll,
                         "radius": 15000,  # 15km
                         "limit": 20,      # 더 많은 결과
                         "sort": "DISTANCE"
                     }
                     
-                    # 🔥 식사 관련이면 카테고리 필터 추가
-                    if any(word in strategy.lower() for word in ['restaurant', '식당', 'food']):
-                        params["categories"] = "13000"  # Food & Dining
-                        logger.info(f"🍽️ 식당 카테고리 필터 적용")
-                    elif any(word in strategy.lower() for word in ['cafe', 'coffee', '커피']):
-                        params["categories"] = "13032,13040"  # Cafe, Coffee Shop
-                        logger.info(f"☕ 카페 카테고리 필터 적용")
+                    # 🔥 검색어는 한 번만 분류해서 필터/채점/최소 점수에 재사용
+                    category_filter, scoring_kind, min_score = classify_fsq_strategy(strategy.lower())
+                    
+                    # 🔥 식사/카페 관련이면 카테고리 필터 추가
+                    if category_filter:
+                        params["categories"] = category_filter
+                        logger.info(f"🏷️ 카테고리 필터 적용: {category_filter}")
                     
                     logger.info(f"🔍 Foursquare 검색어: '{strategy}'")
                     
-                    async with aiohttp.ClientSession() as session:
-                        async with session.get(url, headers=headers, params=params) as response:
-                            if response.status == 200:
-                                data = await response.json()
+                    session = get_http_session()
+                    async with session.get(url, headers=headers, params=params) as response:
+                        if response.status == 200:
+                            data = await response.json(loads=orjson.loads)
+                            
+                            if data.get("results"):
+                                logger.info(f"✅ Foursquare 결과 {len(data['results'])}개 발견")
                                 
-                                if data.get("results"):
-                                    logger.info(f"✅ Foursquare 결과 {len(data['results'])}개 발견")
+                                # 🔥 카테고리 일치 점수 계산 강화 (후보별 로그는 DEBUG에서만)
+                                debug_enabled = logger.isEnabledFor(logging.DEBUG)
+                                best = None  # (점수, 장소, 주소, 이름, 좌표) - 기준은 넘었지만 확신도가 낮은 최선 후보
+                                for i, place in enumerate(data["results"]):
+                                    location = place.get("geocodes", {}).get("main", {})
+                                    address = place.get("location", {}).get("formatted_address", "")
+                                    place_name = place.get("name", "")
+                                    place_name_lower = place_name.lower()  # 후보당 한 번만 변환
+                                    categories = place.get("categories", [])
                                     
-                                    # 🔥 카테고리 일치 점수 계산 강화
-                                    for i, place in enumerate(data["results"]):
-                                        location = place.get("geocodes", {}).get("main", {})
-                                        address = place.get("location", {}).get("formatted_address", "")
-                                        place_name = place.get("name", "")
-                                        categories = place.get("categories", [])
-                                        
-                                        logger.info(f"   후보 {i+1}: {place_name} - {address}")
-                                        logger.info(f"     카테고리: {[cat.get('name') for cat in categories]}")
-                                        
-                                        if not (location.get("latitude") and location.get("longitude")):
-                                            logger.info(f"     ❌ 좌표 정보 없음")
-                                            continue
-                                        
-                                        # 🔥 강화된 필터링
-                                        
-                                        # 1) 부정적 키워드 필터 (대폭 강화)
-                                        negative_keywords = [
-                                            "학원", "병원", "의원", "약국", "은행", "부동산", 
-                                            "유학", "학회", "컨설팅", "사무실", "office", 
-                                            "academy", "hospital", "clinic", "bank",
-                                            "real estate", "study abroad", "immigration",
-                                            "consulting", "law firm", "immigration office",
-                                            "어학원", "컨설턴트", "이민", "법무법인"
-                                        ]
-                                        
-                                        is_negative = any(neg in place_name.lower() for neg in negative_keywords)
-                                        
-                                        if is_negative:
-                                            logger.info(f"     ❌ 부정 키워드 필터링: {place_name}")
-                                            continue
-                                        
-                                        # 2) 카테고리 적합성 확인 (대폭 강화)
-                                        category_match = False
-                                        category_score = 0
-                                        
-                                        if any(word in strategy.lower() for word in ['restaurant', '식당', 'food', '식사', '밥']):
-                                            # 식당 카테고리 확인
-                                            food_categories = [
-                                                "restaurant", "food", "dining", "korean", "chinese", 
-                                                "japanese", "italian", "american", "thai", "indian",
-                                                "식당", "음식점", "레스토랑", "eatery", "bistro",
-                                                "steakhouse", "pizzeria", "noodle", "barbecue"
-                                            ]
-                                            for cat in categories:
-                                                cat_name = cat.get("name", "").lower()
-                                                if any(food_cat in cat_name for food_cat in food_categories):
-                                                    category_match = True
-                                                    category_score += 5
-                                                    logger.info(f"     ✅ 식당 카테고리 일치: {cat_name}")
-                                                    break
-                                                    
-                                        elif any(word in strategy.lower() for word in ['cafe', 'coffee', '커피']):
-                                            # 카페 카테고리 확인
-                                            cafe_categories = ["cafe", "coffee", "bakery", "dessert", "카페", "tea"]
-                                            for cat in categories:
-                                                cat_name = cat.get("name", "").lower()
-                                                if any(cafe_cat in cat_name for cafe_cat in cafe_categories):
-                                                    category_match = True
-                                                    category_score += 5
-                                                    logger.info(f"     ✅ 카페 카테고리 일치: {cat_name}")
-                                                    break
-                                        else:
-                                            category_match = True  # 기타 검색은 카테고리 제한 없음
-                                            category_score += 2
-                                        
-                                        # 3) 지역 일치 확인
-                                        region_score = 0
-                                        region_keywords = [
-                                            analysis.region.replace('특별시', '').replace('광역시', ''),
-                                            analysis.district
-                                        ]
-                                        
-                                        for keyword in region_keywords:
-                                            if keyword and keyword in address:
-                                                region_score += 3
-                                                logger.info(f"     ✅ 지역 일치: {keyword}")
-                                        
-                                        # 4) 이름 유사도 확인
-                                        name_score = 0
-                                        search_terms = analysis.place_name.lower().split()
-                                        place_terms = place_name.lower().split()
-                                        
-                                        for term in search_terms:
-                                            if len(term) > 1:
-                                                if any(term in pt for pt in place_terms):
-                                                    name_score += 2
-                                        
-                                        # 5) 총점 계산
-                                        total_score = category_score + region_score + name_score
-                                        
-                                        logger.info(f"     📊 점수: 카테고리={category_score} + 지역={region_score} + 이름={name_score} = {total_score}")
-                                        
-                                        # 🔥 엄격한 기준 적용 (식사/카페는 카테고리 필수)
-                                        min_score = 5 if any(word in strategy.lower() for word in ['restaurant', '식당', 'cafe']) else 3
-                                        
-                                        if category_match and total_score >= min_score:
-                                            result = PlaceResult(
-                                                name=place_name,
-                                                address=address,
-                                                latitude=location["latitude"],
-                                                longitude=location["longitude"],
-                                                source="foursquare",
-                                                rating=place.get("rating")
-                                            )
-                                            
-                                            logger.info(f"🎉 Foursquare 필터링 검색 성공!")
-                                            logger.info(f"   🏪 장소: {result.name}")
-                                            logger.info(f"   📍 주소: {result.address}")
-                                            logger.info(f"   🏷️ 카테고리: {[cat.get('name') for cat in categories]}")
-                                            return result
-                                        else:
-                                            logger.info(f"     ❌ 기준 미달: 카테고리매치={category_match}, 점수={total_score} < {min_score}")
+                                    if debug_enabled:
+                                        logger.debug("   후보 %d: %s - %s", i + 1, place_name, address)
+                                        logger.debug("     카테고리: %s", categories)
                                     
-                                    logger.info(f"⚠️ 검색어 '{strategy}' - 적절한 결과 없음")
-                                else:
-                                    logger.info(f"⚠️ 검색어 '{strategy}' - 결과 없음")
-                            else:
-                                logger.warning(f"⚠️ Foursquare API 오류: {response.status}")
+                                    if not (location.get("latitude") and location.get("longitude")):
+                                        if debug_enabled:
+                                            logger.debug("     ❌ 좌표 정보 없음")
+                                        continue
+                                    
+                                    # 검색 중심에서 너무 먼 후보는 채점 전에 제외 (위경도 박스 비교)
+                                    if (abs(location["latitude"] - center_lat) > _FSQ_BBOX_DEGREES
+                                            or abs(location["longitude"] - center_lng) > _FSQ_BBOX_DEGREES):
+                                        if debug_enabled:
+                                            logger.debug("     ❌ 검색 영역 밖 후보")
+                                        continue
+                                    
+                                    # 🔥 강화된 필터링
+                                    
+                                    # 1) 부정적 키워드 필터 (대폭 강화)
+                                    if _FSQ_NEGATIVE_MATCHER.contains_any(place_name_lower):
+                                        if debug_enabled:
+                                            logger.debug("     ❌ 부정 키워드 필터링: %s", place_name)
+                                        continue
+                                    
+                                    # 2) 카테고리/지역/이름 점수
+                                    category_match, category_score, region_score, name_score = score_fsq_candidate(
+                                        place_name_lower, address, [(cat.get("name") or "").lower() for cat in categories],
+                                        scoring_kind, region_keywords, search_terms
+                                    )
+                                    total_score = category_score + region_score + name_score
+                                    
+                                    if debug_enabled:
+                                        logger.debug("     📊 점수: 카테고리=%d + 지역=%d + 이름=%d = %d",
+                                                     category_score, region_score, name_score, total_score)
+                                    
+                                    if category_match and total_score >= min_score:
+                                        # 확신도가 충분히 높으면 나머지 후보는 채점하지 않고 바로 반환
+                                        if total_score >= _FSQ_HIGH_CONFIDENCE_SCORE:
+                                            return build_fsq_result(place, place_name, address, location)
+                                        # 동점이면 먼저 나온(더 가까운) 후보 유지
+                                        if best is None or total_score > best[0]:
+                                            best = (total_score, place, place_name, address, location)
+                                    elif debug_enabled:
+                                        logger.debug("     ❌ 기준 미달: 카테고리매치=%s, 점수=%d < %d",
+                                                     category_match, total_score, min_score)
+                                
+                                if best is not None:
+                                    return build_fsq_result(*best[1:])
                                 
+                                logger.info(f"⚠️ 검색어 '{strategy}' - 적절한 결과 없음")
+                            else:
+                                logger.info(f"⚠️ 검색어 '{strategy}' - 결과 없음")
+                        else:
+                            logger.warning(f"⚠️ Foursquare API 오류: {response.status}")
+                            
                 except Exception as e:
                     logger.error(f"❌ 검색어 '{strategy}' 오류: {e}")
-                    continue
+                return None
+            
+            # 🔥 모든 검색어를 동시에 요청하되, 결과는 전략 우선순위 순서대로 확인
+            result = await first_in_priority(try_strategy(strategy) for strategy in search_strategies)
+            if result:
+                return result
                     
         except Exception as e:
             logger.error(f"❌ Foursquare 전체 검색 오류: {e}")
@@ -1745,29 +2210,23 @@ class TripleLocationSearchService:
         logger.info(f"🔄 재검색 시작 - 카테고리 키워드: {category_keywords}")
         
         # 4단계: 확장 검색 (반경 확대 + 카테고리 키워드)
-        for radius in [1000, 2000, 5000, 10000]:  # 1km → 10km까지 확대
+        enhanced_queries = [f"{analysis.region} {analysis.district} {keyword}" for keyword in category_keywords]
+        
+        for radius_index, radius in enumerate([1000, 2000, 5000, 10000]):  # 1km → 10km까지 확대
             logger.info(f"🔍 확장 검색 (반경 {radius}m)")
             
-            for keyword in category_keywords:
-                enhanced_query = f"{analysis.region} {analysis.district} {keyword}"
-                
-                # Kakao 확장 검색
-                kakao_result = await TripleLocationSearchService.search_kakao_enhanced(
-                    analysis, enhanced_query, radius
-                )
-                
-                if kakao_result and AddressQualityChecker.is_complete_address(kakao_result.address):
-                    logger.info(f"✅ Kakao 확장 검색 성공: {kakao_result.address}")
-                    return kakao_result
-                
-                # Google 확장 검색
-                google_result = await TripleLocationSearchService.search_google_enhanced(
-                    analysis, enhanced_query
-                )
-                
-                if google_result and AddressQualityChecker.is_complete_address(google_result.address):
-                    logger.info(f"✅ Google 확장 검색 성공: {google_result.address}")
-                    return google_result
+            # 🔥 반경마다 모든 키워드를 한 번에 요청 (Google은 반경을 쓰지 않으므로 첫 반경에서만)
+            searches = []
+            for enhanced_query in enhanced_queries:
+                searches.append(TripleLocationSearchService.search_kakao_enhanced(analysis, enhanced_query, radius))
+                if radius_index == 0:
+                    searches.append(TripleLocationSearchService.search_google_enhanced(analysis, enhanced_query))
+            
+            # 키워드 순서대로, 같은 키워드는 Kakao 우선으로 완전한 주소 선택
+            for candidate in await asyncio.gather(*searches):
+                if candidate and AddressQualityChecker.is_complete_address(candidate.address):
+                    logger.info(f"✅ {candidate.source} 확장 검색 성공: {candidate.address}")
+                    return candidate
         
         # 5단계: 모든 검색 실패시 기본값 반환 (주소가 완전하지 않더라도)
         if result:
@@ -1785,7 +2244,7 @@ class TripleLocationSearchService:
             
         try:
             url = "https://dapi.kakao.com/v2/local/search/keyword.json"
-            headers = {"Authorization": f"KakaoAK {KAKAO_REST_API_KEY}"}
+            headers = _KAKAO_HEADERS
             
             params = {
                 "query": query,
@@ -1793,25 +2252,22 @@ class TripleLocationSearchService:
                 "radius": radius
             }
             
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url, headers=headers, params=params) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        
-                        if data.get("documents"):
-                            # 가장 완전한 주소를 가진 결과 선택
-                            for place in data["documents"]:
-                                address = place.get("road_address_name") or place.get("address_name", "")
+            data = await fetch_api_json("Kakao", url, params, headers)
+            if data is not None:
+                if data.get("documents"):
+                    # 가장 완전한 주소를 가진 결과 선택
+                    for place in data["documents"]:
+                        address = place.get("road_address_name") or place.get("address_name", "")
+                            
+                        if AddressQualityChecker.is_complete_address(address):
+                            return PlaceResult(
+                                name=place.get("place_name", analysis.place_name),
+                                address=address,
+                                latitude=float(place.get("y", 0)),
+                                longitude=float(place.get("x", 0)),
+                                source="kakao_enhanced"
+                            )
                                 
-                                if AddressQualityChecker.is_complete_address(address):
-                                    return PlaceResult(
-                                        name=place.get("place_name", analysis.place_name),
-                                        address=address,
-                                        latitude=float(place.get("y", 0)),
-                                        longitude=float(place.get("x", 0)),
-                                        source="kakao_enhanced"
-                                    )
-                                    
         except Exception as e:
             logger.error(f"❌ Kakao 확장 검색 오류: {e}")
         
@@ -1827,7 +2283,7 @@ class TripleLocationSearchService:
             url = "https://maps.googleapis.com/maps/api/place/findplacefromtext/json"
             
             # 지역 제한 강화
-            region_query = f"{analysis.region.replace('특별시', '').replace('광역시', '')} {analysis.district} {query}"
+            region_query = f"{shorten_region(analysis.region, _METRO_SUFFIXES)} {analysis.district} {query}"
             
             params = {
                 'input': region_query,
@@ -1838,31 +2294,28 @@ class TripleLocationSearchService:
                 'key': GOOGLE_MAPS_API_KEY
             }
             
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url, params=params) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        
-                        if data.get('status') == 'OK' and data.get('candidates'):
-                            for place in data['candidates']:
-                                address = place.get('formatted_address', '')
-                                
-                                # 지역 일치 확인 강화
-                                region_match = any(region_name in address for region_name in 
-                                                 [analysis.region.replace('특별시', '').replace('광역시', ''), 
-                                                  analysis.district])
+            data = await fetch_api_json("Google", url, params)
+            if data is not None:
+                if data.get('status') == 'OK' and data.get('candidates'):
+                    for place in data['candidates']:
+                        address = place.get('formatted_address', '')
+                            
+                        # 지역 일치 확인 강화
+                        region_match = any(region_name in address for region_name in 
+                                         [shorten_region(analysis.region, _METRO_SUFFIXES), 
+                                          analysis.district])
+                            
+                        if AddressQualityChecker.is_complete_address(address) and region_match:
+                            location = place['geometry']['location']
+                            return PlaceResult(
+                                name=place.get('name', analysis.place_name),
+                                address=address,
+                                latitude=location['lat'],
+                                longitude=location['lng'],
+                                source="google_enhanced",
+                                rating=place.get('rating')
+                            )
                                 
-                                if AddressQualityChecker.is_complete_address(address) and region_match:
-                                    location = place['geometry']['location']
-                                    return PlaceResult(
-                                        name=place.get('name', analysis.place_name),
-                                        address=address,
-                                        latitude=location['lat'],
-                                        longitude=location['lng'],
-                                        source="google_enhanced",
-                                        rating=place.get('rating')
-                                    )
-                                    
         except Exception as e:
             logger.error(f"❌ Google 확장 검색 오류: {e}")
         
@@ -1873,6 +2326,18 @@ class TripleLocationSearchService:
 
     @staticmethod
     async def search_kakao(analysis: LocationAnalysis, reference_schedules: List[Dict] = None) -> Optional[PlaceResult]:
+        """Kakao 검색 (같은 장소명/지역/참조 위치는 캐시 재사용)"""
+        # 본체와 같은 규칙으로 참조 위치 결정 (위치가 있는 첫 참조 일정)
+        ref_location = next(
+            (ref.get("location") for ref in reference_schedules or () if ref.get("location")), ""
+        )
+        return await _PROVIDER_SEARCH_CACHE.get_or_set(
+            ("kakao", analysis.place_name, analysis.region, analysis.district, ref_location),
+            lambda: TripleLocationSearchService._search_kakao(analysis, reference_schedules)
+        )
+
+    @staticmethod
+    async def _search_kakao(analysis: LocationAnalysis, reference_schedules: List[Dict] = None) -> Optional[PlaceResult]:
         """1순위: Kakao API 검색 - 지역 매칭 로직 개선 (동명이인 방지)"""
         if not KAKAO_REST_API_KEY:
             logger.warning("❌ Kakao API 키가 없습니다")
@@ -1880,12 +2345,7 @@ class TripleLocationSearchService:
             
         logger.info(f"🔍 1순위 Kakao 검색: {analysis.place_name}")
         
-        # 🔥 KOREA_REGIONS에서 전국 구/시/군 정보 추출
-        all_districts = []
-        for region, districts in KOREA_REGIONS.items():
-            all_districts.extend(list(districts))
-        
-        logger.info(f"📍 전국 구/시/군 {len(all_districts)}개 지역 대응")
+        logger.info(f"📍 전국 구/시/군 {len(_ALL_DISTRICTS)}개 지역 대응")
         
         # 🔥 참조 위치에서 정확한 지역 정보 추출 (시/도 + 구/시/군)
         reference_region = None
@@ -1898,24 +2358,20 @@ class TripleLocationSearchService:
                 if ref_location:
                     logger.info(f"📍 참조 위치 분석: {ref_location}")
                     
-                    # 시/도 정보 추출 (더 정확하게)
-                    for region_key, districts in KOREA_REGIONS.items():
-                        region_short = region_key.replace('특별시', '').replace('광역시', '').replace('특별자치시', '').replace('특별자치도', '').replace('도', '')
-                        if region_short in ref_location or region_key in ref_location:
-                            reference_region = region_key
-                            logger.info(f"   📍 참조 시/도: {region_key}")
-                            
-                            # 해당 시/도의 구/시/군만 확인
-                            for district in districts:
-                                if district in ref_location:
-                                    reference_district = district
-                                    logger.info(f"   📍 참조 구/시/군: {district}")
-                                    break
-                            break
+                    # 시/도 정보 추출 (시/도 이름 매처로 한 번에 스캔)
+                    region_key = _REGION_NAME_MATCHER.first_label(ref_location)
+                    if region_key:
+                        reference_region = region_key
+                        logger.info(f"   📍 참조 시/도: {region_key}")
+                        
+                        # 해당 시/도의 구/시/군만 확인
+                        district = _DISTRICT_MATCHERS[region_key].first_keyword(ref_location)
+                        if district:
+                            reference_district = district
+                            logger.info(f"   📍 참조 구/시/군: {district}")
                     
                     # 동 정보도 추출 시도
-                    import re
-                    dong_match = re.search(r'(\w+동)', ref_location)
+                    dong_match = _DONG_RE.search(ref_location)
                     if dong_match:
                         reference_dong = dong_match.group(1)
                         logger.info(f"   📍 참조 동: {reference_dong}")
@@ -1928,19 +2384,8 @@ class TripleLocationSearchService:
             if not address or not reference_region:
                 return False
             
-            # 모든 지역 변형들 가져오기
-            region_variants = region_normalizer.get_region_variants(reference_region)
-            
-            # 기존 변수들도 포함
-            all_variants = region_variants + [reference_region_short, reference_region]
-            all_variants = list(set(all_variants))  # 중복 제거
-            
-            # 매칭 확인
-            for variant in all_variants:
-                if variant and variant in address:
-                    return True
-            
-            return False
+            # 모든 지역 변형(기존 변수 포함)을 묶은 매처로 주소를 한 번만 스캔
+            return region_variant_matcher(reference_region, reference_region_short).contains_any(address)
 
         def check_district_match_improved(address: str, reference_district: str) -> bool:
             """개선된 구/시/군 매칭"""
@@ -1961,26 +2406,30 @@ class TripleLocationSearchService:
 
         try:
             url = "https://dapi.kakao.com/v2/local/search/keyword.json"
-            headers = {"Authorization": f"KakaoAK {KAKAO_REST_API_KEY}"}
+            headers = _KAKAO_HEADERS
+            
+            # 전략/후보 채점에 쓰는 축약 지역명 (후보와 무관하므로 검색당 한 번만 계산)
+            reference_region_short = shorten_region(reference_region) if reference_region else None
+            analysis_region_short = shorten_region(analysis.region, _PROVINCE_SUFFIXES)
             
             # 🔥 동명이인 방지 검색 전략
             search_strategies = []
             
+            place_lower = analysis.place_name.lower()
+            
             # 1) 구체적 장소명 (역, 대학교 등)은 지역 제한 없이
-            if any(keyword in analysis.place_name.lower() for keyword in ['역', '대학교', '경기장', '공항', '병원', '마트', '터미널']):
+            if _KAKAO_SPECIFIC_PLACE_MATCHER.contains_any(place_lower):
                 search_strategies.append(analysis.place_name)
                 if reference_district and reference_region:
                     # 시/도 + 구/시/군 함께 검색
-                    region_short = reference_region.replace('특별시', '').replace('광역시', '').replace('도', '')
+                    region_short = shorten_region(reference_region, _PROVINCE_SUFFIXES)
                     search_strategies.append(f"{region_short} {reference_district} {analysis.place_name}")
                 search_strategies.append(f"{analysis.district} {analysis.place_name}")
             
             # 2) 🔥 식사/카페는 반드시 정확한 지역으로 검색 (시/도 + 구/시/군)
-            elif any(word in analysis.place_name.lower() for word in ['식사', '식당', '밥', '카페', '커피', '맛집']):
+            elif _KAKAO_MEAL_PLACE_MATCHER.contains_any(place_lower):
                 
                 if reference_district and reference_region:
-                    reference_region_short = reference_region.replace('특별시', '').replace('광역시', '').replace('특별자치시', '').replace('특별자치도', '').replace('도', '')
-                    
                     # A) 동 단위 검색 (시/도 + 구/시/군 + 동)
                     if reference_dong:
                         search_strategies.extend([
@@ -2002,7 +2451,6 @@ class TripleLocationSearchService:
                     
                 else:
                     # 참조 없으면 analysis 정보 활용
-                    analysis_region_short = analysis.region.replace('특별시', '').replace('광역시', '').replace('도', '')
                     search_strategies.extend([
                         f"{analysis_region_short} {analysis.district} 맛집",
                         f"{analysis_region_short} {analysis.district} 식당",
@@ -2012,7 +2460,7 @@ class TripleLocationSearchService:
             # 3) 기타 일반 검색
             else:
                 if reference_district and reference_region:
-                    region_short = reference_region.replace('특별시', '').replace('광역시', '').replace('도', '')
+                    region_short = shorten_region(reference_region, _PROVINCE_SUFFIXES)
                     search_strategies.extend([
                         f"{region_short} {reference_district} {analysis.place_name}",
                         f"{analysis.place_name}"
@@ -2030,7 +2478,8 @@ class TripleLocationSearchService:
             for i, strategy in enumerate(search_strategies):
                 logger.info(f"   {i+1}. {strategy}")
             
-            for strategy in search_strategies:
+            async def try_strategy(strategy: str) -> Optional[PlaceResult]:
+                """검색어 하나로 Kakao 검색 (기준을 넘는 결과가 없으면 None)"""
                 try:
                     params = {
                         "query": strategy,
@@ -2040,157 +2489,149 @@ class TripleLocationSearchService:
                     
                     logger.info(f"🔍 Kakao 검색어: '{strategy}'")
                     
-                    async with aiohttp.ClientSession() as session:
-                        async with session.get(url, headers=headers, params=params) as response:
-                            if response.status == 200:
-                                data = await response.json()
+                    # 검색어 종류는 후보와 무관하므로 전략당 한 번만 판별
+                    strategy_lower = strategy.lower()
+                    restaurant_mode = _KAKAO_MEAL_QUERY_MATCHER.contains_any(strategy_lower)
+                    cafe_mode = not restaurant_mode and "카페" in strategy_lower
+                    
+                    data = await fetch_api_json("Kakao", url, params, headers)
+                    if data is not None:
+                        if data.get("documents"):
+                            logger.info(f"✅ Kakao 결과 {len(data['documents'])}개 발견")
                                 
-                                if data.get("documents"):
-                                    logger.info(f"✅ Kakao 결과 {len(data['documents'])}개 발견")
+                            for i, place in enumerate(data["documents"]):
+                                place_name = place.get("place_name", "")
+                                address = place.get("road_address_name") or place.get("address_name", "")
+                                category = place.get("category_name", "")
                                     
-                                    for i, place in enumerate(data["documents"]):
-                                        place_name = place.get("place_name", "")
-                                        address = place.get("road_address_name") or place.get("address_name", "")
-                                        category = place.get("category_name", "")
-                                        
-                                        logger.info(f"   후보 {i+1}: {place_name} - {address}")
-                                        
-                                        if not address.strip():
-                                            continue
-                                        
-                                        # 🔥 개선된 지역 매칭 점수 (동명이인 방지)
-                                        location_score = 0
+                                if not address.strip():
+                                    continue
+                                    
+                                # 🔥 개선된 지역 매칭 점수 (동명이인 방지)
+                                location_score = 0
+                                location_reason = "기타 지역"  # DEBUG_SEARCH 로그용 판정 사유
+                                    
+                                if reference_district and reference_region:
+                                    # 📍 참조 지역이 있을 때: 시/도 + 구/시/군 모두 확인
+                                    # 🆕 개선된 매칭 로직 적용
+                                    address_has_region = check_region_match_improved(address, reference_region, reference_region_short)
+                                    address_has_district = check_district_match_improved(address, reference_district)
                                         
-                                        if reference_district and reference_region:
-                                            # 📍 참조 지역이 있을 때: 시/도 + 구/시/군 모두 확인
-                                            reference_region_short = reference_region.replace('특별시', '').replace('광역시', '').replace('특별자치시', '').replace('특별자치도', '').replace('도', '')
-                                            
-                                            # 🆕 개선된 매칭 로직 적용
-                                            address_has_region = check_region_match_improved(address, reference_region, reference_region_short)
-                                            address_has_district = check_district_match_improved(address, reference_district)
-                                            
-                                            if address_has_region and address_has_district:
-                                                location_score += 10  # 🔥 시/도 + 구/시/군 모두 일치 (최고점)
-                                                logger.info(f"     ✅ 완전 지역 일치 ({reference_region_short} {reference_district})")
-                                            elif address_has_district and not address_has_region:
-                                                # 🔥 같은 구명이지만 다른 시/도 (예: 부산 동구 vs 대구 동구)
-                                                location_score -= 20  # 대폭 감점
-                                                logger.warning(f"     ❌ 동명이인 지역! {reference_district}이지만 다른 시/도 ({address})")
-                                            elif address_has_region and not address_has_district:
-                                                # 같은 시/도 내 다른 구/시/군
-                                                found_district = None
-                                                if reference_region in KOREA_REGIONS:
-                                                    region_districts = KOREA_REGIONS[reference_region]
-                                                    for district in region_districts:
-                                                        if district in address:
-                                                            found_district = district
-                                                            break
-                                                
-                                                if found_district:
-                                                    location_score += 5  # 같은 시/도 내
-                                                    logger.info(f"     ✅ 같은 시/도 내 ({reference_region_short} {found_district})")
-                                                else:
-                                                    location_score += 2  # 같은 시/도이지만 구 불분명
-                                                    logger.info(f"     ✅ 같은 시/도 ({reference_region_short})")
-                                            else:
-                                                location_score += 1  # 기타 지역
-                                                
-                                        elif reference_district:
-                                            # 참조 구/시/군만 있을 때 (시/도 정보 없음)
-                                            address_has_district = check_district_match_improved(address, reference_district)
+                                    if address_has_region and address_has_district:
+                                        location_score += 10  # 🔥 시/도 + 구/시/군 모두 일치 (최고점)
+                                        location_reason = "완전 지역 일치"
+                                    elif address_has_district and not address_has_region:
+                                        # 🔥 같은 구명이지만 다른 시/도 (예: 부산 동구 vs 대구 동구)
+                                        location_score -= 20  # 대폭 감점
+                                        location_reason = "동명이인 지역 (다른 시/도)"
+                                    elif address_has_region and not address_has_district:
+                                        # 같은 시/도 내 다른 구/시/군
+                                        found_district = None
+                                        if reference_region in _DISTRICT_MATCHERS:
+                                            found_district = _DISTRICT_MATCHERS[reference_region].first_keyword(address)
                                             
-                                            if address_has_district:
-                                                # 🔥 구명만 일치하는 경우 추가 검증 필요
-                                                # 한국에서 동명이인 가능성 높은 구명들
-                                                common_district_names = ["중구", "동구", "서구", "남구", "북구"]
-                                                
-                                                if reference_district in common_district_names:
-                                                    # 동명이인 가능성 높음 - 낮은 점수
-                                                    location_score += 2
-                                                    logger.warning(f"     ⚠️ 동명이인 가능 지역: {reference_district}")
-                                                else:
-                                                    # 고유한 구명 (예: "영등포구", "금정구")
-                                                    location_score += 6
-                                                    logger.info(f"     ✅ 고유 구명 일치 ({reference_district})")
-                                            else:
-                                                location_score += 1  # 기타
-                                                
+                                        if found_district:
+                                            location_score += 5  # 같은 시/도 내
+                                            location_reason = "같은 시/도 내 다른 구/시/군"
                                         else:
-                                            # 참조 지역 없으면 analysis 지역과 비교
-                                            analysis_region_short = analysis.region.replace('특별시', '').replace('광역시', '').replace('도', '')
+                                            location_score += 2  # 같은 시/도이지만 구 불분명
+                                            location_reason = "같은 시/도"
+                                    else:
+                                        location_score += 1  # 기타 지역
                                             
-                                            # 🆕 개선된 매칭 로직 적용
-                                            address_has_analysis_region = check_region_match_improved(address, analysis.region, analysis_region_short)
-                                            address_has_analysis_district = check_district_match_improved(address, analysis.district)
-                                            
-                                            if address_has_analysis_district and address_has_analysis_region:
-                                                location_score += 8  # 분석 지역 완전 일치
-                                                logger.info(f"     ✅ 분석 지역 완전 일치 ({analysis_region_short} {analysis.district})")
-                                            elif address_has_analysis_district:
-                                                # 구명만 일치 - 동명이인 체크
-                                                common_district_names = ["중구", "동구", "서구", "남구", "북구"]
-                                                if analysis.district in common_district_names:
-                                                    location_score += 2  # 동명이인 가능성으로 낮은 점수
-                                                    logger.warning(f"     ⚠️ 동명이인 가능: {analysis.district}")
-                                                else:
-                                                    location_score += 5  # 고유 구명
-                                            elif address_has_analysis_region:
-                                                location_score += 3  # 시/도만 일치
-                                                logger.info(f"     ✅ 시/도 일치 ({analysis_region_short})")
-                                            else:
-                                                location_score += 1  # 기타
-                                        
-                                        # 카테고리 점수
-                                        category_score = 0
-                                        if any(word in strategy.lower() for word in ["맛집", "식당", "밥"]):
-                                            if any(cat in category for cat in ["음식점", "식당", "레스토랑", "한식", "중식", "일식", "양식"]):
-                                                category_score += 3
-                                                logger.info(f"     ✅ 식당 카테고리 일치")
-                                        elif "카페" in strategy.lower():
-                                            if any(cat in category for cat in ["카페", "커피", "디저트"]):
-                                                category_score += 3
-                                                logger.info(f"     ✅ 카페 카테고리 일치")
-                                        
-                                        # 부정 키워드 (식당이 아닌 것들 필터링)
-                                        negative_score = 0
-                                        negative_keywords = ["학원", "병원", "의원", "약국", "은행", "부동산", "유학", "학회", "컨설팅"]
-                                        if any(neg in place_name.lower() for neg in negative_keywords):
-                                            negative_score -= 10
-                                            logger.info(f"     ❌ 부정 키워드 ({place_name})")
-                                        
-                                        # 총점 계산
-                                        total_score = location_score + category_score + negative_score
+                                elif reference_district:
+                                    # 참조 구/시/군만 있을 때 (시/도 정보 없음)
+                                    address_has_district = check_district_match_improved(address, reference_district)
                                         
-                                        logger.info(f"     📊 점수: 지역={location_score} + 카테고리={category_score} + 부정={negative_score} = {total_score}")
-                                        
-                                        # 🔥 높은 점수 기준 (동명이인 방지)
-                                        min_score = 8 if reference_region and reference_district else 6
-                                        
-                                        if total_score >= min_score:
-                                            result = PlaceResult(
-                                                name=place_name,
-                                                address=address,
-                                                latitude=float(place.get("y", 0)),
-                                                longitude=float(place.get("x", 0)),
-                                                source="kakao"
-                                            )
+                                    if address_has_district:
+                                        # 🔥 구명만 일치하는 경우 추가 검증 필요 (동명이인 가능성 높은 구명인지)
+                                        if reference_district in _COMMON_DISTRICT_NAMES:
+                                            # 동명이인 가능성 높음 - 낮은 점수
+                                            location_score += 2
+                                            location_reason = "동명이인 가능 구명"
+                                        else:
+                                            # 고유한 구명 (예: "영등포구", "금정구")
+                                            location_score += 6
+                                            location_reason = "고유 구명 일치"
+                                    else:
+                                        location_score += 1  # 기타
                                             
-                                            logger.info(f"🎉 Kakao 동명이인 방지 검색 성공!")
-                                            logger.info(f"   🏪 장소: {result.name}")
-                                            logger.info(f"   📍 주소: {result.address}")
-                                            logger.info(f"   🏷️ 카테고리: {category}")
-                                            logger.info(f"   🎯 검색어: {strategy}")
-                                            return result
-                                    
-                                    logger.info(f"⚠️ 검색어 '{strategy}' - 기준 미달 (최고점: {max([total_score for _ in range(1)] or [0])})")
                                 else:
-                                    logger.info(f"⚠️ 검색어 '{strategy}' - 결과 없음")
-                            else:
-                                logger.warning(f"⚠️ Kakao API 오류: {response.status}")
+                                    # 참조 지역 없으면 analysis 지역과 비교
+                                    # 🆕 개선된 매칭 로직 적용
+                                    address_has_analysis_region = check_region_match_improved(address, analysis.region, analysis_region_short)
+                                    address_has_analysis_district = check_district_match_improved(address, analysis.district)
+                                        
+                                    if address_has_analysis_district and address_has_analysis_region:
+                                        location_score += 8  # 분석 지역 완전 일치
+                                        location_reason = "분석 지역 완전 일치"
+                                    elif address_has_analysis_district:
+                                        # 구명만 일치 - 동명이인 체크
+                                        if analysis.district in _COMMON_DISTRICT_NAMES:
+                                            location_score += 2  # 동명이인 가능성으로 낮은 점수
+                                            location_reason = "동명이인 가능 구명"
+                                        else:
+                                            location_score += 5  # 고유 구명
+                                            location_reason = "고유 구명 일치"
+                                    elif address_has_analysis_region:
+                                        location_score += 3  # 시/도만 일치
+                                        location_reason = "시/도 일치"
+                                    else:
+                                        location_score += 1  # 기타
+                                    
+                                # 카테고리 점수
+                                category_score = 0
+                                if restaurant_mode:
+                                    if _KAKAO_RESTAURANT_CATEGORY_MATCHER.contains_any(category):
+                                        category_score += 3
+                                elif cafe_mode:
+                                    if _KAKAO_CAFE_CATEGORY_MATCHER.contains_any(category):
+                                        category_score += 3
+                                    
+                                # 부정 키워드 (식당이 아닌 것들 필터링)
+                                negative_score = 0
+                                if _KAKAO_NEGATIVE_MATCHER.contains_any(place_name.lower()):
+                                    negative_score -= 10
+                                    
+                                # 총점 계산
+                                total_score = location_score + category_score + negative_score
+                                    
+                                # 후보당 한 줄로 채점 내역 기록
+                                if DEBUG_SEARCH:
+                                    logger.info("   후보 %d: %s - %s | 지역=%d(%s) 카테고리=%d 부정=%d 총점=%d",
+                                                i + 1, place_name, address, location_score, location_reason,
+                                                category_score, negative_score, total_score)
+                                    
+                                # 🔥 높은 점수 기준 (동명이인 방지)
+                                min_score = 8 if reference_region and reference_district else 6
+                                    
+                                if total_score >= min_score:
+                                    result = PlaceResult(
+                                        name=place_name,
+                                        address=address,
+                                        latitude=float(place.get("y", 0)),
+                                        longitude=float(place.get("x", 0)),
+                                        source="kakao"
+                                    )
+                                        
+                                    logger.info(f"🎉 Kakao 동명이인 방지 검색 성공!")
+                                    logger.info(f"   🏪 장소: {result.name}")
+                                    logger.info(f"   📍 주소: {result.address}")
+                                    logger.info(f"   🏷️ 카테고리: {category}")
+                                    logger.info(f"   🎯 검색어: {strategy}")
+                                    return result
                                 
+                            logger.info(f"⚠️ 검색어 '{strategy}' - 기준 미달 (최고점: {max([total_score for _ in range(1)] or [0])})")
+                        else:
+                            logger.info(f"⚠️ 검색어 '{strategy}' - 결과 없음")
                 except Exception as e:
                     logger.error(f"❌ 검색어 '{strategy}' 오류: {e}")
-                    continue
+                return None
+            
+            # 🔥 모든 검색어를 동시에 요청하되, 결과는 검색어 우선순위 순서대로 확인
+            result = await first_in_priority((try_strategy(strategy) for strategy in search_strategies), _KAKAO_SEMAPHORE)
+            if result:
+                return result
                     
         except Exception as e:
             logger.error(f"❌ Kakao 전체 검색 오류: {e}")
@@ -2200,6 +2641,14 @@ class TripleLocationSearchService:
 
     @staticmethod
     async def search_google(analysis: LocationAnalysis) -> Optional[PlaceResult]:
+        """Google 검색 (같은 장소명/지역은 캐시 재사용)"""
+        return await _PROVIDER_SEARCH_CACHE.get_or_set(
+            ("google", analysis.place_name, analysis.region, analysis.district),
+            lambda: TripleLocationSearchService._search_google(analysis)
+        )
+
+    @staticmethod
+    async def _search_google(analysis: LocationAnalysis) -> Optional[PlaceResult]:
         """2순위: Google Places API 검색 - 강화된 버전"""
         if not GOOGLE_MAPS_API_KEY:
             logger.warning("❌ Google API 키가 없습니다")
@@ -2210,33 +2659,26 @@ class TripleLocationSearchService:
         try:
             url = "https://maps.googleapis.com/maps/api/place/findplacefromtext/json"
             
-            # 검색 전략
-            region_name = analysis.region.replace('광역시', '').replace('특별시', '')
-            search_strategies = []
-            
-            # 구체적 장소명
-            if any(keyword in analysis.place_name.lower() for keyword in ['대학교', '경기장', '월드컵']):
-                search_strategies.extend([
-                    f"{region_name} {analysis.place_name}",
-                    analysis.place_name
-                ])
-            
-            # 카테고리별 검색
+            # 검색 전략 (구체적 장소명 + 카테고리별 검색, 장소명은 한 번만 스캔)
+            region_name = shorten_region(analysis.region, _METRO_SUFFIXES)
             place_lower = analysis.place_name.lower()
-            if any(word in place_lower for word in ['식당', 'restaurant']):
-                search_strategies.extend([
-                    f"{region_name} {analysis.district} restaurant",
-                    f"{region_name} 맛집"
-                ])
-            elif any(word in place_lower for word in ['카페', 'cafe']):
-                search_strategies.extend([
-                    f"{region_name} {analysis.district} cafe",
-                    f"{region_name} 카페"
-                ])
+            matched = _GOOGLE_STRATEGY_MATCHER.matched_labels(place_lower)
+            if "food" in matched:
+                matched.discard("cafe")  # 식당과 카페가 함께 있으면 식당 검색만
+            search_strategies = [
+                template.format(region=region_name, district=analysis.district, place=analysis.place_name)
+                for label, _, templates in _GOOGLE_STRATEGY_TABLE if label in matched
+                for template in templates
+            ]
             
             logger.info(f"🔍 Google 검색 전략: {search_strategies}")
             
-            for strategy in search_strategies:
+            # 후보 채점 기준은 장소명/지역에만 의존하므로 검색당 한 번만 계산
+            region_keywords = [keyword for keyword in (region_name, analysis.district) if keyword]
+            expected_types = next((types for keyword, types in _GOOGLE_EXPECTED_TYPES if keyword in place_lower), None)
+            
+            async def try_strategy(strategy: str) -> Optional[PlaceResult]:
+                """검색어 하나로 Google 검색 (적절한 결과가 없으면 None)"""
                 try:
                     params = {
                         'input': strategy,
@@ -2249,66 +2691,56 @@ class TripleLocationSearchService:
                     
                     logger.info(f"🔍 Google 검색어: '{strategy}'")
                     
-                    async with aiohttp.ClientSession() as session:
-                        async with session.get(url, params=params) as response:
-                            if response.status == 200:
-                                data = await response.json()
+                    data = await fetch_api_json("Google", url, params)
+                    if data is not None:
+                        if data.get('status') == 'OK' and data.get('candidates'):
+                            logger.info(f"✅ Google 결과 {len(data['candidates'])}개 발견")
                                 
-                                if data.get('status') == 'OK' and data.get('candidates'):
-                                    logger.info(f"✅ Google 결과 {len(data['candidates'])}개 발견")
+                            for i, place in enumerate(data['candidates']):
+                                place_name = place.get('name', '')
+                                address = place.get('formatted_address', '')
+                                types = place.get('types', [])
                                     
-                                    for i, place in enumerate(data['candidates']):
-                                        place_name = place.get('name', '')
-                                        address = place.get('formatted_address', '')
-                                        types = place.get('types', [])
-                                        
-                                        logger.info(f"   후보 {i+1}: {place_name} - {address}")
-                                        logger.info(f"     타입: {types}")
-                                        
-                                        # 지역 일치 확인
-                                        region_keywords = [region_name, analysis.district]
-                                        region_match = any(keyword in address for keyword in region_keywords if keyword)
-                                        
-                                        # 타입 적합성 확인
-                                        type_match = False
-                                        if "식당" in analysis.place_name.lower():
-                                            type_match = any(t in types for t in ["restaurant", "food", "meal_takeaway"])
-                                        elif "카페" in analysis.place_name.lower():  
-                                            type_match = any(t in types for t in ["cafe", "bakery"])
-                                        elif "대학교" in analysis.place_name.lower():
-                                            type_match = any(t in types for t in ["university", "school"])
-                                        elif "경기장" in analysis.place_name.lower():
-                                            type_match = any(t in types for t in ["stadium", "gym"])
-                                        else:
-                                            type_match = True
-                                        
-                                        score = (1 if region_match else 0) + (1 if type_match else 0)
-                                        logger.info(f"     지역일치: {region_match}, 타입적합: {type_match}, 점수: {score}")
-                                        
-                                        if score >= 1:
-                                            location = place['geometry']['location']
-                                            result = PlaceResult(
-                                                name=place_name,
-                                                address=address,
-                                                latitude=location['lat'],
-                                                longitude=location['lng'],
-                                                source="google",
-                                                rating=place.get('rating')
-                                            )
-                                            
-                                            logger.info(f"✅ Google 검색 성공: {result.name}")
-                                            logger.info(f"   📍 주소: {result.address}")
-                                            return result
+                                if DEBUG_SEARCH:
+                                    logger.info("   후보 %d: %s - %s", i + 1, place_name, address)
+                                    logger.info("     타입: %s", types)
                                     
-                                    logger.info(f"⚠️ Google 검색어 '{strategy}' - 적절한 결과 없음")
-                                else:
-                                    logger.info(f"⚠️ Google API 응답: {data.get('status', 'UNKNOWN')}")
-                            else:
-                                logger.warning(f"⚠️ Google API 오류: {response.status}")
+                                # 지역 일치 확인
+                                region_match = any(keyword in address for keyword in region_keywords)
+                                    
+                                # 타입 적합성 확인 (장소명에 해당 키워드가 없으면 제한 없음)
+                                type_match = expected_types is None or not expected_types.isdisjoint(types)
+                                    
+                                score = (1 if region_match else 0) + (1 if type_match else 0)
+                                if DEBUG_SEARCH:
+                                    logger.info("     지역일치: %s, 타입적합: %s, 점수: %s", region_match, type_match, score)
+                                    
+                                if score >= 1:
+                                    location = place['geometry']['location']
+                                    result = PlaceResult(
+                                        name=place_name,
+                                        address=address,
+                                        latitude=location['lat'],
+                                        longitude=location['lng'],
+                                        source="google",
+                                        rating=place.get('rating')
+                                    )
+                                        
+                                    logger.info(f"✅ Google 검색 성공: {result.name}")
+                                    logger.info(f"   📍 주소: {result.address}")
+                                    return result
                                 
+                            logger.info(f"⚠️ Google 검색어 '{strategy}' - 적절한 결과 없음")
+                        else:
+                            logger.info(f"⚠️ Google API 응답: {data.get('status', 'UNKNOWN')}")
                 except Exception as e:
                     logger.error(f"❌ Google 검색어 '{strategy}' 오류: {e}")
-                    continue
+                return None
+            
+            # 🔥 모든 검색어를 동시에 요청하되, 결과는 검색어 우선순위 순서대로 확인
+            result = await first_in_priority((try_strategy(strategy) for strategy in search_strategies), _GOOGLE_SEMAPHORE)
+            if result:
+                return result
                     
         except Exception as e:
             logger.error(f"❌ Google 검색 전체 오류: {e}")
@@ -2318,7 +2750,7 @@ class TripleLocationSearchService:
 
     @staticmethod
     async def search_triple_api(place_text: str) -> Optional[PlaceResult]:
-        """3중 API 순차 검색 - 카카오 우선으로 변경"""
+        """3중 API 검색 - 카카오 우선 (CONCURRENT_PROVIDER_SEARCH면 동시 호출 후 우선순위로 선택)"""
         logger.info(f"🎯 3중 API 검색 시작: {place_text}")
         
         # 1단계: GPT로 지역 분석
@@ -2332,43 +2764,68 @@ class TripleLocationSearchService:
             ("Foursquare (3순위)", TripleLocationSearchService.search_foursquare)
         ]
         
-        for api_name, search_method in search_methods:
+        async def run_search(api_name: str, search_method) -> Optional[PlaceResult]:
             try:
                 result = await asyncio.wait_for(search_method(analysis), timeout=10)
                 if result and result.address and result.address.strip():
                     logger.info(f"🎉 {api_name}에서 검색 성공!")
                     return result
                 else:
-                    logger.info(f"⚠️ {api_name} 검색 결과 없음, 다음 API 시도...")
+                    logger.info(f"⚠️ {api_name} 검색 결과 없음")
             except asyncio.TimeoutError:
                 logger.warning(f"⏰ {api_name} 검색 타임아웃")
             except Exception as e:
                 logger.error(f"❌ {api_name} 검색 오류: {e}")
+            return None
+        
+        if CONCURRENT_PROVIDER_SEARCH:
+            # 🔥 세 API를 동시에 호출하고 우선순위(Kakao → Google → Foursquare)대로 채택
+            result = await first_in_priority(run_search(api_name, method) for api_name, method in search_methods)
+            if result:
+                return result
+        else:
+            for api_name, search_method in search_methods:
+                result = await run_search(api_name, search_method)
+                if result:
+                    return result
         
         # 모든 API 실패 시 기본 좌표 반환
         logger.warning(f"⚠️ 모든 API 검색 실패, 기본 좌표 사용: {place_text}")
         return None
 
 # ----- 비동기 위치 정보 보강 -----
-async def enhance_locations_with_triple_api(schedule_data: Dict) -> Dict:
-    """3중 API로 위치 정보 보강 - 참조 위치 활용"""
+async def enhance_locations_with_triple_api(schedule_data: Dict, inplace: bool = False) -> Dict:
+    """3중 API로 위치 정보 보강 - 참조 위치 활용
+
+    inplace=True면 복사 없이 schedule_data의 일정들을 직접 갱신하고 같은 dict를 반환한다.
+    """
     logger.info("🚀 3중 API 위치 정보 보강 시작")
     
     try:
-        enhanced_data = json.loads(json.dumps(schedule_data))
+        # JSON 호환 dict이므로 orjson 왕복이 deepcopy보다 빠른 깊은 복사
+        enhanced_data = schedule_data if inplace else orjson.loads(orjson.dumps(schedule_data))
         
         # 모든 일정 수집 (순서대로)
         all_schedules = []
         all_schedules.extend(enhanced_data.get("fixedSchedules", []))
         all_schedules.extend(enhanced_data.get("flexibleSchedules", []))
         
-        # 순차적으로 처리하여 이전 일정의 위치를 참조로 활용
+        # 참조 위치는 "위치가 있는 첫 번째 이전 일정"이므로 그 위치가 정해질 때까지만 순차 처리
         processed_schedules = []
+        pending = iter(all_schedules)
         
-        for i, schedule in enumerate(all_schedules):
+        for schedule in pending:
             # 이전 처리된 일정들을 참조로 전달
             enhanced_schedule = await enhance_single_schedule_triple(schedule, processed_schedules)
             processed_schedules.append(enhanced_schedule)
+            if (enhanced_schedule.get("location") or "").strip():
+                break
+        
+        # 🔥 참조가 고정된 나머지 일정은 동시에 처리 (일정 dict를 제자리에서 갱신하므로 순서·소속 그대로 유지)
+        reference_schedules = list(processed_schedules)
+        processed_schedules.extend(await asyncio.gather(
+            *(enhance_single_schedule_triple(schedule, reference_schedules) for schedule in pending)
+        ))
         
         logger.info(f"✅ 3중 API 위치 보강 완료: {len(processed_schedules)}개 처리")
         
@@ -2378,38 +2835,30 @@ async def enhance_locations_with_triple_api(schedule_data: Dict) -> Dict:
         logger.error(f"❌ 3중 API 위치 보강 실패: {e}")
         return schedule_data
 
-def _is_reasonable_distance(address1: str, address2: str) -> bool:
-    """두 주소가 합리적인 거리 내에 있는지 확인"""
-    try:
-        # 시/도 단위 비교
-        regions1 = ["서울", "부산", "대구", "인천", "광주", "대전", "울산", "세종", "경기", "강원", "충북", "충남", "전북", "전남", "경북", "경남", "제주"]
-        
-        region1 = None
-        region2 = None
-        
-        for region in regions1:
-            if region in address1:
-                region1 = region
-            if region in address2:
-                region2 = region
-        
-        # 같은 광역시/도면 OK
-        if region1 == region2:
-            return True
-        
-        # 인접 지역 허용 (예: 서울-경기, 부산-경남 등)
-        adjacent_regions = {
-            "서울": ["경기"],
-            "경기": ["서울", "강원", "충북", "충남"],
-            "부산": ["경남"],
-            "경남": ["부산", "경북"],
-            "울산": ["경남", "경북"],
-            "대구": ["경북", "경남"]
-        }
+# 주소 → 시/도 약칭 판별용 매처 (목록 뒤쪽 약칭이 우선 - 기존 순회에서 마지막 일치가 남던 동작과 동일)
+_PROVINCE_ABBREVIATIONS: Final = ("서울", "부산", "대구", "인천", "광주", "대전", "울산", "세종", "경기", "강원", "충북", "충남", "전북", "전남", "경북", "경남", "제주")
+_PROVINCE_ABBR_MATCHER = KeywordMatcher.from_keywords(reversed(_PROVINCE_ABBREVIATIONS))
+
+# 인접 지역 허용 (예: 서울-경기, 부산-경남 등) - 양방향으로 펼쳐 한 번의 조회로 판정
+_ADJACENT_PROVINCE_PAIRS: Final = (
+    ("서울", "경기"), ("경기", "강원"), ("경기", "충북"), ("경기", "충남"),
+    ("부산", "경남"), ("경남", "경북"), ("울산", "경남"), ("울산", "경북"),
+    ("대구", "경북"), ("대구", "경남")
+)
+_ADJACENT_PROVINCES: Final = MappingProxyType({
+    province: frozenset(b if a == province else a for a, b in _ADJACENT_PROVINCE_PAIRS if province in (a, b))
+    for pair in _ADJACENT_PROVINCE_PAIRS for province in pair
+})
+
+def _is_reasonable_distance(address1: str, address2: str) -> bool:
+    """두 주소가 합리적인 거리 내에 있는지 확인"""
+    try:
+        # 시/도 단위 비교 (주소마다 한 번만 스캔)
+        region1 = _PROVINCE_ABBR_MATCHER.first_keyword(address1)
+        region2 = _PROVINCE_ABBR_MATCHER.first_keyword(address2)
         
-        if region1 in adjacent_regions and region2 in adjacent_regions[region1]:
-            return True
-        if region2 in adjacent_regions and region1 in adjacent_regions[region2]:
+        # 같은 광역시/도면 OK, 인접 지역도 허용
+        if region1 == region2 or region2 in _ADJACENT_PROVINCES.get(region1, ()):
             return True
             
         # 그 외는 너무 멀다고 판단
@@ -2475,32 +2924,33 @@ async def enhance_single_schedule_triple(schedule: Dict, reference_schedules: Li
     return schedule
 
 # ----- 유틸리티 함수 -----
+# 동기 함수 실행용 공유 스레드 풀 (호출마다 스레드를 만들고 없애지 않도록 프로세스 수명 동안 재사용)
+_EXECUTOR: Final = ThreadPoolExecutor(max_workers=8, thread_name_prefix="run-in-executor")
+
+@app.on_event("shutdown")
+async def shutdown_executor():
+    """앱 종료 시 공유 스레드 풀 정리"""
+    _EXECUTOR.shutdown(wait=False)
+
 async def run_in_executor(func, *args, **kwargs):
     """동기 함수를 비동기로 실행"""
-    loop = asyncio.get_event_loop()
-    with ThreadPoolExecutor(max_workers=4) as executor:
-        return await loop.run_in_executor(executor, func, *args, **kwargs)
-
-def safe_parse_json(json_str):
-    """안전한 JSON 파싱"""
-    try:
-        return json.loads(json_str)
-    except json.JSONDecodeError as e:
-        logger.error(f"JSON 파싱 오류: {str(e)}")
-        return {
-            "fixedSchedules": [],
-            "flexibleSchedules": []
-        }
+    loop = asyncio.get_running_loop()
+    # loop.run_in_executor는 키워드 인자를 받지 않으므로 partial로 묶어서 전달
+    return await loop.run_in_executor(_EXECUTOR, functools.partial(func, *args, **kwargs))
 
 # app.py의 create_schedule_chain() 함수 개선
 
-def create_schedule_chain(voice_input: str):
-    """동적 프롬프트를 받는 LangChain 체인 생성"""
+def create_schedule_chain(voice_input: Optional[str] = None):
+    """동적 프롬프트를 받는 LangChain 체인 반환 (같은 시간대에는 캐시된 체인 재사용)"""
+    today = datetime.datetime.now()
+    return _build_schedule_chain(today.strftime('%Y-%m-%d'), today.hour)
+
+@functools.lru_cache(maxsize=1)
+def _build_schedule_chain(today_str: str, current_hour: int):
+    """날짜/시각이 바뀔 때만 프롬프트·파서를 새로 조합"""
     logger.info("🔗 동적 LangChain 체인 생성 시작")
     
     current_time = int(datetime.datetime.now().timestamp() * 1000)
-    today = datetime.datetime.now()
-    current_hour = today.hour
     
     # 현재 시간대 설명
     if 6 <= current_hour < 12:
@@ -2518,7 +2968,7 @@ def create_schedule_chain(voice_input: str):
 음성 메시지: {{input}}
 
 현재 시간: {current_hour}시 ({current_time_desc})
-현재 날짜: {today.strftime('%Y-%m-%d')}
+현재 날짜: {today_str}
 
 **🔥 중요한 분리 규칙**:
 1. "A에서 B까지" → A와 B를 **반드시 각각 별도 일정**으로 추출
@@ -2551,8 +3001,8 @@ JSON 형식으로 반환:
       "location": "",
       "latitude": 35.1156,
       "longitude": 129.0419,
-      "startTime": "{today.strftime('%Y-%m-%d')}T17:00:00",
-      "endTime": "{today.strftime('%Y-%m-%d')}T17:30:00"
+      "startTime": "{today_str}T17:00:00",
+      "endTime": "{today_str}T17:30:00"
     }}}},
     {{{{
       "id": "{current_time}_2", 
@@ -2563,8 +3013,8 @@ JSON 형식으로 반환:
       "location": "",
       "latitude": 35.2,
       "longitude": 129.1,
-      "startTime": "{today.strftime('%Y-%m-%d')}T18:00:00",
-      "endTime": "{today.strftime('%Y-%m-%d')}T20:00:00"
+      "startTime": "{today_str}T18:00:00",
+      "endTime": "{today_str}T20:00:00"
     }}}},
     {{{{
       "id": "{current_time}_3",
@@ -2575,8 +3025,8 @@ JSON 형식으로 반환:
       "location": "",
       "latitude": 35.2311,
       "longitude": 129.0839,
-      "startTime": "{today.strftime('%Y-%m-%d')}T20:30:00",
-      "endTime": "{today.strftime('%Y-%m-%d')}T21:00:00"
+      "startTime": "{today_str}T20:30:00",
+      "endTime": "{today_str}T21:00:00"
     }}}}
   ],
   "flexibleSchedules": []
@@ -2594,22 +3044,12 @@ JSON 형식으로 반환:
         input_variables=["input"]  # input만 변수로 사용
     )
     
-    # LLM 초기화
-    logger.info("🤖 OpenAI LLM 초기화 중...")
-    llm = ChatOpenAI(
-        openai_api_key=OPENAI_API_KEY,
-        model_name="gpt-4o",
-        temperature=0,
-        max_tokens=1500
-    )
-    logger.info("✅ OpenAI LLM 초기화 완료")
-    
     # JSON 파서
     parser = JsonOutputParser()
     
-    # 체인 조합
+    # 체인 조합 (LLM은 모듈 공유 인스턴스 사용)
     logger.info("🔗 체인 조합 중...")
-    chain = prompt | llm | parser
+    chain = prompt | _LLM | parser
     logger.info("✅ LangChain 체인 생성 완료")
     
     return chain
@@ -2626,25 +3066,26 @@ def normalize_priorities(schedules_data: Dict[str, Any]) -> Dict[str, Any]:
     """우선순위를 정수로 정규화"""
     logger.info("🔢 우선순위 정수 변환 시작")
     
-    all_schedules = []
-    all_schedules.extend(schedules_data.get("fixedSchedules", []))
-    all_schedules.extend(schedules_data.get("flexibleSchedules", []))
+    all_schedules = schedules_data.get("fixedSchedules", []) + schedules_data.get("flexibleSchedules", [])
     
-    # 우선순위로 정렬
+    # 우선순위로 정렬 (우선순위가 없는 일정은 뒤로 - itemgetter는 누락 키를 처리하지 못해 get 유지)
     all_schedules.sort(key=lambda s: s.get("priority", 999))
     
     # 1부터 시작하는 정수로 재할당
-    for i, schedule in enumerate(all_schedules):
-        old_priority = schedule.get("priority", "없음")
-        new_priority = i + 1
-        schedule["priority"] = new_priority
-        logger.info(f"우선순위 정규화: '{schedule.get('name', '')}' {old_priority} → {new_priority}")
+    if logger.isEnabledFor(logging.DEBUG):
+        for new_priority, schedule in enumerate(all_schedules, 1):
+            logger.debug("우선순위 정규화: '%s' %s → %d", schedule.get('name', ''), schedule.get("priority", "없음"), new_priority)
+            schedule["priority"] = new_priority
+    else:
+        for new_priority, schedule in enumerate(all_schedules, 1):
+            schedule["priority"] = new_priority
     
-    # 다시 분류
-    fixed_schedules = [s for s in all_schedules if s.get("type") == "FIXED" and "startTime" in s]
-    flexible_schedules = [s for s in all_schedules if s.get("type") != "FIXED" or "startTime" not in s]
+    # 다시 분류 (한 번의 순회로 고정/유연 분리)
+    fixed_schedules, flexible_schedules = [], []
+    for s in all_schedules:
+        (fixed_schedules if s.get("type") == "FIXED" and "startTime" in s else flexible_schedules).append(s)
     
-    logger.info(f"✅ 우선순위 정규화 완료: 고정 {len(fixed_schedules)}개, 유연 {len(flexible_schedules)}개")
+    logger.info("✅ 우선순위 정규화 완료: 고정 %d개, 유연 %d개", len(fixed_schedules), len(flexible_schedules))
     
     return {
         "fixedSchedules": fixed_schedules,
@@ -2664,8 +3105,7 @@ def calculate_geographic_midpoint(start_coords: tuple, end_coords: tuple, buffer
     mid_lng = (start_lng + end_lng) / 2
     
     # 두 지점 간 거리로 검색 반경 동적 계산
-    import math
-    distance = math.sqrt((end_lat - start_lat)**2 + (end_lng - start_lng)**2)
+    distance = math.hypot(end_lat - start_lat, end_lng - start_lng)
     search_radius = min(distance / 3, buffer_radius)  # 전체 거리의 1/3 또는 최대 buffer_radius
     
     return {
@@ -2675,30 +3115,46 @@ def calculate_geographic_midpoint(start_coords: tuple, end_coords: tuple, buffer
     }
 
 # 2. 동적 검색 전략 생성
+# 위치 문자열의 시/구/동 패턴 (모듈 로드 시 한 번만 컴파일)
+# 시/도는 독립된 단어이거나 특별시/광역시가 붙은 경우만 매칭 ("해운대구"의 대구, 경기도 "광주시"는 제외)
+# 광주만 "시" 접미를 허용하지 않음 (광주시는 경기도의 시)
+_CITY_RE: Final = re.compile(
+    r'(?<!\w)(?:(서울|부산|대구|인천|대전|울산)(?:특별시|광역시|시)?|(광주)(?:광역시)?)(?![구시군])'
+)
+# 매칭은 항상 단어 시작에서만 가능하므로 \b로 단어 중간 시작 위치의 재시도를 차단 (결과 동일, 긴 단어에서 역추적 방지)
+_DISTRICT_RE: Final = re.compile(r'\b(?:\w+구|\w+시|\w+군)')
+_DONG_EUP_MYEON_RE: Final = re.compile(r'\b(?:\w+동|\w+읍|\w+면)')
+
+def _find_city(location: str) -> Optional[re.Match]:
+    """위치에서 시/도 토큰 찾기 (이름은 _city_name으로)"""
+    return _CITY_RE.search(location)
+
+def _city_name(city: re.Match) -> str:
+    return city.group(1) or city.group(2)
+
+def _find_district(location: str, city: Optional[re.Match]) -> str:
+    """위치에서 시/군/구 찾기 - 시/도 토큰 자체("서울특별시", "대구")만 건너뜀"""
+    for district in _DISTRICT_RE.finditer(location):
+        if city and district.start() == city.start() and district.end() <= city.end():
+            continue
+        return district.group()
+    return ""
+
+def extract_location_info(location: str) -> Dict:
+    """위치에서 시/구/동 정보 추출"""
+    city = _find_city(location)
+    dong = _DONG_EUP_MYEON_RE.search(location)
+    
+    return {
+        "city": _city_name(city) if city else "서울",
+        "district": _find_district(location, city),
+        "dong": dong.group() if dong else "",
+        "full_location": location
+    }
+
 def generate_dynamic_search_strategies(start_location: str, end_location: str, place_type: str = "식사") -> List[str]:
     """출발지와 도착지를 기반으로 동적 검색 전략 생성"""
     
-    # 지역명 추출
-    def extract_location_info(location: str) -> Dict:
-        """위치에서 시/구/동 정보 추출"""
-        import re
-        
-        # 시/구 패턴
-        city_pattern = r'(서울|부산|대구|인천|광주|대전|울산)\s*(특별시|광역시)?'
-        district_pattern = r'(\w+구|\w+시|\w+군)'
-        dong_pattern = r'(\w+동|\w+읍|\w+면)'
-        
-        city = re.search(city_pattern, location)
-        district = re.search(district_pattern, location)
-        dong = re.search(dong_pattern, location)
-        
-        return {
-            "city": city.group(1) if city else "서울",
-            "district": district.group(1) if district else "",
-            "dong": dong.group(1) if dong else "",
-            "full_location": location
-        }
-    
     start_info = extract_location_info(start_location) if start_location else {}
     end_info = extract_location_info(end_location) if end_location else {}
     
@@ -2779,69 +3235,79 @@ async def smart_location_search(schedule: Dict, start_location: str = None, end_
     try:
         # GPT로 검색어 생성
         search_queries = await generate_search_queries_with_gpt(start_location, end_location, place_name)
+        search_queries = list(dict.fromkeys(search_queries))  # GPT가 같은 검색어를 반복하면 한 번만 검색
         
-        best_results = []
+        route_context = f"{start_location}에서 {end_location}까지의 경로" if start_location and end_location else None
         
-        for query in search_queries:
-            try:
-                logger.info(f"🔍 검색어: '{query}'")
-                
-                # GPT로 지역 분석
-                analysis = await TripleLocationSearchService.analyze_location_with_gpt(
-                    query,
-                    reference_location=start_location,
-                    route_context=f"{start_location}에서 {end_location}까지의 경로" if start_location and end_location else None
-                )
-                
-                # 참조 일정 정보 구성
-                reference_schedules = []
-                if start_location:
-                    reference_schedules.append({"location": start_location})
-                
-                # 🔥 올바른 API 호출 방식
-                search_results = []
-                
-                # Kakao 검색 (2개 인자)
-                try:
-                    kakao_result = await TripleLocationSearchService.search_kakao(analysis, reference_schedules)
-                    if kakao_result and kakao_result.address:
-                        search_results.append(("Kakao", kakao_result))
-                        logger.info(f"✅ Kakao 결과: {kakao_result.name}")
-                except Exception as e:
-                    logger.error(f"❌ Kakao 검색 오류: {e}")
-                
-                # Google 검색 (1개 인자)
-                try:
-                    google_result = await TripleLocationSearchService.search_google(analysis)
-                    if google_result and google_result.address:
-                        search_results.append(("Google", google_result))
-                        logger.info(f"✅ Google 결과: {google_result.name}")
-                except Exception as e:
-                    logger.error(f"❌ Google 검색 오류: {e}")
-                
-                # Foursquare 검색 (1개 인자)
+        # 참조 일정 정보 구성 (모든 검색어 공통)
+        reference_schedules = []
+        if start_location:
+            reference_schedules.append({"location": start_location})
+        
+        async def search_query(query: str) -> List[Dict]:
+            """검색어 하나로 Kakao/Google/Foursquare 동시 검색 후 점수 매긴 결과 목록 반환"""
+            async with _SMART_SEARCH_SEMAPHORE:
                 try:
-                    foursquare_result = await TripleLocationSearchService.search_foursquare(analysis)
-                    if foursquare_result and foursquare_result.address:
-                        search_results.append(("Foursquare", foursquare_result))
-                        logger.info(f"✅ Foursquare 결과: {foursquare_result.name}")
+                    logger.info(f"🔍 검색어: '{query}'")
+                    
+                    # GPT로 지역 분석
+                    analysis = await TripleLocationSearchService.analyze_location_with_gpt(
+                        query,
+                        reference_location=start_location,
+                        route_context=route_context
+                    )
+                    
+                    # 🔥 세 API를 동시에 호출 (한 API 오류가 나머지에 영향 없도록 예외도 결과로 받음)
+                    provider_results = await asyncio.gather(
+                        TripleLocationSearchService.search_kakao(analysis, reference_schedules),
+                        TripleLocationSearchService.search_google(analysis),
+                        TripleLocationSearchService.search_foursquare(analysis),
+                        return_exceptions=True
+                    )
+                    
+                    # 결과 처리 및 점수 계산
+                    query_words = set(query.lower().split())
+                    scored = []
+                    for api_name, result in zip(("Kakao", "Google", "Foursquare"), provider_results):
+                        if isinstance(result, Exception):
+                            logger.error(f"❌ {api_name} 검색 오류: {result}")
+                            continue
+                        if result and result.address:
+                            logger.info(f"✅ {api_name} 결과: {result.name}")
+                            score = calculate_simple_score(result, query_words)
+                            scored.append({
+                                "result": result,
+                                "query": query,
+                                "api": api_name,
+                                "score": score
+                            })
+                            logger.info(f"   점수: {score}")
+                    return scored
+                    
                 except Exception as e:
-                    logger.error(f"❌ Foursquare 검색 오류: {e}")
-                
-                # 결과 처리 및 점수 계산
-                for api_name, result in search_results:
-                    if result and result.address:
-                        score = calculate_simple_score(result, query)
-                        best_results.append({
-                            "result": result,
-                            "query": query,
-                            "api": api_name,
-                            "score": score
-                        })
-                        logger.info(f"   점수: {score}")
-                
-            except Exception as e:
-                logger.error(f"❌ 검색어 '{query}' 처리 오류: {e}")
+                    logger.error(f"❌ 검색어 '{query}' 처리 오류: {e}")
+                    return []
+        
+        # 모든 검색어를 동시에 처리하되, 충분히 좋은 결과가 나오면 남은 검색어는 취소
+        tasks = [asyncio.create_task(search_query(query)) for query in search_queries]
+        pending = set(tasks)
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                if any(entry["score"] >= SMART_SEARCH_SHORT_CIRCUIT_SCORE
+                       for task in done for entry in task.result()):
+                    logger.info(f"⚡ 점수 {SMART_SEARCH_SHORT_CIRCUIT_SCORE} 이상 결과 확보 → 남은 검색어 {len(pending)}개 취소")
+                    break
+        finally:
+            for task in pending:
+                task.cancel()
+        
+        # 결과 순서는 검색어 순서 그대로 (동점 시 앞선 검색어 결과 선택)
+        best_results = [
+            entry for task in tasks
+            if task.done() and not task.cancelled()
+            for entry in task.result()
+        ]
         
         # 최적 결과 선택
         if best_results:
@@ -2851,8 +3317,17 @@ async def smart_location_search(schedule: Dict, start_location: str = None, end_
             
             result = best["result"]
             schedule["location"] = clean_address(result.address)
-            schedule["latitude"] = result.latitude
-            schedule["longitude"] = result.longitude
+            
+            # 🔥 검색 결과에 이미 있는 좌표를 그대로 사용 (별도 지오코딩 호출 없음)
+            latitude, longitude = result.latitude, result.longitude
+            if not latitude or not longitude:
+                # 주소는 있는데 좌표가 빠진 경우에만 캐시된 지오코더로 보충
+                logger.warning(f"⚠️ {best['api']} 결과에 좌표 없음, 지오코딩으로 보충: {result.address}")
+                coords = await get_coordinates_from_address(result.address)
+                if coords:
+                    latitude, longitude = coords
+            schedule["latitude"] = latitude
+            schedule["longitude"] = longitude
             
             logger.info(f"🎯 최적 결과: {result.name}")
             logger.info(f"   📍 주소: {schedule['location']}")
@@ -2868,8 +3343,8 @@ async def smart_location_search(schedule: Dict, start_location: str = None, end_
     
     return schedule
 
-def calculate_simple_score(result, query: str) -> float:
-    """간단한 점수 계산"""
+def calculate_simple_score(result, query_words: Set[str]) -> float:
+    """간단한 점수 계산 (query_words: 소문자 검색어 단어 집합, 검색어당 한 번만 생성)"""
     score = 0.0
     
     # 평점 점수
@@ -2879,11 +3354,9 @@ def calculate_simple_score(result, query: str) -> float:
         score += 5  # 기본 5점
     
     # 이름 관련성 점수
-    query_words = query.lower().split()
-    name_words = result.name.lower().split() if hasattr(result, 'name') else []
-    
-    common_words = set(query_words) & set(name_words)
-    score += len(common_words) * 2  # 공통 단어당 2점
+    if hasattr(result, 'name'):
+        common_words = query_words.intersection(result.name.lower().split())
+        score += len(common_words) * 2  # 공통 단어당 2점
     
     # 주소 완전성 점수
     if hasattr(result, 'address') and result.address:
@@ -2897,8 +3370,87 @@ def calculate_simple_score(result, query: str) -> float:
     return score
 
 # 2. GPT 기반 검색어 생성 함수
+# (출발지, 도착지, 장소 종류) → GPT 생성 검색어/전략 캐시 (하루, 재시작 간에는 JSON 파일로 유지)
+_GPT_QUERY_CACHE = AsyncTTLCache(ttl=24 * 3600, maxsize=1024)
+GPT_QUERY_CACHE_PATH = os.getenv("GPT_QUERY_CACHE_PATH", os.path.join("cache", "gpt_queries.json"))
+
+def _gpt_query_cache_key(kind: str, *parts: Optional[str]) -> str:
+    """GPT 검색어 캐시 키 (정규화한 입력을 줄바꿈으로 연결 - JSON 파일 키로 쓸 수 있도록 문자열)"""
+    return "\n".join((kind, *(normalize_place_text(part or "") for part in parts)))
+
+@app.on_event("startup")
+async def load_gpt_query_cache():
+    """앱 시작 시 저장된 GPT 검색어 불러오기"""
+    load_cache_file(_GPT_QUERY_CACHE, GPT_QUERY_CACHE_PATH)
+
+@app.on_event("shutdown")
+async def save_gpt_query_cache():
+    """앱 종료 시 GPT 검색어를 파일로 저장"""
+    save_cache_file(_GPT_QUERY_CACHE, GPT_QUERY_CACHE_PATH)
+
+def _single_point_location(start_location: Optional[str], end_location: Optional[str]) -> Optional[str]:
+    """출발지/도착지 중 하나가 없거나 둘이 같으면 그 한 곳(둘 다 없으면 빈 문자열), 아니면 None
+
+    경로가 한 점이면 GPT가 '두 지점 사이'를 추론할 여지가 없으므로 GPT 호출 없이 로컬 검색어를 사용
+    """
+    start = (start_location or "").strip()
+    end = (end_location or "").strip()
+    if start and end and start != end:
+        return None
+    return start or end
+
+def _local_area_parts(location: str) -> Tuple[str, str, str]:
+    """GPT 없이 위치에서 (시, 구, 동) 추출 - 시/도를 못 찾으면 기본값("서울")을 붙이지 않음"""
+    city = _find_city(location)
+    dong = _DONG_EUP_MYEON_RE.search(location)
+    return _city_name(city) if city else "", _find_district(location, city), dong.group() if dong else ""
+
+def _local_area_name(location: str) -> str:
+    """GPT 없이 위치에서 검색용 지역명 추출 (시 + 구, 둘 다 없으면 위치 그대로)"""
+    city, district, _ = _local_area_parts(location)
+    return " ".join(part for part in (city, district) if part) or location
+
+def _local_search_queries(location: str, place_type: str) -> List[str]:
+    """GPT 없이 한 위치의 시/구/동으로 검색어 생성"""
+    if not location:
+        return [place_type]
+    
+    city, district, dong = _local_area_parts(location)
+    queries = []
+    if district:
+        if dong:
+            queries.append(" ".join(part for part in (city, district, dong, place_type) if part))
+        queries.append(" ".join(part for part in (city, district, place_type) if part))
+    queries.append(f"{location} 근처 {place_type}")
+    if city:
+        queries.append(f"{city} {place_type}")
+    return list(dict.fromkeys(queries))
+
 async def generate_search_queries_with_gpt(start_location: str, end_location: str, place_type: str) -> List[str]:
-    """GPT로 검색어 동적 생성 - 하드코딩 없음"""
+    """GPT로 검색어 동적 생성 - 같은 (출발지, 도착지, 장소 종류)는 캐시 재사용"""
+    location = _single_point_location(start_location, end_location)
+    if location is not None:
+        logger.info(f"⚡ 출발지/도착지가 한 곳뿐 → GPT 없이 검색어 생성: '{location}'")
+        return _local_search_queries(location, place_type)
+    
+    queries = await _GPT_QUERY_CACHE.get_or_set(
+        _gpt_query_cache_key("search_queries", start_location, end_location, place_type),
+        lambda: _generate_search_queries_with_gpt(start_location, end_location, place_type),
+        cache_if=lambda result: result is not None
+    )
+    if queries is not None:
+        return list(queries)  # 캐시 공유 리스트 보호
+    
+    # 폴백: 간단한 기본 검색어
+    if "식사" in place_type or "밥" in place_type:
+        return ["맛집", "식당", "레스토랑", "한식", "분식"]
+    elif "카페" in place_type:
+        return ["카페", "커피", "디저트", "베이커리", "차"]
+    else:
+        return ["맛집", "식당", "카페", "레스토랑", "음식점"]
+
+async def _generate_search_queries_with_gpt(start_location: str, end_location: str, place_type: str) -> Optional[List[str]]:
+    """GPT로 검색어 동적 생성 - 하드코딩 없음 (실패 시 None)"""
     
     try:
         prompt = f"""
@@ -2924,11 +3476,12 @@ JSON 형식으로만 응답:
     "검색어4",
     "검색어5"
   ],
-  "reasoning": "검색어 선택 이유"
+  "reasoning": "검색어 선택 이유 (한 문장)"
 }}
 """
         
-        response = openai_client.chat.completions.create(
+        response = await run_in_executor(  # 동기 클라이언트 → 스레드 풀 (동시 검색이 이벤트 루프를 막지 않도록)
+            openai_client.chat.completions.create,
             model="gpt-3.5-turbo",
             messages=[
                 {
@@ -2937,15 +3490,13 @@ JSON 형식으로만 응답:
                 },
                 {"role": "user", "content": prompt}
             ],
-            temperature=0.3,
-            max_tokens=400
+            temperature=0,  # 같은 입력이면 같은 검색어 (결과는 어차피 캐시됨)
+            max_tokens=300,  # 검색어 5개 + 이유 한 문장이면 충분
+            response_format={"type": "json_object"}
         )
         
-        content = response.choices[0].message.content.strip()
-        if content.startswith("```json"):
-            content = content.replace("```json", "").replace("```", "").strip()
-        
-        data = json.loads(content)
+        # JSON 모드라 코드 블록 없이 순수 JSON 객체만 옴
+        data = orjson.loads(response.choices[0].message.content)
         queries = data.get("search_queries", [])
         reasoning = data.get("reasoning", "")
         
@@ -2958,14 +3509,7 @@ JSON 형식으로만 응답:
         
     except Exception as e:
         logger.error(f"❌ GPT 검색어 생성 실패: {e}")
-        
-        # 폴백: 간단한 기본 검색어
-        if "식사" in place_type or "밥" in place_type:
-            return ["맛집", "식당", "레스토랑", "한식", "분식"]
-        elif "카페" in place_type:
-            return ["카페", "커피", "디저트", "베이커리", "차"]
-        else:
-            return ["맛집", "식당", "카페", "레스토랑", "음식점"]
+        return None
 
 # 3. 기존 create_simple_multiple_options 대신 GPT 기반으로 수정
 async def create_multiple_options(enhanced_data: Dict, voice_input: str) -> Dict:
@@ -2990,8 +3534,32 @@ async def create_multiple_options(enhanced_data: Dict, voice_input: str) -> Dict
         return {"options": [enhanced_data]}
 
 # 4. GPT 기반 옵션 전략 생성 (하드코딩 완전 제거)
+# GPT를 쓸 수 없거나 쓸 필요가 없을 때의 기본 식사 전략
+_DEFAULT_OPTION_STRATEGIES: Final = ("맛집", "고급 레스토랑", "가성비 식당", "카페", "분식")
+
 async def generate_option_strategies_dynamic(start_location: str, end_location: str, voice_input: str) -> List[str]:
-    """GPT로 옵션별 다른 전략 동적 생성"""
+    """GPT로 옵션별 다른 전략 동적 생성 - 같은 (출발지, 도착지, 요청)은 캐시 재사용"""
+    location = _single_point_location(start_location, end_location)
+    if location is not None:
+        logger.info(f"⚡ 출발지/도착지가 한 곳뿐 → GPT 없이 전략 생성: '{location}'")
+        if not location:
+            return list(_DEFAULT_OPTION_STRATEGIES)
+        area = _local_area_name(location)
+        return [f"{area} {strategy}" for strategy in _DEFAULT_OPTION_STRATEGIES]
+    
+    strategies = await _GPT_QUERY_CACHE.get_or_set(
+        _gpt_query_cache_key("option_strategies", start_location, end_location, voice_input),
+        lambda: _generate_option_strategies_dynamic(start_location, end_location, voice_input),
+        cache_if=lambda result: result is not None
+    )
+    if strategies is not None:
+        return list(strategies)  # 캐시 공유 리스트 보호
+    
+    # 폴백: 기본 검색어들
+    return list(_DEFAULT_OPTION_STRATEGIES)
+
+async def _generate_option_strategies_dynamic(start_location: str, end_location: str, voice_input: str) -> Optional[List[str]]:
+    """GPT로 옵션별 다른 전략 동적 생성 (실패 시 None)"""
     
     try:
         prompt = f"""
@@ -3019,7 +3587,8 @@ JSON 형식으로만 응답:
 }}
 """
         
-        response = openai_client.chat.completions.create(
+        response = await run_in_executor(  # 동기 클라이언트 → 스레드 풀 (동시 검색이 이벤트 루프를 막지 않도록)
+            openai_client.chat.completions.create,
             model="gpt-3.5-turbo",
             messages=[
                 {
@@ -3029,14 +3598,12 @@ JSON 형식으로만 응답:
                 {"role": "user", "content": prompt}
             ],
             temperature=0.4,  # 약간의 창의성
-            max_tokens=300
+            max_tokens=200,  # 짧은 검색어 5개
+            response_format={"type": "json_object"}
         )
         
-        content = response.choices[0].message.content.strip()
-        if content.startswith("```json"):
-            content = content.replace("```json", "").replace("```", "").strip()
-        
-        data = json.loads(content)
+        # JSON 모드라 코드 블록 없이 순수 JSON 객체만 옴
+        data = orjson.loads(response.choices[0].message.content)
         strategies = data.get("strategies", [])
         
         logger.info(f"🎨 GPT 생성 전략 {len(strategies)}개:")
@@ -3047,13 +3614,33 @@ JSON 형식으로만 응답:
         
     except Exception as e:
         logger.error(f"❌ GPT 전략 생성 실패: {e}")
-        
-        # 폴백: 기본 검색어들
-        return ["맛집", "고급 레스토랑", "가성비 식당", "카페", "분식"]
+        return None
 
 
 
+# 주소 → 좌표 캐시 (주소 좌표는 거의 바뀌지 않으므로 30일, 재시작 간에는 JSON 파일로 유지)
+_GEOCODE_CACHE = AsyncTTLCache(ttl=30 * 24 * 3600, maxsize=4096)
+GEOCODE_CACHE_PATH = os.getenv("GEOCODE_CACHE_PATH", os.path.join("cache", "geocode_cache.json"))
+
+@app.on_event("startup")
+async def load_geocode_cache():
+    """앱 시작 시 저장된 지오코딩 결과 불러오기"""
+    load_cache_file(_GEOCODE_CACHE, GEOCODE_CACHE_PATH, decode=tuple)
+
+@app.on_event("shutdown")
+async def save_geocode_cache():
+    """앱 종료 시 지오코딩 결과를 파일로 저장"""
+    save_cache_file(_GEOCODE_CACHE, GEOCODE_CACHE_PATH)
+
 async def get_coordinates_from_address(address: str) -> tuple:
+    """주소에서 좌표 추출 (같은 주소는 캐시 재사용, 실패는 캐시하지 않음)"""
+    return await _GEOCODE_CACHE.get_or_set(
+        normalize_place_text(address),
+        lambda: _geocode_address(address),
+        cache_if=lambda coords: coords is not None
+    )
+
+async def _geocode_address(address: str) -> tuple:
     """주소에서 좌표 추출 (간단한 지오코딩)"""
     try:
         # 기존 카카오 지오코딩 활용
@@ -3061,58 +3648,65 @@ async def get_coordinates_from_address(address: str) -> tuple:
             return None
         
         url = "https://dapi.kakao.com/v2/local/search/address.json"
-        headers = {"Authorization": f"KakaoAK {KAKAO_REST_API_KEY}"}
+        headers = _KAKAO_HEADERS
         params = {"query": address}
         
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url, headers=headers, params=params, timeout=5) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    documents = data.get("documents", [])
-                    if documents:
-                        result = documents[0]
-                        return (float(result.get("y", 0)), float(result.get("x", 0)))
+        session = get_http_session()
+        async with session.get(url, headers=headers, params=params, timeout=5) as response:
+            if response.status == 200:
+                data = await response.json(loads=orjson.loads)
+                documents = data.get("documents", [])
+                if documents:
+                    result = documents[0]
+                    return (float(result.get("y", 0)), float(result.get("x", 0)))
         
         return None
         
     except Exception as e:
         logger.error(f"주소 좌표 변환 오류: {e}")
         return None
+
+# 주소 정제용 정규식 (모듈 로드 시 한 번만 컴파일)
+# 같은 시/도명 연속 반복 | 구 우편번호 (3-3) - 서로의 매칭에 영향이 없어 한 번에 처리
+_DUP_CITY_OR_ZIP_DASH_RE: Final = re.compile(
+    r'(?P<city>부산광역시|서울특별시|대구광역시),?\s*(?P=city)|,?\s*\d{3}-\d{3}'
+)
+# 우편번호 (5자리) - 3-3 형태를 지운 뒤 붙은 숫자도 잡아야 하므로 별도 단계
+_ZIP5_RE: Final = re.compile(r',?\s*\d{5}')
+# 시작/끝 쉼표 | 연속 쉼표 | 연속 공백
+_ADDRESS_PUNCT_RE: Final = re.compile(r'^\s*,+|,+\s*$|(?P<commas>,+)|(?P<spaces>\s+)')
+_ADDRESS_PUNCT_REPLACEMENTS: Final = MappingProxyType({"commas": ",", "spaces": " ", None: ""})
+
 def clean_address(address: str) -> str:
             """주소 정제 함수"""
             if not address:
                 return ""
             
-            import re
-            
-            # 1. 중복된 지역명 제거
-            address = re.sub(r'부산광역시,?\s*부산광역시', '부산광역시', address)
-            address = re.sub(r'서울특별시,?\s*서울특별시', '서울특별시', address)
-            address = re.sub(r'대구광역시,?\s*대구광역시', '대구광역시', address)
+            # 1. 중복된 지역명과 3-3 우편번호 제거 (중복 지역명은 하나만 남김)
+            address = _DUP_CITY_OR_ZIP_DASH_RE.sub(lambda m: m.group("city") or "", address)
             
-            # 2. 우편번호 제거 (5자리 숫자, 3-3 형태)
-            address = re.sub(r',?\s*\d{3}-\d{3}', '', address)
-            address = re.sub(r',?\s*\d{5}', '', address)
+            # 2. 5자리 우편번호 제거
+            address = _ZIP5_RE.sub('', address)
             
-            # 3. 불필요한 쉼표와 공백 정리
-            address = re.sub(r',+', ',', address)  # 연속 쉼표 제거
-            address = re.sub(r',\s*$', '', address)  # 끝부분 쉼표 제거
-            address = re.sub(r'^\s*,', '', address)  # 시작부분 쉼표 제거
-            address = re.sub(r'\s+', ' ', address)  # 연속 공백 제거
+            # 3. 불필요한 쉼표와 공백 정리 (시작/끝 쉼표 제거, 연속 쉼표·공백은 하나로)
+            address = _ADDRESS_PUNCT_RE.sub(lambda m: _ADDRESS_PUNCT_REPLACEMENTS[m.lastgroup], address)
             
             # 4. 앞뒤 공백 제거
-            address = address.strip()
-            
-            return address
+            return address.strip()
+
+def _clone_enhanced(enhanced_data: Dict) -> Dict:
+    """옵션별 작업용 복사본 - 일정 dict만 한 단계 복사 (일정의 최상위 필드만 수정하므로 충분)"""
+    clone = dict(enhanced_data)
+    for schedule_type in ("fixedSchedules", "flexibleSchedules"):
+        clone[schedule_type] = [dict(schedule) for schedule in enhanced_data.get(schedule_type, [])]
+    return clone
+
 # 5. 지능형 다중 옵션 생성
 async def create_smart_multiple_options(enhanced_data: Dict, voice_input: str) -> Dict:
     """지능형 다중 옵션 생성 - 하드코딩 없이"""
+    debug_enabled = logger.isEnabledFor(logging.DEBUG)  # 로그 전용 루프는 DEBUG일 때만 실행
     
-    def force_log(msg):
-        print(f"🧠 {msg}")
-        logger.info(msg)
-    
-    force_log("지능형 다중 옵션 생성 시작")
+    logger.debug("지능형 다중 옵션 생성 시작")
     
     try:
         # 경로 정보 자동 추출
@@ -3123,7 +3717,7 @@ async def create_smart_multiple_options(enhanced_data: Dict, voice_input: str) -
         start_location = start_schedule.get("location") if start_schedule else None
         end_location = end_schedule.get("location") if end_schedule else None
         
-        force_log(f"자동 추출된 경로: {start_location} → {end_location}")
+        logger.debug("자동 추출된 경로: %s → %s", start_location, end_location)
         
         # 🔥 다양한 옵션 생성 전략 (동적)
         option_strategies = [
@@ -3134,64 +3728,77 @@ async def create_smart_multiple_options(enhanced_data: Dict, voice_input: str) -
             {"focus": "diverse", "description": "다양한 지역 탐색"}
         ]
         
+        def build_search_context(focus: str) -> str:
+            """전략별 동적 검색 문구"""
+            if focus == "start_area":
+                # 출발지 근처 우선
+                return f"{start_location} 근처"
+            elif focus == "end_area":
+                # 목적지 근처 우선
+                return f"{end_location} 근처"
+            elif focus == "midway":
+                # 중간 지점 우선
+                return f"{start_location}에서 {end_location} 중간"
+            elif focus == "efficient":
+                # 최단 경로 우선
+                return f"{start_location}에서 {end_location} 최단경로"
+            else:  # diverse
+                # 다양한 지역 탐색
+                return f"{voice_input} 다양한 옵션"
+        
+        async def search_meal(strategy: Dict, schedule: Dict) -> Dict:
+            logger.debug("   식사 일정 재검색: %s 전략", strategy['focus'])
+            temp_schedule = dict(schedule)
+            temp_schedule["name"] = build_search_context(strategy["focus"])
+            return await smart_location_search(temp_schedule, start_location, end_location)
+        
+        # 🔥 옵션별 검색은 서로 독립적이므로 한꺼번에 동시 실행
+        # (중복 체크와 적용은 아래에서 옵션 순서대로 → 결과는 순차 실행과 동일)
+        meal_indices = [idx for idx, schedule in enumerate(fixed_schedules) if "식사" in schedule.get("name", "")]
+        search_results = iter(await asyncio.gather(*(
+            search_meal(strategy, fixed_schedules[idx])
+            for strategy in option_strategies
+            for idx in meal_indices
+        )))
+        
         options = []
-        used_locations = set()  # 중복 방지
+        used_locations = set()  # 로그용 주소 목록
+        used_coord_keys = set()  # 중복 방지 (좌표를 소수 셋째 자리(약 100m)로 묶어 주소 표기 차이 무시)
+        id_base = int(time.time() * 1000)  # 옵션 ID 공통 접두사 (호출당 한 번)
         
         for option_num, strategy in enumerate(option_strategies):
-            force_log(f"옵션 {option_num + 1} 생성: {strategy['description']}")
+            logger.debug("옵션 %s 생성: %s", option_num + 1, strategy['description'])
             
-            option_data = copy.deepcopy(enhanced_data)
+            option_data = _clone_enhanced(enhanced_data)
             
-            # 식사 일정 찾기 및 재검색
-            for schedule in option_data.get("fixedSchedules", []):
-                if "식사" in schedule.get("name", ""):
-                    force_log(f"   식사 일정 재검색: {strategy['focus']} 전략")
-                    
-                    # 🔥 전략별 동적 검색
-                    if strategy["focus"] == "start_area":
-                        # 출발지 근처 우선
-                        search_context = f"{start_location} 근처"
-                    elif strategy["focus"] == "end_area":
-                        # 목적지 근처 우선
-                        search_context = f"{end_location} 근처"
-                    elif strategy["focus"] == "midway":
-                        # 중간 지점 우선
-                        search_context = f"{start_location}에서 {end_location} 중간"
-                    elif strategy["focus"] == "efficient":
-                        # 최단 경로 우선
-                        search_context = f"{start_location}에서 {end_location} 최단경로"
-                    else:  # diverse
-                        # 다양한 지역 탐색
-                        search_context = f"{voice_input} 다양한 옵션"
-                    
-                    # 지능형 검색 수행
-                    original_name = schedule.get("name", "")
-                    temp_schedule = copy.deepcopy(schedule)
-                    temp_schedule["name"] = search_context
-                    
-                    enhanced_schedule = await smart_location_search(
-                        temp_schedule, 
-                        start_location, 
-                        end_location
-                    )
+            # 식사 일정에 검색 결과 적용
+            for idx in meal_indices:
+                schedule = option_data["fixedSchedules"][idx]
+                enhanced_schedule = next(search_results)
+                
+                # 결과 적용 (중복 체크)
+                new_location = enhanced_schedule.get("location", "")
+                latitude = enhanced_schedule.get("latitude", schedule.get("latitude"))
+                longitude = enhanced_schedule.get("longitude", schedule.get("longitude"))
+                # 좌표가 없으면 주소 문자열로 구분
+                coord_key = (round(latitude, 3), round(longitude, 3)) if latitude and longitude else new_location
+                if new_location and coord_key not in used_coord_keys:
+                    schedule["location"] = new_location
+                    schedule["latitude"] = latitude
+                    schedule["longitude"] = longitude
+                    schedule["name"] = f"옵션{option_num + 1} 식사"  # 옵션별 구분
                     
-                    # 결과 적용 (중복 체크)
-                    new_location = enhanced_schedule.get("location", "")
-                    if new_location and new_location not in used_locations:
-                        schedule["location"] = new_location
-                        schedule["latitude"] = enhanced_schedule.get("latitude", schedule.get("latitude"))
-                        schedule["longitude"] = enhanced_schedule.get("longitude", schedule.get("longitude"))
-                        schedule["name"] = f"옵션{option_num + 1} 식사"  # 옵션별 구분
-                        
-                        used_locations.add(new_location)
-                        force_log(f"   ✅ 새로운 위치: {new_location}")
-                    else:
-                        force_log(f"   ⚠️ 중복 또는 실패, 원본 유지")
+                    used_locations.add(new_location)
+                    used_coord_keys.add(coord_key)
+                    logger.debug("   ✅ 새로운 위치: %s", new_location)
+                else:
+                    logger.debug("   ⚠️ 중복 또는 실패, 원본 유지")
             
             # 고유 ID 부여
+            id_prefix = f"{id_base}_{option_num + 1}_"
             for schedule_type in ["fixedSchedules", "flexibleSchedules"]:
                 for j, schedule in enumerate(option_data.get(schedule_type, [])):
-                    schedule["id"] = f"{int(time.time() * 1000)}_{option_num + 1}_{j + 1}"
+                    schedule["id"] = id_prefix + str(j + 1)
             
             option = {
                 "optionId": option_num + 1,
@@ -3200,31 +3807,27 @@ async def create_smart_multiple_options(enhanced_data: Dict, voice_input: str) -
             }
             
             options.append(option)
-            force_log(f"✅ 옵션 {option_num + 1} 완성")
+            logger.debug("✅ 옵션 %s 완성", option_num + 1)
         
         final_result = {"options": options}
-        force_log(f"🎉 지능형 다중 옵션 생성 완료: {len(options)}개")
+        logger.debug("🎉 지능형 다중 옵션 생성 완료: %s개", len(options))
         
         # 결과 품질 검증
-        for i, option in enumerate(options):
-            for schedule in option.get("fixedSchedules", []):
-                if "식사" in schedule.get("name", ""):
-                    location = schedule.get("location", "")
-                    force_log(f"   옵션 {i+1} 검증: {location}")
+        if debug_enabled:
+            for i, option in enumerate(options):
+                for schedule in option.get("fixedSchedules", []):
+                    if "식사" in schedule.get("name", ""):
+                        location = schedule.get("location", "")
+                        logger.debug("   옵션 %s 검증: %s", i+1, location)
         
         return final_result
         
     except Exception as e:
-        force_log(f"❌ 지능형 옵션 생성 실패: {e}")
+        logger.info("❌ 지능형 옵션 생성 실패: %s", e)
         return {"options": []}
 
-def should_use_dynamic_system(enhanced_data: Dict, voice_input: str) -> bool:
-    """사용할 시스템 자동 결정"""
-    
-    fixed_schedules = enhanced_data.get("fixedSchedules", [])
-    
-    # 1. 브랜드 키워드가 있으면 동적 시스템
-    brand_keywords = [
+# 동적 시스템 선택용 브랜드/시설 키워드 (목록 순서 = 로그에 남길 키워드 우선순위)
+_DYNAMIC_BRAND_KEYWORDS: Final = (
     # ☕ 커피 전문점
     "스타벅스", "starbucks",
     "커피빈", "coffee bean", "coffeebean",
@@ -3431,35 +4034,46 @@ def should_use_dynamic_system(enhanced_data: Dict, voice_input: str) -> bool:
     "학원", "academy", "교육",
     "도서관", "library",
     "영화관", "cgv", "롯데시네마", "메가박스",
-]
+)
+# 정확히 일치하는 이름 조회용 (O(1) 멤버십)
+BRAND_KEYWORDS: Final = frozenset(_DYNAMIC_BRAND_KEYWORDS)
+_DYNAMIC_MEAL_KEYWORDS: Final = ("식사", "저녁", "점심", "아침", "밥", "맛집")
+
+# 모든 키워드를 하나의 정규식으로 묶어 문장당 한 번만 스캔
+_DYNAMIC_BRAND_MATCHER = KeywordMatcher.from_keywords(_DYNAMIC_BRAND_KEYWORDS)
+_MEAL_KEYWORD_MATCHER = KeywordMatcher.from_keywords(_DYNAMIC_MEAL_KEYWORDS)
+
+def should_use_dynamic_system(enhanced_data: Dict, voice_input: str) -> bool:
+    """사용할 시스템 자동 결정"""
+    
+    fixed_schedules = enhanced_data.get("fixedSchedules", [])
+    
+    # 1. 브랜드 키워드가 있으면 동적 시스템
     voice_lower = voice_input.lower()
+    # 일정 이름들은 한 번에 소문자로 (키워드에 줄바꿈이 없으므로 이름 경계를 넘는 매칭 없음)
+    names_lower = "\n".join(schedule.get("name", "") for schedule in fixed_schedules).lower()
     
-    for keyword in brand_keywords:
-        if keyword in voice_lower:
-            logger.info(f"🤖 브랜드 '{keyword}' 감지 → 동적 시스템 사용")
-            return True
+    keyword = _DYNAMIC_BRAND_MATCHER.first_keyword(voice_lower)
+    if keyword:
+        logger.info(f"🤖 브랜드 '{keyword}' 감지 → 동적 시스템 사용")
+        return True
     
     # 2. 일정에 브랜드명이 있으면 동적 시스템
-    for schedule in fixed_schedules:
-        schedule_name = schedule.get("name", "").lower()
-        for keyword in brand_keywords:
-            if keyword in schedule_name:
-                logger.info(f"🤖 일정에 브랜드 '{keyword}' 감지 → 동적 시스템 사용")
-                return True
+    keyword = _DYNAMIC_BRAND_MATCHER.first_keyword(names_lower)
+    if keyword:
+        logger.info(f"🤖 일정에 브랜드 '{keyword}' 감지 → 동적 시스템 사용")
+        return True
     
     # 3. 식사 관련은 기존 시스템 (더 안정적)
-    meal_keywords = ["식사", "저녁", "점심", "아침", "밥", "맛집"]
-    for keyword in meal_keywords:
-        if keyword in voice_lower:
-            logger.info(f"📋 식사 키워드 '{keyword}' 감지 → 기존 시스템 사용")
-            return False
-            
-    for schedule in fixed_schedules:
-        schedule_name = schedule.get("name", "").lower()
-        for keyword in meal_keywords:
-            if keyword in schedule_name:
-                logger.info(f"📋 일정에 식사 키워드 '{keyword}' 감지 → 기존 시스템 사용")
-                return False
+    keyword = _MEAL_KEYWORD_MATCHER.first_keyword(voice_lower)
+    if keyword:
+        logger.info(f"📋 식사 키워드 '{keyword}' 감지 → 기존 시스템 사용")
+        return False
+    
+    keyword = _MEAL_KEYWORD_MATCHER.first_keyword(names_lower)
+    if keyword:
+        logger.info(f"📋 일정에 식사 키워드 '{keyword}' 감지 → 기존 시스템 사용")
+        return False
     
     # 4. 기본값: 기존 시스템 (안전)
     logger.info("📋 기본 설정 → 기존 시스템 사용")
@@ -3467,22 +4081,20 @@ def should_use_dynamic_system(enhanced_data: Dict, voice_input: str) -> bool:
 
 async def create_multiple_options(self, enhanced_data: Dict, voice_input: str) -> Dict:
     """완전 동적 다중 옵션 생성 - 위치 중복 방지 강화"""
+    debug_enabled = logger.isEnabledFor(logging.DEBUG)  # 로그 전용 루프는 DEBUG일 때만 실행
     
-    def force_log(msg):
-        print(f"🎯 {msg}")
-        logger.info(msg)
-    
-    force_log("🆕 동적 다중 옵션 생성 시작 (위치 중복 방지)")
-    force_log(f"입력 데이터: voice_input='{voice_input}'")
+    logger.debug("🆕 동적 다중 옵션 생성 시작 (위치 중복 방지)")
+    logger.debug("입력 데이터: voice_input='%s'", voice_input)
     
     # 입력 데이터 상세 로깅
     fixed_schedules = enhanced_data.get("fixedSchedules", [])
-    force_log(f"고정 일정 수: {len(fixed_schedules)}개")
-    for i, schedule in enumerate(fixed_schedules):
-        force_log(f"  고정 일정 {i+1}: '{schedule.get('name', 'N/A')}' (ID: {schedule.get('id', 'N/A')})")
+    logger.debug("고정 일정 수: %s개", len(fixed_schedules))
+    if debug_enabled:
+        for i, schedule in enumerate(fixed_schedules):
+            logger.debug("  고정 일정 %s: '%s' (ID: %s)", i+1, schedule.get('name', 'N/A'), schedule.get('id', 'N/A'))
     
     if len(fixed_schedules) < 2:
-        force_log("⚠️ 경로 분석에 필요한 최소 일정 부족 (2개 미만)")
+        logger.debug("⚠️ 경로 분석에 필요한 최소 일정 부족 (2개 미만)")
         return {"options": [enhanced_data]}  # 단일 옵션 반환
     
     # 1. 경로 정보 자동 추출
@@ -3492,30 +4104,37 @@ async def create_multiple_options(self, enhanced_data: Dict, voice_input: str) -
     start_coord = (start_schedule.get("latitude"), start_schedule.get("longitude"))
     end_coord = (end_schedule.get("latitude"), end_schedule.get("longitude"))
     
-    force_log(f"📍 경로 분석:")
-    force_log(f"  시작: {start_schedule.get('name')} ({start_coord})")
-    force_log(f"  종료: {end_schedule.get('name')} ({end_coord})")
+    logger.debug("📍 경로 분석:")
+    logger.debug("  시작: %s (%s)", start_schedule.get('name'), start_coord)
+    logger.debug("  종료: %s (%s)", end_schedule.get('name'), end_coord)
     
     # 2. 변경 가능한 일정 자동 식별 (로깅 강화)
     variable_schedules = self.identify_variable_schedules(fixed_schedules, voice_input)
     
-    force_log(f"🔍 변경 가능한 일정 식별 결과: {len(variable_schedules)}개")
-    for i, var_info in enumerate(variable_schedules):
-        force_log(f"  변경 가능 {i+1}: 인덱스={var_info['index']}, 브랜드='{var_info['brand']}', 원본명='{var_info['original_name']}'")
+    logger.debug("🔍 변경 가능한 일정 식별 결과: %s개", len(variable_schedules))
+    if debug_enabled:
+        for i, var_info in enumerate(variable_schedules):
+            logger.debug("  변경 가능 %s: 인덱스=%s, 브랜드='%s', 원본명='%s'", i+1, var_info['index'], var_info['brand'], var_info['original_name'])
     
     if not variable_schedules:
-        force_log("⚠️ 변경 가능한 일정이 없음 → 단일 옵션 반환")
+        logger.debug("⚠️ 변경 가능한 일정이 없음 → 단일 옵션 반환")
         return {"options": [enhanced_data]}
     
     # 🔥 전역 위치 추적
     used_locations = set()
     
+    # 🔥 옵션별 중간 지역과 브랜드 검색을 미리 동시에 실행 (선택은 아래에서 옵션 순서대로)
+    intermediate_areas_by_option = await self.prefetch_brand_branches(
+        [var_info["brand"] for var_info in variable_schedules], start_coord, end_coord, total_options=5
+    )
+    
     # 3. 각 변경 가능한 일정에 대해 동적 옵션 생성
     options = []
+    id_base = int(time.time() * 1000)  # 옵션 ID 공통 접두사 (호출당 한 번)
     for option_num in range(5):
-        force_log(f"🔄 옵션 {option_num + 1} 동적 생성 시작")
+        logger.debug("🔄 옵션 %s 동적 생성 시작", option_num + 1)
         
-        option_data = copy.deepcopy(enhanced_data)
+        option_data = _clone_enhanced(enhanced_data)
         option_modified = False
         
         for var_info in variable_schedules:
@@ -3523,32 +4142,29 @@ async def create_multiple_options(self, enhanced_data: Dict, voice_input: str) -
             schedule = option_data["fixedSchedules"][schedule_idx]
             brand_name = var_info["brand"]
             
-            force_log(f"  📝 일정 수정: 인덱스={schedule_idx}, 브랜드='{brand_name}'")
-            force_log(f"    현재 이름: '{schedule.get('name')}'")
-            force_log(f"    현재 위치: '{schedule.get('location')}'")
+            logger.debug("  📝 일정 수정: 인덱스=%s, 브랜드='%s'", schedule_idx, brand_name)
+            logger.debug("    현재 이름: '%s'", schedule.get('name'))
+            logger.debug("    현재 위치: '%s'", schedule.get('location'))
             
             # 🔥 현재 위치를 사용된 위치에 추가 (첫 번째 옵션용)
             current_location = schedule.get("location", "")
             if option_num == 0 and current_location:
                 used_locations.add(current_location)
-                force_log(f"    📝 원본 위치 추가: {current_location}")
+                logger.debug("    📝 원본 위치 추가: %s", current_location)
             
-            # 4. 동적 중간 지역 계산
-            force_log(f"  🗺️ 중간 지역 계산 (옵션 {option_num + 1})")
-            intermediate_areas = await self.calculate_intermediate_areas(
-                start_coord, end_coord, option_num, total_options=5
-            )
-            force_log(f"    계산된 중간 지역: {intermediate_areas}")
+            # 4. 동적 중간 지역 (미리 계산됨)
+            intermediate_areas = intermediate_areas_by_option[option_num]
+            logger.debug("    계산된 중간 지역: %s", intermediate_areas)
             
             # 5. 해당 지역에서 브랜드 검색 (사용된 위치 제외)
-            force_log(f"  🔍 브랜드 검색: '{brand_name}' (제외: {len(used_locations)}개 위치)")
+            logger.debug("  🔍 브랜드 검색: '%s' (제외: %s개 위치)", brand_name, len(used_locations))
             best_location = await self.find_optimal_branch(
                 brand_name, intermediate_areas, start_coord, end_coord, used_locations
             )
             
             if best_location:
-                force_log(f"    ✅ 검색 성공: {best_location.get('name')}")
-                force_log(f"      주소: {best_location.get('address')}")
+                logger.debug("    ✅ 검색 성공: %s", best_location.get('name'))
+                logger.debug("      주소: %s", best_location.get('address'))
                 
                 if best_location.get("address") != schedule.get("location"):
                     # 위치 업데이트
@@ -3559,26 +4175,27 @@ async def create_multiple_options(self, enhanced_data: Dict, voice_input: str) -
                     schedule["name"] = best_location["name"]
                     
                     option_modified = True
-                    force_log(f"    🔄 위치 변경:")
-                    force_log(f"      이전: {old_location}")
-                    force_log(f"      이후: {best_location['address']}")
+                    logger.debug("    🔄 위치 변경:")
+                    logger.debug("      이전: %s", old_location)
+                    logger.debug("      이후: %s", best_location['address'])
                 else:
-                    force_log(f"    ⚠️ 동일한 위치라서 변경 없음")
+                    logger.debug("    ⚠️ 동일한 위치라서 변경 없음")
             else:
-                force_log(f"    ❌ 검색 실패: 새로운 위치 없음")
+                logger.info("    ❌ 검색 실패: 새로운 위치 없음")
                 # 🔥 원본 위치도 사용하지 않음 (첫 번째 옵션 제외)
                 if option_num > 0:
-                    force_log(f"    ⏭️ 이 옵션 건너뛰기 (새로운 위치 없음)")
+                    logger.debug("    ⏭️ 이 옵션 건너뛰기 (새로운 위치 없음)")
                     break
         
         # 6. 수정된 옵션만 추가 (중복 방지)
         if option_modified or option_num == 0:  # 첫 번째는 원본 유지
             # 고유 ID 부여
+            id_prefix = f"{id_base}_{option_num + 1}_"
             for j, schedule in enumerate(option_data["fixedSchedules"]):
                 old_id = schedule.get("id")
-                new_id = f"{int(time.time() * 1000)}_{option_num + 1}_{j + 1}"
+                new_id = id_prefix + str(j + 1)
                 schedule["id"] = new_id
-                force_log(f"    🆔 ID 업데이트: {old_id} → {new_id}")
+                logger.debug("    🆔 ID 업데이트: %s → %s", old_id, new_id)
             
             options.append({
                 "optionId": option_num + 1,
@@ -3586,25 +4203,27 @@ async def create_multiple_options(self, enhanced_data: Dict, voice_input: str) -
                 "flexibleSchedules": option_data.get("flexibleSchedules", [])
             })
             
-            force_log(f"  ✅ 옵션 {option_num + 1} 생성 완료 (수정됨: {option_modified})")
+            logger.debug("  ✅ 옵션 %s 생성 완료 (수정됨: %s)", option_num + 1, option_modified)
         else:
-            force_log(f"  ❌ 옵션 {option_num + 1} 건너뛰기 (중복 위치)")
+            logger.debug("  ❌ 옵션 %s 건너뛰기 (중복 위치)", option_num + 1)
     
     # 7. 중복 제거
     unique_options = self.remove_duplicate_options(options)
-    force_log(f"🔄 중복 제거 결과: {len(options)}개 → {len(unique_options)}개")
+    logger.debug("🔄 중복 제거 결과: %s개 → %s개", len(options), len(unique_options))
     
     # 8. 최종 결과
-    force_log(f"🎉 동적 옵션 생성 완료: {len(unique_options)}개")
-    force_log(f"📊 최종 사용된 위치: {len(used_locations)}개")
-    for i, location in enumerate(used_locations):
-        force_log(f"  위치 {i+1}: {location}")
+    logger.debug("🎉 동적 옵션 생성 완료: %s개", len(unique_options))
+    logger.debug("📊 최종 사용된 위치: %s개", len(used_locations))
+    if debug_enabled:
+        for i, location in enumerate(used_locations):
+            logger.debug("  위치 %s: %s", i+1, location)
     
     # 생성된 옵션들 상세 로깅
-    for i, option in enumerate(unique_options):
-        force_log(f"📋 최종 옵션 {i+1}:")
-        for j, schedule in enumerate(option.get("fixedSchedules", [])):
-            force_log(f"  일정 {j+1}: '{schedule.get('name')}' @ {schedule.get('location')}")
+    if debug_enabled:
+        for i, option in enumerate(unique_options):
+            logger.debug("📋 최종 옵션 %s:", i+1)
+            for j, schedule in enumerate(option.get("fixedSchedules", [])):
+                logger.debug("  일정 %s: '%s' @ %s", j+1, schedule.get('name'), schedule.get('location'))
     
     return {"options": unique_options}
 
@@ -3616,53 +4235,47 @@ async def find_optimal_branch(self, brand_name: str, intermediate_areas: List[Tu
     if used_locations is None:
         used_locations = set()
     
-    def force_log(msg):
-        print(f"🔍 {msg}")
-        logger.info(msg)
-    
-    force_log(f"최적 브랜드 지점 검색: '{brand_name}'")
-    force_log(f"검색 지역: {len(intermediate_areas)}개")
-    force_log(f"제외할 위치: {len(used_locations)}개 - {list(used_locations)}")
-    
-    best_location = None
-    best_efficiency = 0
+    logger.debug("최적 브랜드 지점 검색: '%s'", brand_name)
+    logger.debug("검색 지역: %s개", len(intermediate_areas))
+    logger.debug("제외할 위치: %s개 - %s", len(used_locations), used_locations)
     
+    candidates = []
     for i, coord in enumerate(intermediate_areas):
-        force_log(f"지역 {i+1} 검색: 좌표 ({coord[0]:.4f}, {coord[1]:.4f})")
+        logger.debug("지역 %s 검색: 좌표 (%.4f, %.4f)", i+1, coord[0], coord[1])
         
         # 해당 좌표 근처에서 브랜드 검색
-        candidates = await self.search_brand_near_coordinate(brand_name, coord)
-        force_log(f"  검색 결과: {len(candidates)}개 후보")
-        
-        for j, candidate in enumerate(candidates):
-            location = candidate.get('address', '')
-            force_log(f"    후보 {j+1}: {candidate.get('name')} @ {location}")
-            
-            # 🔥 이미 사용된 위치인지 확인
-            if location in used_locations:
-                force_log(f"      ❌ 이미 사용된 위치라서 제외")
-                continue
-                
-            # 경로 효율성 계산
-            efficiency = self.calculate_route_efficiency(
-                start_coord, 
-                (candidate["latitude"], candidate["longitude"]), 
-                end_coord
-            )
-            force_log(f"      효율성: {efficiency:.3f}")
-            
-            if efficiency > best_efficiency:
-                best_efficiency = efficiency
-                best_location = candidate
-                force_log(f"      🔥 새로운 최적 후보: {candidate.get('name')} (효율성: {efficiency:.3f})")
+        area_candidates = await self.search_brand_near_coordinate(brand_name, coord)
+        logger.debug("  검색 결과: %s개 후보", len(area_candidates))
+        candidates.extend(area_candidates)
+    
+    # 🔥 이미 사용된 위치를 제외하고 남은 후보 전체의 경로 효율성을 한 번에 계산
+    available = [candidate for candidate in candidates if candidate.get('address', '') not in used_locations]
+    efficiencies = calculate_route_efficiency_batch(
+        start_coord,
+        [(candidate["latitude"], candidate["longitude"]) for candidate in available],
+        end_coord
+    )
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("  제외 후 후보: %s개 / %s개", len(available), len(candidates))
+        for j, (candidate, efficiency) in enumerate(zip(available, efficiencies)):
+            logger.debug("    후보 %s: %s @ %s (효율성: %.3f)", j+1, candidate.get('name'), candidate.get('address'), efficiency)
+    
+    # 효율성이 가장 높은 후보 (동점이면 먼저 검색된 후보, 효율성 0은 선택하지 않음)
+    best_location = None
+    best_efficiency = 0
+    if efficiencies:
+        best_idx = max(range(len(efficiencies)), key=efficiencies.__getitem__)
+        if efficiencies[best_idx] > best_efficiency:
+            best_efficiency = efficiencies[best_idx]
+            best_location = available[best_idx]
     
     if best_location:
-        force_log(f"✅ 최종 선택: {best_location['name']} (효율성: {best_efficiency:.3f})")
+        logger.debug("✅ 최종 선택: %s (효율성: %.3f)", best_location['name'], best_efficiency)
         # 🔥 사용된 위치 추가
         used_locations.add(best_location['address'])
-        force_log(f"📝 사용된 위치에 추가: {best_location['address']}")
+        logger.debug("📝 사용된 위치에 추가: %s", best_location['address'])
     else:
-        force_log(f"❌ 적절한 지점을 찾지 못함 (모두 사용된 위치이거나 검색 실패)")
+        logger.info("❌ 적절한 지점을 찾지 못함 (모두 사용된 위치이거나 검색 실패)")
     
     return best_location
 
@@ -3717,7 +4330,7 @@ def extract_region_info(location: str) -> Dict[str, str]:
     # KOREA_REGIONS 데이터 활용해서 동적 매칭
     for full_region, districts in KOREA_REGIONS.items():
         # 시/도 매칭
-        region_variants = region_normalizer.get_region_variants(full_region)
+        region_variants = get_region_variants(full_region)
         
         for variant in region_variants:
             if variant in location:
@@ -3755,70 +4368,91 @@ async def create_traditional_options(enhanced_data: Dict, voice_input: str, excl
         global_used_restaurants = set()
         global_used_locations = set()
         
+        meal_words = ["식사", "식당", "밥", "맛집", "먹기", "햄버거"]
+        meal_indices = [
+            schedule_idx for schedule_idx, schedule in enumerate(fixed_schedules)
+            if any(word in schedule.get("name", "").lower() for word in meal_words)
+        ]
+        
+        # 🔥 완전 동적 검색 전략 생성 (옵션 번호에만 의존)
+        strategies_by_option = [
+            get_diversified_search_strategy(option_num, region_info["region"], region_info["district"])
+            for option_num in range(5)
+        ] if meal_indices else [[] for _ in range(5)]
+        
+        reference_schedules = [{"location": start_location}] if start_location else []
+        
+        async def search_strategy(strategy: str):
+            # GPT 분석 (동적) → 🔥 Kakao 검색 (결과 다양화)
+            analysis = await TripleLocationSearchService.analyze_location_with_gpt(
+                strategy, reference_location=start_location
+            )
+            return await TripleLocationSearchService.search_kakao(analysis, reference_schedules)
+        
+        # 🔥 옵션별 첫 번째 전략 검색은 서로 독립적이므로 미리 동시에 실행
+        # (GPT 분석은 run_in_executor로 스레드 풀에서, Kakao 검색은 이벤트 루프에서 겹쳐 진행)
+        # 중복 체크는 아래에서 옵션 순서대로, 첫 전략이 중복일 때만 다음 전략을 순서대로 검색.
+        # 식사 일정이 여러 개면 뒤 일정도 같은 prefetched 결과를 다시 읽는데, 순차 실행에서도
+        # 같은 전략은 _ANALYSIS_CACHE·_PROVIDER_SEARCH_CACHE에서 같은 결과를 받으므로 선택 결과는 같음
+        first_results = await asyncio.gather(*(
+            search_strategy(strategies[0]) for strategies in strategies_by_option if strategies
+        ), return_exceptions=True)
+        prefetched = dict(zip(
+            (strategies[0] for strategies in strategies_by_option if strategies), first_results
+        ))
+        
         for option_num in range(5):
             logger.info(f"🔄 옵션 {option_num + 1} 생성 (동적 전략)")
             
-            option_data = copy.deepcopy(enhanced_data)
+            option_data = _clone_enhanced(enhanced_data)
             option_modified = False
             
-            for schedule_idx, schedule in enumerate(option_data.get("fixedSchedules", [])):
-                schedule_name = schedule.get("name", "").lower()
+            for schedule_idx in meal_indices:
+                schedule = option_data["fixedSchedules"][schedule_idx]
+                restaurant_result = None
                 
-                if any(word in schedule_name for word in ["식사", "식당", "밥", "맛집", "먹기", "햄버거"]):
-                    
-                    # 🔥 완전 동적 검색 전략 생성
-                    search_strategies = get_diversified_search_strategy(
-                        option_num, 
-                        region_info["region"], 
-                        region_info["district"]
-                    )
-                    
-                    restaurant_result = None
+                for strategy in strategies_by_option[option_num]:
+                    logger.info(f"   🔍 옵션 {option_num + 1} 검색: {strategy}")
                     
-                    for strategy in search_strategies:
-                        logger.info(f"   🔍 옵션 {option_num + 1} 검색: {strategy}")
+                    try:
+                        if strategy in prefetched:
+                            kakao_result = prefetched[strategy]
+                            if isinstance(kakao_result, Exception):
+                                raise kakao_result
+                        else:
+                            kakao_result = await search_strategy(strategy)
                         
-                        try:
-                            # GPT 분석 (동적)
-                            analysis = await TripleLocationSearchService.analyze_location_with_gpt(
-                                strategy, reference_location=start_location
-                            )
+                        if kakao_result and kakao_result.name:
+                            candidate_name = kakao_result.name
+                            candidate_location = clean_address(kakao_result.address)
                             
-                            # 🔥 Kakao 검색 (결과 다양화)
-                            reference_schedules = [{"location": start_location}] if start_location else []
-                            kakao_result = await TripleLocationSearchService.search_kakao(analysis, reference_schedules)
+                            # 🔥 전역 중복 체크
+                            if (candidate_name in global_used_restaurants or 
+                                candidate_location in global_used_locations):
+                                logger.info(f"     ❌ 중복 제외: {candidate_name}")
+                                continue
                             
-                            if kakao_result and kakao_result.name:
-                                candidate_name = kakao_result.name
-                                candidate_location = clean_address(kakao_result.address)
-                                
-                                # 🔥 전역 중복 체크
-                                if (candidate_name in global_used_restaurants or 
-                                    candidate_location in global_used_locations):
-                                    logger.info(f"     ❌ 중복 제외: {candidate_name}")
-                                    continue
-                                
-                                # 🔥 새로운 식당 발견하면 즉시 중단
-                                restaurant_result = kakao_result
-                                global_used_restaurants.add(candidate_name)
-                                global_used_locations.add(candidate_location)
-                                logger.info(f"     ✅ 새로운 식당: {candidate_name}")
-                                break  # 🔥 성공하면 즉시 중단!
-                                
-                        except Exception as e:
-                            logger.error(f"     ❌ 검색 오류: {e}")
-                            continue
-                    
-                    # 결과 적용
-                    if restaurant_result:
-                        schedule["name"] = restaurant_result.name
-                        schedule["location"] = clean_address(restaurant_result.address)
-                        schedule["latitude"] = restaurant_result.latitude
-                        schedule["longitude"] = restaurant_result.longitude
-                        option_modified = True
-                        logger.info(f"   🎯 식당 적용: {restaurant_result.name}")
-                    else:
-                        logger.info(f"   ⚠️ 새로운 식당 찾기 실패, 원본 유지")
+                            # 🔥 새로운 식당 발견하면 즉시 중단
+                            restaurant_result = kakao_result
+                            global_used_restaurants.add(candidate_name)
+                            global_used_locations.add(candidate_location)
+                            logger.info(f"     ✅ 새로운 식당: {candidate_name}")
+                            break  # 🔥 성공하면 즉시 중단!
+                            
+                    except Exception as e:
+                        logger.error(f"     ❌ 검색 오류: {e}")
+                        continue
+                
+                # 결과 적용
+                if restaurant_result:
+                    schedule["name"] = restaurant_result.name
+                    schedule["location"] = clean_address(restaurant_result.address)
+                    schedule["latitude"] = restaurant_result.latitude
+                    schedule["longitude"] = restaurant_result.longitude
+                    option_modified = True
+                    logger.info(f"   🎯 식당 적용: {restaurant_result.name}")
+                else:
+                    logger.info(f"   ⚠️ 새로운 식당 찾기 실패, 원본 유지")
             
             # 🔥 고유 ID 설정
             current_time = int(time.time() * 1000)
@@ -3848,7 +4482,7 @@ async def create_traditional_options(enhanced_data: Dict, voice_input: str, excl
         current_time = int(time.time() * 1000)
         
         for i in range(5):
-            option_data = copy.deepcopy(enhanced_data)
+            option_data = _clone_enhanced(enhanced_data)
             
             for schedule_type in ["fixedSchedules", "flexibleSchedules"]:
                 for j, schedule in enumerate(option_data.get(schedule_type, [])):
@@ -3936,9 +4570,9 @@ async def extract_schedule(request: ScheduleRequest):
             force_log("🚀 LangChain 체인 호출 시작")
             force_log(f"📝 입력 데이터: {request.voice_input[:100]}...")
             
-            # 비동기 실행
+            # 비동기 실행 (LangChain 네이티브 async 호출, 타임아웃 시 요청도 함께 취소)
             schedule_data = await asyncio.wait_for(
-                run_in_executor(lambda: chain.invoke({"input": request.voice_input})),
+                chain.ainvoke({"input": request.voice_input}),
                 timeout=30  # 30초 타임아웃
             )
             
@@ -4030,8 +4664,9 @@ async def extract_schedule(request: ScheduleRequest):
         force_log("Step 3: 위치 정보 보강 및 주소 정제")
         
         try:
+            # 원본 schedule_data는 이후 보강 결과로 대체되므로 복사 없이 제자리에서 보강
             enhanced_data = await asyncio.wait_for(
-                enhance_locations_with_triple_api(schedule_data),
+                enhance_locations_with_triple_api(schedule_data, inplace=True),
                 timeout=30
             )
             force_log("✅ 위치 정보 보강 완료")
@@ -4092,7 +4727,7 @@ async def search_restaurants_directly(search_query: str, used_restaurants: Set[s
     
     try:
         url = "https://dapi.kakao.com/v2/local/search/keyword.json"
-        headers = {"Authorization": f"KakaoAK {KAKAO_REST_API_KEY}"}
+        headers = _KAKAO_HEADERS
         
         params = {
             "query": search_query,
@@ -4102,39 +4737,35 @@ async def search_restaurants_directly(search_query: str, used_restaurants: Set[s
         
         print(f"🔍 직접 검색: '{search_query}'")
         
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url, headers=headers, params=params) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    
-                    if data.get("documents"):
-                        for place in data["documents"]:
-                            place_name = place.get("place_name", "")
-                            address = place.get("road_address_name") or place.get("address_name", "")
-                            category = place.get("category_name", "")
-                            
-                            # 이미 사용된 식당 제외
-                            if place_name in used_restaurants:
-                                continue
-                            
-                            # 부정적 키워드 필터링
-                            negative_keywords = ["학원", "병원", "약국", "은행", "부동산"]
-                            if any(neg in place_name.lower() for neg in negative_keywords):
-                                continue
-                            
-                            print(f"   ✅ 발견: {place_name} @ {address}")
-                            
-                            return {
-                                "name": place_name,
-                                "address": clean_address(address),
-                                "latitude": float(place.get("y", 0)),
-                                "longitude": float(place.get("x", 0)),
-                                "category": category
-                            }
-                    
-                    print(f"   ⚠️ 검색 결과 없음: {search_query}")
-                else:
-                    print(f"   ❌ API 오류: {response.status}")
+        # 후보 목록 전체를 캐시 - 같은 검색어면 제외 목록이 달라도 캐시된 응답에서 다른 식당 선택
+        data = await fetch_api_json("Kakao", url, params, headers)
+        if data is not None:
+            if data.get("documents"):
+                for place in data["documents"]:
+                    place_name = place.get("place_name", "")
+                    address = place.get("road_address_name") or place.get("address_name", "")
+                    category = place.get("category_name", "")
+                        
+                    # 이미 사용된 식당 제외
+                    if place_name in used_restaurants:
+                        continue
+                        
+                    # 부정적 키워드 필터링
+                    negative_keywords = ["학원", "병원", "약국", "은행", "부동산"]
+                    if any(neg in place_name.lower() for neg in negative_keywords):
+                        continue
+                        
+                    print(f"   ✅ 발견: {place_name} @ {address}")
+                        
+                    return {
+                        "name": place_name,
+                        "address": clean_address(address),
+                        "latitude": float(place.get("y", 0)),
+                        "longitude": float(place.get("x", 0)),
+                        "category": category
+                    }
+                
+            print(f"   ⚠️ 검색 결과 없음: {search_query}")
         
         return None
         
@@ -4309,7 +4940,7 @@ async def expand_schedule_options(request: ScheduleExpansionRequest):
             
             # 비동기 실행 (타임아웃 단축)
             llm_result = await asyncio.wait_for(
-                run_in_executor(lambda: chain.invoke({"input": synthetic_voice_input})),
+                chain.ainvoke({"input": synthetic_voice_input}),
                 timeout=15  # 🔥 30초 → 15초로 단축
             )
             
@@ -4713,7 +5344,7 @@ async def search_restaurants_directly_no_duplicate(search_query: str, used_resta
     
     try:
         url = "https://dapi.kakao.com/v2/local/search/keyword.json"
-        headers = {"Authorization": f"KakaoAK {KAKAO_REST_API_KEY}"}
+        headers = _KAKAO_HEADERS
         
         params = {
             "query": search_query,
@@ -4723,64 +5354,60 @@ async def search_restaurants_directly_no_duplicate(search_query: str, used_resta
         
         print(f"🔍 중복방지 검색: '{search_query}' (제외: {len(used_restaurants)}개)")
         
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url, headers=headers, params=params, timeout=3) as response:
-                if response.status == 200:
-                    data = await response.json()
+        # 후보 목록 전체를 캐시 - 같은 검색어면 제외 목록이 달라도 캐시된 응답에서 다른 식당 선택
+        data = await fetch_api_json("Kakao", url, params, headers, timeout=3)
+        if data is not None:
+            if data.get("documents"):
+                print(f"   📋 검색 결과: {len(data['documents'])}개 후보")
                     
-                    if data.get("documents"):
-                        print(f"   📋 검색 결과: {len(data['documents'])}개 후보")
+                for i, place in enumerate(data["documents"]):
+                    place_name = place.get("place_name", "")
+                    address = place.get("road_address_name") or place.get("address_name", "")
+                    category = place.get("category_name", "")
                         
-                        for i, place in enumerate(data["documents"]):
-                            place_name = place.get("place_name", "")
-                            address = place.get("road_address_name") or place.get("address_name", "")
-                            category = place.get("category_name", "")
-                            
-                            print(f"     후보 {i+1}: {place_name} ({category})")
-                            
-                            # 🔥 엄격한 중복 체크
-                            if place_name in used_restaurants:
-                                print(f"       ❌ 이미 사용됨: {place_name}")
-                                continue
-                            
-                            # 🔥 부정 키워드 체크
-                            negative_keywords = ["학원", "병원", "약국", "은행", "부동산", "컨설팅", "사무실", "법무", "세무"]
-                            if any(neg in place_name.lower() for neg in negative_keywords):
-                                print(f"       ❌ 부정 키워드: {place_name}")
-                                continue
-                            
-                            # 🔥 음식점 카테고리 확인 (더 포괄적)
-                            category_lower = category.lower()
-                            food_categories = [
-                                "음식점", "식당", "카페", "레스토랑", "한식", "중식", "일식", "양식", "분식",
-                                "치킨", "피자", "햄버거", "커피", "디저트", "베이커리", "술집", "bar", "pub"
-                            ]
-                            
-                            has_food_category = any(food_cat in category_lower for food_cat in food_categories)
-                            
-                            if not has_food_category:
-                                print(f"       ❌ 음식점 아님: {category}")
-                                continue
-                            
-                            # 🔥 성공한 경우
-                            result = {
-                                "name": place_name,
-                                "address": clean_address(address),
-                                "latitude": float(place.get("y", 0)),
-                                "longitude": float(place.get("x", 0))
-                            }
-                            
-                            print(f"       ✅ 선택됨: {place_name}")
-                            print(f"         주소: {result['address']}")
-                            print(f"         카테고리: {category}")
-                            
-                            return result
+                    print(f"     후보 {i+1}: {place_name} ({category})")
                         
-                        print(f"   ⚠️ 모든 후보가 필터링됨")
-                    else:
-                        print(f"   ⚠️ 검색 결과 없음")
-                else:
-                    print(f"   ❌ API 오류: {response.status}")
+                    # 🔥 엄격한 중복 체크
+                    if place_name in used_restaurants:
+                        print(f"       ❌ 이미 사용됨: {place_name}")
+                        continue
+                        
+                    # 🔥 부정 키워드 체크
+                    negative_keywords = ["학원", "병원", "약국", "은행", "부동산", "컨설팅", "사무실", "법무", "세무"]
+                    if any(neg in place_name.lower() for neg in negative_keywords):
+                        print(f"       ❌ 부정 키워드: {place_name}")
+                        continue
+                        
+                    # 🔥 음식점 카테고리 확인 (더 포괄적)
+                    category_lower = category.lower()
+                    food_categories = [
+                        "음식점", "식당", "카페", "레스토랑", "한식", "중식", "일식", "양식", "분식",
+                        "치킨", "피자", "햄버거", "커피", "디저트", "베이커리", "술집", "bar", "pub"
+                    ]
+                        
+                    has_food_category = any(food_cat in category_lower for food_cat in food_categories)
+                        
+                    if not has_food_category:
+                        print(f"       ❌ 음식점 아님: {category}")
+                        continue
+                        
+                    # 🔥 성공한 경우
+                    result = {
+                        "name": place_name,
+                        "address": clean_address(address),
+                        "latitude": float(place.get("y", 0)),
+                        "longitude": float(place.get("x", 0))
+                    }
+                        
+                    print(f"       ✅ 선택됨: {place_name}")
+                    print(f"         주소: {result['address']}")
+                    print(f"         카테고리: {category}")
+                        
+                    return result
+                    
+                print(f"   ⚠️ 모든 후보가 필터링됨")
+            else:
+                print(f"   ⚠️ 검색 결과 없음")
         
         return None
         
@@ -4796,7 +5423,7 @@ async def search_restaurants_directly_no_duplicate(search_query: str, used_resta
     
     try:
         url = "https://dapi.kakao.com/v2/local/search/keyword.json"
-        headers = {"Authorization": f"KakaoAK {KAKAO_REST_API_KEY}"}
+        headers = _KAKAO_HEADERS
         
         params = {
             "query": search_query,
@@ -4804,37 +5431,35 @@ async def search_restaurants_directly_no_duplicate(search_query: str, used_resta
             "sort": "accuracy"
         }
         
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url, headers=headers, params=params, timeout=3) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    
-                    if data.get("documents"):
-                        for place in data["documents"]:
-                            place_name = place.get("place_name", "")
-                            address = place.get("road_address_name") or place.get("address_name", "")
-                            
-                            # 🔥 엄격한 중복 체크
-                            if place_name in used_restaurants:
-                                continue
-                            
-                            # 🔥 부정 키워드 체크
-                            negative_keywords = ["학원", "병원", "약국", "은행", "부동산", "컨설팅"]
-                            if any(neg in place_name.lower() for neg in negative_keywords):
-                                continue
-                            
-                            # 🔥 음식점 카테고리 확인
-                            category = place.get("category_name", "").lower()
-                            food_categories = ["음식점", "식당", "카페", "레스토랑", "한식", "중식", "일식", "양식", "분식"]
-                            if not any(food_cat in category for food_cat in food_categories):
-                                continue
-                            
-                            return {
-                                "name": place_name,
-                                "address": clean_address(address),
-                                "latitude": float(place.get("y", 0)),
-                                "longitude": float(place.get("x", 0))
-                            }
+        # 후보 목록 전체를 캐시 - 같은 검색어면 제외 목록이 달라도 캐시된 응답에서 다른 식당 선택
+        data = await fetch_api_json("Kakao", url, params, headers, timeout=3)
+        if data is not None:
+            if data.get("documents"):
+                for place in data["documents"]:
+                    place_name = place.get("place_name", "")
+                    address = place.get("road_address_name") or place.get("address_name", "")
+                        
+                    # 🔥 엄격한 중복 체크
+                    if place_name in used_restaurants:
+                        continue
+                        
+                    # 🔥 부정 키워드 체크
+                    negative_keywords = ["학원", "병원", "약국", "은행", "부동산", "컨설팅"]
+                    if any(neg in place_name.lower() for neg in negative_keywords):
+                        continue
+                        
+                    # 🔥 음식점 카테고리 확인
+                    category = place.get("category_name", "").lower()
+                    food_categories = ["음식점", "식당", "카페", "레스토랑", "한식", "중식", "일식", "양식", "분식"]
+                    if not any(food_cat in category for food_cat in food_categories):
+                        continue
+                        
+                    return {
+                        "name": place_name,
+                        "address": clean_address(address),
+                        "latitude": float(place.get("y", 0)),
+                        "longitude": float(place.get("x", 0))
+                    }
         
         return None
         